@@ -1,6 +1,6 @@
 import json
-from .utils import load_config
-from .crypto_utils import TokenCrypto
+from .utils import get_config_keys
+from .config_resolver import get_prompt_context
 
 class Rei3KeyGroupLoader:
     """
@@ -13,17 +13,8 @@ class Rei3KeyGroupLoader:
     def INPUT_TYPES(cls):
         # 获取所有 3KeyGroup 类型的配置键
         try:
-            # 加载配置数据
-            config_data = load_config()
-            
-            # 从配置对象中提取 3KeyGroup 类型的键
-            group_keys = []
-            for key, config_obj in config_data.items():
-                if isinstance(config_obj, dict):
-                    # 新格式：检查配置对象的类型
-                    if config_obj.get("type") == "3KeyGroup":
-                        group_keys.append(key)
-                # 对于旧格式，暂时跳过，因为无法确定类型
+            # 从按类型维护的索引中获取 3KeyGroup 类型的键（旧格式的配置没有类型，不会出现）
+            group_keys = get_config_keys(config_type="3KeyGroup")
             
             if not group_keys:
                 group_keys = ["-- 没有 3KeyGroup 配置 --"]
@@ -58,16 +49,16 @@ class Rei3KeyGroupLoader:
             # 获取可选的密码参数
             password = kwargs.get("password (可选)", "").strip()
             
-            # 获取配置数据
-            config_data = load_config()
+            # 获取配置数据（同一个 prompt 中的节点共用一份配置快照和解密结果）
+            context = get_prompt_context()
+            group_config = context.get_entry(group_key)
             
-            if group_key not in config_data:
+            if group_config is None:
                 error_msg = f"ERROR: 配置键 '{group_key}' 不存在"
                 print(f"[Rei3KeyGroupLoader] {error_msg}")
                 return (error_msg, "", "")
             
             # 解析 3KeyGroup 数据
-            group_config = config_data[group_key]
             
             # 处理新的对象格式
             if isinstance(group_config, dict):
@@ -89,40 +80,50 @@ class Rei3KeyGroupLoader:
             key3 = key_group.get('key3')
             
             # 获取值并转换为字符串（支持解密）
-            def get_config_value(key):
+            # 一次读取三个键，解析出所有值后再并行解密其中加密的部分
+            keys = [key1, key2, key3]
+            config_data = context.get_entries([key for key in keys if key])
+            values = []
+            pending = []  # (位置, 键, 加密数据)
+            for index, key in enumerate(keys):
                 if not key:
-                    return ""
+                    values.append("")
+                    continue
                     
                 config_obj = config_data.get(key)
                 if config_obj is None:
-                    return f"ERROR: 键 '{key}' 不存在"
+                    values.append(f"ERROR: 键 '{key}' 不存在")
+                    continue
                 
                 if isinstance(config_obj, dict):
                     # 新格式：从对象中提取值和加密信息
                     value = config_obj.get("value", "")
                     is_encrypted = config_obj.get("encrypted", False)
                     
-                    # 如果配置是加密的，尝试解密
+                    # 如果配置是加密的，稍后统一解密
                     if is_encrypted:
                         if not password:
-                            return f"ERROR: 键 '{key}' 已加密，需要密码"
-                        
-                        try:
-                            # 使用密码解密
-                            decrypted_value = TokenCrypto.decrypt_token(value, password)
-                            return str(decrypted_value)
-                        except Exception as e:
-                            return f"ERROR: 解密键 '{key}' 失败 - {str(e)}"
+                            values.append(f"ERROR: 键 '{key}' 已加密，需要密码")
+                        else:
+                            values.append(None)
+                            pending.append((index, key, value))
                     else:
                         # 未加密的配置直接返回
-                        return str(value)
+                        values.append(str(value))
                 else:
                     # 兼容旧格式：直接使用值
-                    return str(config_obj)
+                    values.append(str(config_obj))
+            
+            if pending:
+                # 使用密码并行解密（本次 prompt 中已解密过的值直接复用）
+                results = context.decrypt([value for _, _, value in pending], password)
+                for (index, key, _), result in zip(pending, results):
+                    if isinstance(result, Exception):
+                        values[index] = f"ERROR: 解密键 '{key}' 失败 - {str(result)}"
+                    else:
+                        values[index] = str(result)
             
-            value1 = get_config_value(key1)
-            value2 = get_config_value(key2)
-            value3 = get_config_value(key3)
+            value1, value2, value3 = values
             
             print(f"[Rei3KeyGroupLoader] 加载 3KeyGroup '{group_key}': {key1}={value1}, {key2}={value2}, {key3}={value3}")
             
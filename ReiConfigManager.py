@@ -1,5 +1,5 @@
 import json
-from .utils import get_config_path, load_config, save_config
+from .utils import get_config_snapshot, modify_config, build_config_entry
 
 class ReiConfigManager:
     """
@@ -30,7 +30,7 @@ class ReiConfigManager:
         try:
             if action == "get_all":
                 # 获取所有配置
-                config_data = load_config()
+                config_data = get_config_snapshot()
                 result = json.dumps(config_data, ensure_ascii=False, indent=2)
                 return {"ui": {"text": [f"当前配置:\n{result}"]}, "result": (result,)}
             
@@ -46,10 +46,11 @@ class ReiConfigManager:
                     error_msg = f"错误: 无法将 '{value}' 转换为 {value_type} 类型"
                     return {"ui": {"text": [error_msg]}, "result": (error_msg,)}
                 
-                # 保存配置
-                config_data = load_config()
-                config_data[key] = converted_value
-                save_config(config_data)
+                # 在写锁内读取最新配置后写入，保留创建时间并递增修改版本号
+                def apply(configs):
+                    previous = configs.get(key)
+                    configs[key] = build_config_entry(converted_value, value_type, False, previous)
+                modify_config(apply)
                 
                 success_msg = f"成功{'添加' if action == 'add' else '更新'}配置: {key} = {converted_value}"
                 return {"ui": {"text": [success_msg]}, "result": (success_msg,)}
@@ -60,10 +61,12 @@ class ReiConfigManager:
                     error_msg = "错误: 键名不能为空"
                     return {"ui": {"text": [error_msg]}, "result": (error_msg,)}
                 
-                config_data = load_config()
-                if key in config_data:
-                    del config_data[key]
-                    save_config(config_data)
+                def apply(configs):
+                    if key not in configs:
+                        return False
+                    del configs[key]
+                    return True
+                if modify_config(apply):
                     success_msg = f"成功删除配置: {key}"
                     return {"ui": {"text": [success_msg]}, "result": (success_msg,)}
                 else:
@@ -1,5 +1,5 @@
-from .utils import load_config
-from .crypto_utils import TokenCrypto
+from .utils import get_config_keys
+from .config_resolver import get_prompt_context
 
 
 
@@ -12,8 +12,7 @@ class ReiConfigLoader:
     
     @classmethod
     def INPUT_TYPES(s):
-        config = load_config()
-        config_keys = list(config.keys())
+        config_keys = get_config_keys()
         
         if not config_keys:
             config_keys = ["N/A (请检查 env_config.json)"]
@@ -47,12 +46,11 @@ class ReiConfigLoader:
         # 获取可选的密码参数
         password = kwargs.get("password (可选)", "").strip()
         
-        # 在这里再次加载配置，以确保能获取到最新的值，
+        # 在这里再次读取配置，以确保能获取到最新的值，
         # 以防用户在 ComfyUI 启动后编辑了文件。
-        config = load_config()
-        
-        # 获取所选键对应的配置对象
-        config_obj = config.get(config_key)
+        # 同一个 prompt 中的节点共用一份配置快照和解密结果。
+        context = get_prompt_context()
+        config_obj = context.get_entry(config_key)
         if config_obj is None:
             return (f"ERROR: 配置键 '{config_key}' 不存在",)
         
@@ -69,7 +67,7 @@ class ReiConfigLoader:
                 
                 try:
                     # 使用密码解密
-                    decrypted_value = TokenCrypto.decrypt_token(value, password)
+                    decrypted_value = context.decrypt_one(value, password)
                     return (str(decrypted_value),)
                 except Exception as e:
                     return (f"ERROR: 解密失败 - {str(e)}",)
@@ -1,6 +1,7 @@
 import os
 import glob
 from typing import Dict, List, Tuple
+from .extension_index import get_extension_index
 
 class ReiFileCounter:
     """
@@ -76,20 +77,9 @@ class ReiFileCounter:
             return (0, "[]", "[]")
         
         try:
-            # 获取目录下所有文件
-            all_files = []
-            for root, dirs, files in os.walk(directory_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    all_files.append(file_path)
-            
-            # 统计所有文件后缀
-            extension_count = {}
-            for file_path in all_files:
-                _, ext = os.path.splitext(file_path)
-                ext = ext.lower().lstrip('.')  # 移除点号并转为小写
-                if ext:  # 只统计有后缀的文件
-                    extension_count[ext] = extension_count.get(ext, 0) + 1
+            # 使用增量后缀索引，只重新扫描发生变化的目录
+            index = get_extension_index(directory_path)
+            total_files, extension_count = index.summary()
             
             # 生成可用后缀列表（按数量排序）
             available_extensions = sorted(extension_count.keys(), 
@@ -104,19 +94,14 @@ class ReiFileCounter:
                 target_ext = file_extension.strip().lower().lstrip('.')
                 
                 # 查找匹配的文件
-                for file_path in all_files:
-                    _, ext = os.path.splitext(file_path)
-                    ext = ext.lower().lstrip('.')
-                    
-                    if ext == target_ext:
-                        selected_files.append(file_path)
-                        file_count += 1
+                selected_files = index.files(target_ext)
+                file_count = len(selected_files)
                 
                 print(f"[ReiFileCounter] 在目录 {directory_path} 中找到 {file_count} 个 .{target_ext} 文件")
             else:
                 # 如果没有指定后缀，返回所有文件的数量
-                file_count = len(all_files)
-                selected_files = all_files
+                selected_files = index.files()
+                file_count = total_files
                 print(f"[ReiFileCounter] 目录 {directory_path} 中共有 {file_count} 个文件")
             
             # 返回结果
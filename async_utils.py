@@ -0,0 +1,124 @@
+"""
+阻塞任务执行工具
+将 API 路由中的文件系统等阻塞操作放到有界线程池中执行，避免阻塞 PromptServer 的事件循环
+"""
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# 线程池大小
+MAX_WORKERS = min(16, (os.cpu_count() or 1) + 4)
+
+# 每个路由同时运行的阻塞任务上限，未列出的路由使用 DEFAULT_ROUTE_LIMIT
+DEFAULT_ROUTE_LIMIT = 4
+ROUTE_LIMITS = {
+    'browse': 4,
+    'browse-system': 4,
+    'get-extensions': 2,
+    'child-counts': 8,
+    'presets': 4,
+    # 配置的批量修改会整体读写配置文件，需要串行执行
+    'config-write': 1,
+    # 批量更换密码会占满 CPU，同一时间只允许一个
+    'rekey': 1,
+}
+
+# 检查客户端是否断开连接的间隔（秒）
+DISCONNECT_POLL_INTERVAL = 0.25
+
+_executor = None
+_executor_lock = threading.Lock()
+_semaphores = {}
+
+
+class CancelToken(threading.Event):
+    """
+    阻塞任务的取消标记
+    客户端断开连接时会被置位，长时间运行的任务应定期检查 is_set()
+    """
+
+
+def get_executor():
+    """获取（必要时创建）共享线程池"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='rei-io')
+    return _executor
+
+
+def _get_semaphore(route):
+    loop = asyncio.get_running_loop()
+    key = (id(loop), route)
+    semaphore = _semaphores.get(key)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(ROUTE_LIMITS.get(route, DEFAULT_ROUTE_LIMIT))
+        _semaphores[key] = semaphore
+    return semaphore
+
+
+def is_disconnected(request):
+    """判断请求的客户端是否已经断开"""
+    transport = request.transport
+    return transport is None or transport.is_closing()
+
+
+async def _wait_or_disconnect(request, awaitable):
+    """等待 awaitable 完成，期间客户端断开则抛出 asyncio.CancelledError"""
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL)
+            if done:
+                return task.result()
+            if request is not None and is_disconnected(request):
+                raise asyncio.CancelledError()
+    except BaseException:
+        if not task.done():
+            task.cancel()
+        raise
+
+
+async def run_blocking(request, route, func, *args, **kwargs):
+    """
+    在共享线程池中执行阻塞函数
+
+    同一路由的并发数受 ROUTE_LIMITS 限制，超出时排队等待。
+    如果关键字参数中包含 cancel（CancelToken），客户端断开连接或处理协程被取消时
+    会将其置位，以便阻塞函数尽早退出。
+
+    Args:
+        request: aiohttp 请求对象，用于检测客户端断开；可以为 None
+        route: 路由名称，用于并发限制
+        func: 阻塞函数
+        *args, **kwargs: 传给 func 的参数
+
+    Returns:
+        func 的返回值
+
+    Raises:
+        asyncio.CancelledError: 客户端断开连接时抛出
+    """
+    cancel = kwargs.get('cancel')
+    loop = asyncio.get_running_loop()
+    semaphore = _get_semaphore(route)
+    try:
+        acquire = asyncio.ensure_future(semaphore.acquire())
+        try:
+            await _wait_or_disconnect(request, acquire)
+        except BaseException:
+            if acquire.done() and not acquire.cancelled():
+                semaphore.release()
+            raise
+
+        # 名额在线程中的任务真正结束后才释放，客户端断开不会让并发数超出上限
+        concurrent_future = get_executor().submit(func, *args, **kwargs)
+        concurrent_future.add_done_callback(
+            lambda _: loop.call_soon_threadsafe(semaphore.release))
+        return await _wait_or_disconnect(request, asyncio.wrap_future(concurrent_future))
+    except asyncio.CancelledError:
+        if cancel is not None:
+            cancel.set()
+        raise
@@ -0,0 +1,22 @@
+"""
+基准测试共用的模块加载
+插件模块使用包内相对导入，这里为插件目录注册一个临时包后按名称导入，
+不会执行插件的 __init__.py（其中会注册 ComfyUI 的节点和路由）。
+"""
+import importlib
+import os
+import sys
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PACKAGE = 'reitools_bench'
+
+
+def load_module(name):
+    """导入插件目录下的模块，例如 load_module('fs_utils')"""
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [ROOT]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f'{PACKAGE}.{name}')
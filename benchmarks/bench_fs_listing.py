@@ -0,0 +1,204 @@
+"""
+目录列表基准测试
+
+对比旧的 os.listdir + 逐项 stat/isdir/isfile/access 实现与 fs_utils 中
+基于 os.scandir 的列表引擎，输出每个条目的文件系统调用次数和耗时。
+
+用法:
+    python benchmarks/bench_fs_listing.py [目录] [--files N] [--dirs N]
+
+不指定目录时会在临时目录中生成测试数据。
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from _load import load_module
+
+fs_utils = load_module('fs_utils')
+
+
+class CallCounter:
+    """统计 os 层面会访问文件系统的调用次数"""
+
+    def __init__(self):
+        self.count = 0
+        self._patched = []
+
+    def _wrap(self, owner, name):
+        original = getattr(owner, name)
+
+        def wrapper(*args, **kwargs):
+            self.count += 1
+            return original(*args, **kwargs)
+
+        setattr(owner, name, wrapper)
+        self._patched.append((owner, name, original))
+
+    def _wrap_scandir(self):
+        original = os.scandir
+        counter = self
+
+        class EntryProxy:
+            def __init__(self, entry):
+                self._entry = entry
+                self._stat = None
+
+            def __getattr__(self, name):
+                return getattr(self._entry, name)
+
+            def stat(self, *, follow_symlinks=True):
+                # POSIX 上 DirEntry.stat 会发起一次 stat 并缓存结果
+                if self._stat is None:
+                    if os.name != 'nt':
+                        counter.count += 1
+                    self._stat = self._entry.stat(follow_symlinks=follow_symlinks)
+                return self._stat
+
+            def is_dir(self, *, follow_symlinks=True):
+                # 只有符号链接才需要额外的 stat，普通条目使用 d_type
+                if follow_symlinks and self._entry.is_symlink():
+                    counter.count += 1
+                return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+            def is_file(self, *, follow_symlinks=True):
+                if follow_symlinks and self._entry.is_symlink():
+                    counter.count += 1
+                return self._entry.is_file(follow_symlinks=follow_symlinks)
+
+        class ScandirProxy:
+            def __init__(self, path):
+                self._it = original(path)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self._it.close()
+
+            def __iter__(self):
+                for entry in self._it:
+                    yield EntryProxy(entry)
+
+        def scandir(path='.'):
+            counter.count += 1
+            return ScandirProxy(path)
+
+        os.scandir = scandir
+        self._patched.append((os, 'scandir', original))
+
+    def __enter__(self):
+        # os.path.isdir/isfile 内部调用 os.stat，因此只需包装 os 层函数
+        for name in ('stat', 'listdir', 'access'):
+            self._wrap(os, name)
+        self._wrap_scandir()
+        return self
+
+    def __exit__(self, *exc):
+        for owner, name, original in reversed(self._patched):
+            setattr(owner, name, original)
+        self._patched = []
+
+
+def legacy_listing(target_path):
+    """旧版 browse_filesystem 的目录遍历逻辑"""
+    items = []
+    stat_fn = os.stat
+    isdir = os.path.isdir
+    isfile = os.path.isfile
+    for item_name in os.listdir(target_path):
+        if item_name.startswith('.') or item_name.startswith('__pycache__'):
+            continue
+        item_path = os.path.join(target_path, item_name)
+        try:
+            item_stat = stat_fn(item_path)
+            item_info = {"name": item_name, "modified": item_stat.st_mtime,
+                         "is_readable": os.access(item_path, os.R_OK)}
+            if isdir(item_path):
+                try:
+                    sub_items = [x for x in os.listdir(item_path) if not x.startswith('.')]
+                    item_info["children_count"] = len(sub_items)
+                    for sub_item in sub_items[:10]:
+                        sub_path = os.path.join(item_path, sub_item)
+                        if isfile(sub_path):
+                            pass
+                        elif isdir(sub_path):
+                            pass
+                except OSError:
+                    pass
+                item_info["is_writable"] = os.access(item_path, os.W_OK)
+            elif isfile(item_path):
+                item_info["size"] = item_stat.st_size
+                item_info["is_writable"] = os.access(item_path, os.W_OK)
+            items.append(item_info)
+        except OSError:
+            continue
+    return items
+
+
+def engine_listing(target_path):
+    """fs_utils 列表引擎（与 server._list_browse_items 相同的调用模式）"""
+    import stat
+    access = fs_utils.get_access_checker()
+    items = []
+    for entry, item_stat in fs_utils.scan_directory(target_path, skip_hidden=True, skip_prefixes=('__pycache__',)):
+        item_info = {"name": entry.name, "modified": item_stat.st_mtime,
+                     "is_readable": access(item_stat, os.R_OK)}
+        if stat.S_ISDIR(item_stat.st_mode):
+            item_info["children_count"] = fs_utils.count_children(entry.path, skip_hidden=True, sample=10)[0]
+            item_info["is_writable"] = access(item_stat, os.W_OK)
+        elif stat.S_ISREG(item_stat.st_mode):
+            item_info["size"] = item_stat.st_size
+            item_info["is_writable"] = access(item_stat, os.W_OK)
+        items.append(item_info)
+    return items
+
+
+def make_tree(root, files, dirs):
+    for i in range(files):
+        with open(os.path.join(root, f'image_{i:06d}.png'), 'wb'):
+            pass
+    for i in range(dirs):
+        sub = os.path.join(root, f'dir_{i:04d}')
+        os.mkdir(sub)
+        for j in range(20):
+            with open(os.path.join(sub, f'file_{j}.txt'), 'wb'):
+                pass
+
+
+def run(name, fn, path):
+    with CallCounter() as counter:
+        items = fn(path)
+    start = time.perf_counter()
+    fn(path)
+    elapsed = time.perf_counter() - start
+    per_entry = counter.count / max(len(items), 1)
+    print(f'{name:<8} entries={len(items):<7} fs_calls={counter.count:<8} '
+          f'per_entry={per_entry:6.2f} time={elapsed * 1000:8.1f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', nargs='?')
+    parser.add_argument('--files', type=int, default=20000)
+    parser.add_argument('--dirs', type=int, default=200)
+    args = parser.parse_args()
+
+    tmp = None
+    path = args.path
+    if not path:
+        tmp = tempfile.mkdtemp(prefix='rei_bench_')
+        make_tree(tmp, args.files, args.dirs)
+        path = tmp
+    try:
+        run('legacy', legacy_listing, path)
+        run('scandir', engine_listing, path)
+    finally:
+        if tmp:
+            shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    main()
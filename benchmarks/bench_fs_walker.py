@@ -0,0 +1,75 @@
+"""
+并行目录树遍历基准测试
+
+对比 os.walk 与 fs_walker.walk_tree 在 1/4/16 个线程下的耗时。
+本地磁盘上目录扫描几乎不受延迟影响，可以用 --latency-ms 为每个目录的扫描
+增加固定延迟，模拟 NFS 等网络存储。
+
+用法:
+    python benchmarks/bench_fs_walker.py [目录] [--dirs N] [--files N] [--latency-ms N]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from _load import load_module
+
+fs_walker = load_module('fs_walker')
+
+
+def make_tree(root, dirs, files):
+    for i in range(dirs):
+        sub = os.path.join(root, f'group_{i % 20:02d}', f'dir_{i:04d}')
+        os.makedirs(sub)
+        for j in range(files):
+            with open(os.path.join(sub, f'image_{j:04d}.png'), 'wb'):
+                pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', nargs='?')
+    parser.add_argument('--dirs', type=int, default=400)
+    parser.add_argument('--files', type=int, default=50)
+    parser.add_argument('--latency-ms', type=float, default=2.0)
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+
+    def slow_scan(rel, path, st):
+        if latency:
+            time.sleep(latency)
+        return fs_walker.scan_entries(rel, path, st)
+
+    tmp = None
+    path = args.path
+    if not path:
+        tmp = tempfile.mkdtemp(prefix='rei_bench_')
+        make_tree(tmp, args.dirs, args.files)
+        path = tmp
+    try:
+        start = time.perf_counter()
+        walk_files = 0
+        for _, _, files in os.walk(path):
+            if latency:
+                time.sleep(latency)
+            walk_files += len(files)
+        baseline = time.perf_counter() - start
+        print(f'os.walk      files={walk_files:<8} time={baseline * 1000:8.1f} ms')
+
+        for workers in (1, 4, 16):
+            start = time.perf_counter()
+            results = fs_walker.walk_tree(path, slow_scan, workers=workers, exclude=())
+            elapsed = time.perf_counter() - start
+            files = sum(len(payload['files']) for _, payload in results)
+            print(f'workers={workers:<4} files={files:<8} time={elapsed * 1000:8.1f} ms '
+                  f'speedup={baseline / elapsed:5.2f}x')
+    finally:
+        if tmp:
+            shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    main()
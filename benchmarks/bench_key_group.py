@@ -0,0 +1,51 @@
+"""
+三键组合解密基准测试
+
+对比逐个解密与 crypto_utils.decrypt_tokens 并行解密 1~3 个加密键的耗时。
+测试时关闭密钥缓存，每个值使用独立的随机盐，因此每次解密都需要完整的 PBKDF2 派生。
+
+用法:
+    python benchmarks/bench_key_group.py [--rounds N]
+"""
+import argparse
+import time
+
+from _load import load_module
+
+crypto_utils = load_module('crypto_utils')
+
+
+def measure(func, rounds):
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    crypto_utils.key_cache.configure(enabled=False)
+    password = 'benchmark-password'
+    tokens = [
+        crypto_utils.TokenCrypto.encrypt_token(f'secret-{i}', password, version=1)
+        for i in range(3)
+    ]
+
+    print(f'{"键数":>4}  {"逐个解密 (ms)":>14}  {"并行解密 (ms)":>14}  {"加速比":>6}')
+    for count in range(1, 4):
+        batch = tokens[:count]
+        sequential = measure(
+            lambda: [crypto_utils.TokenCrypto.decrypt_token(token, password) for token in batch],
+            args.rounds)
+        parallel = measure(lambda: crypto_utils.decrypt_tokens(batch, password), args.rounds)
+        print(f'{count:>4}  {sequential:>14.1f}  {parallel:>14.1f}  {sequential / parallel:>6.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+配置和预设的变更通知
+将短时间内的多次变更合并后，通过 ComfyUI 的 websocket（PromptServer.send_sync）推送给所有客户端
+"""
+import threading
+import time
+from collections import OrderedDict
+
+# 合并变更的时间窗口（秒）
+COALESCE_SECONDS = 0.1
+
+# 单个配置事件最多携带的键数量，超出时只通知客户端增量拉取
+MAX_EVENT_KEYS = 100
+
+CONFIG_EVENT = 'rei.config.changed'
+PRESETS_EVENT = 'rei.presets.changed'
+
+
+class ChangeNotifier:
+    """
+    变更事件的合并与推送
+
+    配置事件:
+        {"since": 合并前的版本, "version": 最新版本, "values": {...}, "types": {...}, "deleted": [...]}
+        键数量超过 MAX_EVENT_KEYS 时为 {"since", "version", "resync": true}，
+        客户端应使用 /api/rei/config/snapshot?since= 拉取
+    预设事件:
+        {"version": 最新版本, "changes": [{"name", "action": "saved"|"deleted", "version", "preset": 摘要}, ...]}
+        同一预设在时间窗口内只保留最后一次变更
+    """
+
+    def __init__(self, send, window=COALESCE_SECONDS):
+        """
+        Args:
+            send: 推送函数 send(event, data)，可能在任意线程中调用
+            window: 合并变更的时间窗口（秒）
+        """
+        self._send = send
+        self._window = window
+        self._lock = threading.Lock()
+        self._timer = None
+        self._config = None
+        self._presets = OrderedDict()
+        # 预设没有持久化的版本号，与配置版本一样以毫秒时间戳为起点
+        self._preset_version = time.time_ns() // 1_000_000
+
+    def config_changed(self, since, version, values, types, deleted):
+        """记录一次配置变更，values/types 为变化键的显示值和类型信息"""
+        with self._lock:
+            pending = self._config
+            if pending is None:
+                pending = self._config = {'since': since, 'values': {}, 'types': {}, 'deleted': set()}
+            pending['version'] = version
+            for key in deleted:
+                pending['values'].pop(key, None)
+                pending['types'].pop(key, None)
+                pending['deleted'].add(key)
+            for key, value in values.items():
+                pending['values'][key] = value
+                pending['types'][key] = types[key]
+                pending['deleted'].discard(key)
+            self._schedule()
+
+    def preset_changed(self, name, action, preset=None):
+        """记录一次预设变更，action 为 'saved' 或 'deleted'，preset 为预设摘要"""
+        with self._lock:
+            self._preset_version += 1
+            self._presets.pop(name, None)
+            self._presets[name] = {
+                'name': name,
+                'action': action,
+                'version': self._preset_version,
+                'preset': preset,
+            }
+            self._schedule()
+
+    def _schedule(self):
+        if self._timer is None:
+            self._timer = threading.Timer(self._window, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """立即推送所有待发送的事件"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            config, self._config = self._config, None
+            presets, self._presets = self._presets, OrderedDict()
+            preset_version = self._preset_version
+
+        try:
+            if config is not None:
+                if len(config['values']) + len(config['deleted']) > MAX_EVENT_KEYS:
+                    data = {'since': config['since'], 'version': config['version'], 'resync': True}
+                else:
+                    data = {
+                        'since': config['since'],
+                        'version': config['version'],
+                        'values': config['values'],
+                        'types': config['types'],
+                        'deleted': sorted(config['deleted']),
+                    }
+                self._send(CONFIG_EVENT, data)
+            if presets:
+                self._send(PRESETS_EVENT, {'version': preset_version, 'changes': list(presets.values())})
+        except Exception as e:
+            print(f"[ReiTools] 推送变更事件失败: {e}")
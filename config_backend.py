@@ -0,0 +1,210 @@
+"""
+配置存储后端
+默认使用 env_config.json；设置环境变量 REI_CONFIG_BACKEND=sqlite 时使用 env_config.sqlite
+（WAL 模式，每个键一行，按键读写只涉及对应的行）
+"""
+import json
+import os
+import shutil
+import sqlite3
+import threading
+
+# 选择存储后端的环境变量，取值为 json（默认）或 sqlite
+BACKEND_ENV = 'REI_CONFIG_BACKEND'
+
+
+def write_json_atomic(path, data, **dump_options):
+    """
+    原子地写入 JSON 文件
+    先写入同目录下的临时文件并 fsync，再用 os.replace 替换目标文件，
+    读取方不会看到写了一半的文件。已有文件的权限位会被保留。
+    """
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, **dump_options)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            shutil.copymode(path, tmp_path)
+        except OSError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class JsonConfigBackend:
+    """env_config.json 后端：整个配置是一个 JSON 文档，每次写入都会重写整个文件"""
+
+    name = 'json'
+    # 不支持按键读取，读取单个键也需要解析整个文件
+    point_reads = False
+
+    def __init__(self, path):
+        self.path = path
+
+    def signature(self):
+        """文件的 (mtime_ns, size, inode)，文件不存在时为 None"""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def read_all(self):
+        """
+        读取全部配置，文件不存在时返回空字典
+
+        Raises:
+            ValueError: 文件格式错误时抛出
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        if not isinstance(data, dict):
+            raise ValueError(f"{self.path} 的内容不是 JSON 对象")
+        return data
+
+    def read_keys(self, keys):
+        data = self.read_all()
+        return {key: data[key] for key in keys if key in data}
+
+    def write(self, data, changed, deleted):
+        """写入配置：data 为完整配置，changed/deleted 为变化和删除的键"""
+        # indent=4 让 JSON 文件格式化，易于阅读
+        # ensure_ascii=False 确保中文字符能正确写入
+        write_json_atomic(self.path, data, indent=4, ensure_ascii=False)
+
+
+class SqliteConfigBackend:
+    """
+    SQLite 后端：每个配置键一行，按类型和更新时间建立索引
+
+    configs 表中 data 列保存配置项的 JSON，type/encrypted/updated_at 列冗余保存
+    用于索引查询。meta 表中的 generation 在每次写入事务中递增，
+    用作缓存校验的签名（各连接读到的值一致，可以在线程和进程间比较）。
+    """
+
+    name = 'sqlite'
+    point_reads = True
+
+    SCHEMA = (
+        '''CREATE TABLE IF NOT EXISTS configs (
+            key TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            type TEXT NOT NULL DEFAULT 'string',
+            encrypted INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT NOT NULL DEFAULT ''
+        )''',
+        'CREATE INDEX IF NOT EXISTS idx_configs_type ON configs (type)',
+        'CREATE INDEX IF NOT EXISTS idx_configs_updated_at ON configs (updated_at)',
+        'CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)',
+        "INSERT OR IGNORE INTO meta (name, value) VALUES ('generation', '0')",
+    )
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        conn = self._connect()
+        # WAL 模式是持久的，只需设置一次；读取不会被写入阻塞
+        conn.execute('PRAGMA journal_mode=WAL')
+        with conn:
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+
+    def _connect(self):
+        """每个线程使用自己的连接"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def signature(self):
+        row = self._connect().execute("SELECT value FROM meta WHERE name = 'generation'").fetchone()
+        return int(row[0]) if row else 0
+
+    def read_all(self):
+        rows = self._connect().execute('SELECT key, data FROM configs')
+        return {key: json.loads(data) for key, data in rows}
+
+    def read_keys(self, keys):
+        """按键读取配置项（走主键索引），不存在的键不出现在结果中"""
+        keys = list(dict.fromkeys(keys))
+        result = {}
+        conn = self._connect()
+        # SQLite 默认最多 999 个绑定参数
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ', '.join('?' * len(chunk))
+            rows = conn.execute(f'SELECT key, data FROM configs WHERE key IN ({placeholders})', chunk)
+            result.update((key, json.loads(data)) for key, data in rows)
+        return result
+
+    @staticmethod
+    def _row(key, config_obj):
+        if isinstance(config_obj, dict):
+            return (
+                key,
+                json.dumps(config_obj, ensure_ascii=False),
+                str(config_obj.get('type', 'string')),
+                1 if config_obj.get('encrypted', False) else 0,
+                str(config_obj.get('updated_at', '')),
+            )
+        # 兼容旧格式
+        return (key, json.dumps(config_obj, ensure_ascii=False), 'string', 0, '')
+
+    def write(self, data, changed, deleted):
+        """在一个事务中只写入变化和删除的行"""
+        conn = self._connect()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.executemany(
+                'INSERT OR REPLACE INTO configs (key, data, type, encrypted, updated_at) VALUES (?, ?, ?, ?, ?)',
+                [self._row(key, data[key]) for key in changed]
+            )
+            conn.executemany('DELETE FROM configs WHERE key = ?', [(key,) for key in deleted])
+            conn.execute("UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE name = 'generation'")
+
+    def is_empty(self):
+        return self._connect().execute('SELECT 1 FROM configs LIMIT 1').fetchone() is None
+
+    def get_meta(self, name):
+        row = self._connect().execute('SELECT value FROM meta WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, name, value):
+        conn = self._connect()
+        with conn:
+            conn.execute('INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)', (name, str(value)))
+
+
+def migrate_json_to_sqlite(json_backend, sqlite_backend):
+    """
+    一次性将 env_config.json 迁移到 SQLite
+
+    只在 SQLite 中还没有任何配置、且从未迁移过时执行。迁移后 JSON 文件被重命名为
+    env_config.json.migrated，避免继续手动编辑一个已不再读取的文件
+    （需要手动编辑时可以通过导出接口重新生成 JSON）。
+
+    Returns:
+        迁移的配置数量，没有执行迁移时返回 0
+    """
+    if sqlite_backend.get_meta('migrated_from') is not None or not sqlite_backend.is_empty():
+        return 0
+    if json_backend.signature() is None:
+        return 0
+    data = json_backend.read_all()
+    sqlite_backend.write(data, list(data), [])
+    sqlite_backend.set_meta('migrated_from', json_backend.path)
+    os.replace(json_backend.path, json_backend.path + '.migrated')
+    print(f"[ConfigManager] 已将 {len(data)} 个配置从 {json_backend.path} 迁移到 {sqlite_backend.path}")
+    return len(data)
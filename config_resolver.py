@@ -0,0 +1,208 @@
+"""
+按 prompt 共享的配置解析缓存
+同一次 prompt 执行中的所有配置节点共用读取到的配置项和解密结果，
+工作流中多处引用同一个加密配置时只解密一次。
+prompt 执行结束时（ComfyUI 发送 node 为 None 的 executing 事件）缓存（包括解密后的明文）会被丢弃；
+未能收到结束事件时，空闲超过 PROMPT_CONTEXT_IDLE_SECONDS 后丢弃。
+"""
+import hashlib
+import threading
+import time
+
+from .utils import get_config_entries
+from .crypto_utils import decrypt_tokens
+
+# prompt 上下文的最长空闲时间（秒），未收到执行结束事件时超时后丢弃缓存的明文
+PROMPT_CONTEXT_IDLE_SECONDS = 30
+
+# 表示 prompt 执行结束的事件
+_EXECUTION_END_EVENTS = ('execution_success', 'execution_error', 'execution_interrupted')
+
+# 通过 execution_start 事件记录的正在执行的 prompt id（旧版本 ComfyUI 没有执行上下文时使用）
+_executing_prompt_id = None
+
+
+def current_prompt_id():
+    """
+    获取正在执行的 prompt id，不在执行中或无法获取时返回 None
+    优先使用 ComfyUI 的执行上下文，旧版本 ComfyUI 使用 execution_start 事件中的 prompt id
+    （PromptServer.last_prompt_id 是最后加入队列的 prompt，不一定是正在执行的 prompt）
+    """
+    try:
+        from comfy_execution.utils import get_executing_context
+        context = get_executing_context()
+        if context is not None and context.prompt_id:
+            return context.prompt_id
+    except ImportError:
+        pass
+    return _executing_prompt_id
+
+
+class PromptConfigContext:
+    """
+    一次 prompt 执行中的配置解析上下文
+
+    每个配置项在第一次读取时通过 get_config_entries 按键读取（SQLite 后端只读取对应的行），
+    之后同一个 prompt 中的所有节点看到的是同一份配置项；
+    解密结果按 (加密数据, 密码摘要) 缓存，解密失败的结果同样会被缓存。
+    """
+
+    def __init__(self, prompt_id=None):
+        self.prompt_id = prompt_id
+        self.last_used = time.monotonic()
+        self._lock = threading.Lock()
+        # {键: 配置项}，不存在的键记为 None
+        self._entries = {}
+        self._decrypted = {}
+
+    def get_entry(self, key):
+        """读取单个配置项，不存在时返回 None"""
+        return self.get_entries([key]).get(key)
+
+    def get_entries(self, keys):
+        """读取多个配置项，返回 {键: 配置项}，不存在的键不出现在结果中"""
+        with self._lock:
+            missing = [key for key in dict.fromkeys(keys) if key not in self._entries]
+        if missing:
+            entries = get_config_entries(missing)
+            with self._lock:
+                for key in missing:
+                    # 并发读取时保留先读到的结果，保证同一 prompt 中看到的配置一致
+                    self._entries.setdefault(key, entries.get(key))
+        with self._lock:
+            return {key: self._entries[key] for key in keys if self._entries[key] is not None}
+
+    def decrypt(self, encrypted_texts, password):
+        """
+        解密多个值，已解密过的直接返回缓存结果，其余的并行解密
+
+        Returns:
+            与输入顺序一致的列表，元素为明文字符串，解密失败的位置为异常对象
+        """
+        password_digest = hashlib.sha256(password.encode('utf-8')).digest()
+        cache_keys = [(text, password_digest) for text in encrypted_texts]
+        with self._lock:
+            missing = list(dict.fromkeys(
+                cache_key for cache_key in cache_keys if cache_key not in self._decrypted))
+        if missing:
+            results = decrypt_tokens([text for text, _ in missing], password)
+            with self._lock:
+                self._decrypted.update(zip(missing, results))
+        with self._lock:
+            return [self._decrypted[cache_key] for cache_key in cache_keys]
+
+    def decrypt_one(self, encrypted_text, password):
+        """
+        解密单个值
+
+        Raises:
+            Exception: 解密失败时抛出
+        """
+        result = self.decrypt([encrypted_text], password)[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+_lock = threading.Lock()
+_context = None
+_timer = None
+
+
+def get_prompt_context(prompt_id=None):
+    """
+    获取当前 prompt 的配置解析上下文
+
+    ComfyUI 同一时间只执行一个 prompt，因此只保留一个上下文：prompt id 变化时丢弃旧的上下文。
+    无法确定 prompt id 时（例如不在执行中）返回一个不共享的新上下文。
+
+    Args:
+        prompt_id: prompt id，默认为正在执行的 prompt
+    """
+    global _context
+    if prompt_id is None:
+        prompt_id = current_prompt_id()
+    if prompt_id is None:
+        return PromptConfigContext()
+    with _lock:
+        if _context is None or _context.prompt_id != prompt_id:
+            _context = PromptConfigContext(prompt_id)
+            _schedule_expiry(PROMPT_CONTEXT_IDLE_SECONDS)
+        _context.last_used = time.monotonic()
+        return _context
+
+
+def release_prompt_context(prompt_id=None):
+    """丢弃指定 prompt（默认为任意 prompt）的上下文"""
+    global _context
+    with _lock:
+        if _context is not None and (prompt_id is None or _context.prompt_id == prompt_id):
+            _context = None
+
+
+def _schedule_expiry(delay):
+    """安排空闲检查（调用方需持有 _lock）"""
+    global _timer
+    if _timer is not None:
+        _timer.cancel()
+    _timer = threading.Timer(delay, _expire_idle)
+    _timer.daemon = True
+    _timer.start()
+
+
+def _expire_idle():
+    global _context, _timer
+    with _lock:
+        _timer = None
+        if _context is None:
+            return
+        idle = time.monotonic() - _context.last_used
+        if idle >= PROMPT_CONTEXT_IDLE_SECONDS:
+            _context = None
+        else:
+            _schedule_expiry(PROMPT_CONTEXT_IDLE_SECONDS - idle)
+
+
+def _on_execution_event(event, data):
+    """根据 ComfyUI 的执行事件记录正在执行的 prompt，并在执行结束时丢弃其上下文"""
+    global _executing_prompt_id
+    if not isinstance(data, dict):
+        return
+    prompt_id = data.get('prompt_id')
+    if event == 'execution_start':
+        _executing_prompt_id = prompt_id
+    elif (event == 'executing' and data.get('node') is None) or event in _EXECUTION_END_EVENTS:
+        release_prompt_context(prompt_id)
+        if prompt_id is None or _executing_prompt_id == prompt_id:
+            _executing_prompt_id = None
+
+
+def install_execution_hook():
+    """
+    包装 PromptServer.send_sync 以接收执行事件（ComfyUI 没有提供执行结束的回调）
+
+    Returns:
+        是否已安装
+    """
+    try:
+        from server import PromptServer
+        instance = PromptServer.instance
+        original = instance.send_sync
+    except (ImportError, AttributeError):
+        return False
+    if getattr(original, '_rei_execution_hook', False):
+        return True
+
+    def send_sync(event, data, *args, **kwargs):
+        try:
+            _on_execution_event(event, data)
+        except Exception as e:
+            print(f"[ReiTools] 处理执行事件 {event} 失败: {e}")
+        return original(event, data, *args, **kwargs)
+
+    send_sync._rei_execution_hook = True
+    instance.send_sync = send_sync
+    return True
+
+
+install_execution_hook()
@@ -1,10 +1,136 @@
 import base64
 import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.backends import default_backend
 import os
+import struct
+
+
+# PBKDF2 迭代次数（与前端保持一致，v1 格式固定使用该值）
+PBKDF2_ITERATIONS = 100000
+
+# calibrate_iterations 返回的最大迭代次数
+CALIBRATION_MAX_ITERATIONS = 10_000_000
+
+# v2 数据允许的最大迭代次数，超过时视为格式错误，避免构造的数据让解密长时间占用 CPU
+MAX_ITERATIONS = 10 * CALIBRATION_MAX_ITERATIONS
+
+# v2 加密格式的前缀（':' 不在 base64 字符集中，可以与 v1 数据区分）
+V2_PREFIX = 'rei:v2:'
+
+
+class DerivedKeyCache:
+    """
+    PBKDF2 派生密钥的内存缓存
+
+    以 (salt, 迭代次数, 密码摘要) 为键，密码摘要使用进程内随机密钥的 HMAC，
+    内存中不保存密码本身。条目超过 ttl 秒或超出容量时被淘汰，淘汰时会将密钥清零。
+    """
+
+    def __init__(self, max_entries=64, ttl=600.0, enabled=True):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.enabled = enabled
+        self._secret = os.urandom(32)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def _cache_key(self, password_data, salt, iterations):
+        digest = hmac.new(self._secret, password_data, hashlib.sha256).digest()
+        return (bytes(salt), iterations, digest)
+
+    @staticmethod
+    def _wipe(key):
+        for i in range(len(key)):
+            key[i] = 0
+
+    def _evict(self, cache_key):
+        entry = self._entries.pop(cache_key, None)
+        if entry is not None:
+            self._wipe(entry[0])
+
+    def get(self, password_data, salt, iterations):
+        """返回缓存密钥的副本，未命中或已过期时返回 None"""
+        if not self.enabled:
+            return None
+        cache_key = self._cache_key(password_data, salt, iterations)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            key, expires_at = entry
+            if time.monotonic() >= expires_at:
+                self._evict(cache_key)
+                return None
+            self._entries.move_to_end(cache_key)
+            # 返回副本，避免条目被淘汰清零时影响正在使用该密钥的调用方
+            return bytes(key)
+
+    def put(self, password_data, salt, iterations, key):
+        """缓存派生出的密钥"""
+        if not self.enabled:
+            return
+        cache_key = self._cache_key(password_data, salt, iterations)
+        with self._lock:
+            self._evict(cache_key)
+            self._entries[cache_key] = (bytearray(key), time.monotonic() + self.ttl)
+            while len(self._entries) > self.max_entries:
+                self._evict(next(iter(self._entries)))
+
+    def get_or_derive(self, password_data, salt, iterations, derive):
+        """
+        返回缓存的密钥，未命中时调用 derive() 派生并缓存
+
+        多个线程同时请求同一个密钥时只派生一次，其余线程等待结果。
+        """
+        key = self.get(password_data, salt, iterations)
+        if key is not None or not self.enabled:
+            return key if key is not None else derive()
+        cache_key = self._cache_key(password_data, salt, iterations)
+        with self._lock:
+            inflight = self._inflight.setdefault(cache_key, threading.Lock())
+        with inflight:
+            key = self.get(password_data, salt, iterations)
+            if key is None:
+                key = derive()
+                self.put(password_data, salt, iterations, key)
+        with self._lock:
+            if self._inflight.get(cache_key) is inflight:
+                del self._inflight[cache_key]
+        return key
+
+    def clear(self):
+        """清空缓存并将所有密钥清零"""
+        with self._lock:
+            for cache_key in list(self._entries):
+                self._evict(cache_key)
+
+    def configure(self, enabled=None, max_entries=None, ttl=None):
+        """调整缓存设置，关闭缓存时会立即清空"""
+        if enabled is not None:
+            self.enabled = enabled
+        if max_entries is not None:
+            self.max_entries = max_entries
+        if ttl is not None:
+            self.ttl = ttl
+        if not self.enabled:
+            self.clear()
+        else:
+            with self._lock:
+                while len(self._entries) > self.max_entries:
+                    self._evict(next(iter(self._entries)))
+
+
+# 设置环境变量 REI_KEY_CACHE=0 可关闭派生密钥缓存
+key_cache = DerivedKeyCache(enabled=os.environ.get('REI_KEY_CACHE', '1') != '0')
 
 
 class TokenCrypto:
@@ -14,16 +140,50 @@ class TokenCrypto:
     """
     
     @staticmethod
-    def encrypt_token(text: str, password: str) -> str:
+    def _derive_key(password_data: bytes, salt: bytes, iterations: int = PBKDF2_ITERATIONS,
+                    cache: bool = True):
+        """
+        使用 PBKDF2 派生 AES 密钥，cache 为 True 时结果会被缓存（见 key_cache）
+        """
+        def derive():
+            kdf = PBKDF2HMAC(
+                algorithm=hashes.SHA256(),
+                length=32,  # 256 bits key
+                salt=salt,
+                iterations=iterations,
+                backend=default_backend()
+            )
+            return kdf.derive(password_data)
+        if not cache:
+            return derive()
+        return key_cache.get_or_derive(password_data, salt, iterations, derive)
+    
+    @staticmethod
+    def _pack_v2_header(salt: bytes, iterations: int) -> bytes:
+        """v2 头部：迭代次数 (uint32 大端) + 盐长度 (1 byte) + 盐"""
+        if not 0 < len(salt) < 256:
+            raise ValueError("盐长度必须在 1-255 字节之间")
+        return struct.pack('>IB', iterations, len(salt)) + salt
+    
+    @staticmethod
+    def encrypt_token(text: str, password: str, salt: bytes = None,
+                      iterations: int = None, version: int = 2) -> str:
         """
         使用密码加密 token 文本
         
+        v2 格式为 "rei:v2:" + base64(迭代次数 + 盐长度 + 盐 + iv (12) + 密文)，
+        头部同时作为 AES-GCM 的附加认证数据。传入保险库盐（见 utils.get_vault_params）
+        时，同一密码加密的所有值共用一次密钥派生。
+        
         Args:
             text: 要加密的明文
             password: 加密密码
+            salt: 可选的盐（保险库盐），默认随机生成 16 字节
+            iterations: PBKDF2 迭代次数，默认 PBKDF2_ITERATIONS（仅 v2 可调）
+            version: 输出格式版本，1 为旧格式 salt (16) + iv (12) + 密文
             
         Returns:
-            base64 编码的加密数据
+            加密后的文本
             
         Raises:
             Exception: 加密失败时抛出异常
@@ -33,42 +193,76 @@ class TokenCrypto:
             data = text.encode('utf-8')
             password_data = password.encode('utf-8')
             
-            # 生成随机盐 (16 bytes)
-            salt = os.urandom(16)
+            # 生成随机盐 (16 bytes)；随机盐派生的密钥只用于本次加密，不写入缓存以免挤掉常用的密钥
+            random_salt = salt is None
+            if random_salt:
+                salt = os.urandom(16)
+            if iterations is None:
+                iterations = PBKDF2_ITERATIONS
+            if version == 1 and (len(salt) != 16 or iterations != PBKDF2_ITERATIONS):
+                raise ValueError("v1 格式只支持 16 字节盐和默认迭代次数")
+            if not 0 < iterations <= MAX_ITERATIONS:
+                raise ValueError(f"迭代次数必须在 1-{MAX_ITERATIONS} 之间")
             
             # 使用 PBKDF2 派生密钥
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,  # 256 bits key
-                salt=salt,
-                iterations=100000,
-                backend=default_backend()
-            )
-            key = kdf.derive(password_data)
+            key = TokenCrypto._derive_key(password_data, salt, iterations, cache=not random_salt)
             
             # 生成随机 IV (12 bytes for GCM)
             iv = os.urandom(12)
             
             # 使用 AES-GCM 加密
             aesgcm = AESGCM(key)
-            encrypted = aesgcm.encrypt(iv, data, None)
-            
-            # 组合：salt (16) + iv (12) + encrypted_data
-            result = salt + iv + encrypted
+            if version == 1:
+                encrypted = aesgcm.encrypt(iv, data, None)
+                # 组合：salt (16) + iv (12) + encrypted_data
+                return base64.b64encode(salt + iv + encrypted).decode('ascii')
             
-            # 转换为 base64
-            return base64.b64encode(result).decode('ascii')
+            header = TokenCrypto._pack_v2_header(salt, iterations)
+            encrypted = aesgcm.encrypt(iv, data, header)
+            return V2_PREFIX + base64.b64encode(header + iv + encrypted).decode('ascii')
             
         except Exception as e:
             raise Exception(f"Token 加密失败: {str(e)}")
     
+    @staticmethod
+    def parse_envelope(encrypted_text: str):
+        """
+        解析加密数据
+        
+        Returns:
+            (version, salt, iterations, iv, encrypted, aad)
+            
+        Raises:
+            ValueError: 格式错误时抛出
+        """
+        if encrypted_text.startswith(V2_PREFIX):
+            encrypted_data = base64.b64decode(encrypted_text[len(V2_PREFIX):].encode('ascii'))
+            if len(encrypted_data) < 5:
+                raise ValueError("加密数据格式错误")
+            iterations, salt_length = struct.unpack('>IB', encrypted_data[:5])
+            header_length = 5 + salt_length
+            if (salt_length == 0 or not 0 < iterations <= MAX_ITERATIONS
+                    or len(encrypted_data) < header_length + 12):
+                raise ValueError("加密数据格式错误")
+            header = encrypted_data[:header_length]
+            salt = encrypted_data[5:header_length]
+            iv = encrypted_data[header_length:header_length + 12]
+            encrypted = encrypted_data[header_length + 12:]
+            return 2, salt, iterations, iv, encrypted, header
+        
+        # v1：salt (16) + iv (12) + 密文
+        encrypted_data = base64.b64decode(encrypted_text.encode('ascii'))
+        if len(encrypted_data) < 28:  # 16 + 12 = 28 minimum
+            raise ValueError("加密数据格式错误")
+        return 1, encrypted_data[:16], PBKDF2_ITERATIONS, encrypted_data[16:28], encrypted_data[28:], None
+    
     @staticmethod
     def decrypt_token(encrypted_text: str, password: str) -> str:
         """
-        使用密码解密 token 文本
+        使用密码解密 token 文本（支持 v1 和 v2 格式）
         
         Args:
-            encrypted_text: base64 编码的加密数据
+            encrypted_text: 加密数据
             password: 解密密码
             
         Returns:
@@ -81,33 +275,170 @@ class TokenCrypto:
             # 编码密码
             password_data = password.encode('utf-8')
             
-            # 从 base64 解码
-            encrypted_data = base64.b64decode(encrypted_text.encode('ascii'))
-            
             # 提取组件
-            if len(encrypted_data) < 28:  # 16 + 12 = 28 minimum
-                raise ValueError("加密数据格式错误")
-                
-            salt = encrypted_data[:16]
-            iv = encrypted_data[16:28]
-            encrypted = encrypted_data[28:]
+            _, salt, iterations, iv, encrypted, aad = TokenCrypto.parse_envelope(encrypted_text)
             
             # 使用 PBKDF2 派生密钥
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=100000,
-                backend=default_backend()
-            )
-            key = kdf.derive(password_data)
+            key = TokenCrypto._derive_key(password_data, salt, iterations)
             
             # 使用 AES-GCM 解密
             aesgcm = AESGCM(key)
-            decrypted = aesgcm.decrypt(iv, encrypted, None)
+            decrypted = aesgcm.decrypt(iv, encrypted, aad)
             
             # 转换为字符串
             return decrypted.decode('utf-8')
             
         except Exception as e:
-            raise Exception(f"Token 解密失败，请检查密码是否正确: {str(e)}") 
\ No newline at end of file
+            raise Exception(f"Token 解密失败，请检查密码是否正确: {str(e)}")
+
+
+def calibrate_iterations(target_seconds: float = 0.25, min_iterations: int = PBKDF2_ITERATIONS,
+                         max_iterations: int = CALIBRATION_MAX_ITERATIONS) -> int:
+    """
+    测量本机 PBKDF2-HMAC-SHA256 的速度，返回使一次密钥派生约耗时 target_seconds 的迭代次数
+    
+    结果向上取整到 10000 的倍数，并限制在 [min_iterations, max_iterations] 之间。
+    """
+    probe_iterations = 50000
+    salt = os.urandom(16)
+    elapsed = 0.0
+    # 取多次测量中的最快值，减少调度抖动的影响
+    for _ in range(3):
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=salt,
+            iterations=probe_iterations,
+            backend=default_backend()
+        )
+        start = time.perf_counter()
+        kdf.derive(b'calibration')
+        duration = time.perf_counter() - start
+        elapsed = duration if not elapsed else min(elapsed, duration)
+    iterations = int(probe_iterations * target_seconds / max(elapsed, 1e-9))
+    iterations = -(-iterations // 10000) * 10000
+    return max(min_iterations, min(max_iterations, iterations))
+
+
+# 并行解密使用的线程数（PBKDF2 计算时会释放 GIL）
+DECRYPT_WORKERS = 4
+
+_decrypt_executor = None
+_decrypt_executor_lock = threading.Lock()
+
+
+def _get_decrypt_executor():
+    global _decrypt_executor
+    if _decrypt_executor is None:
+        with _decrypt_executor_lock:
+            if _decrypt_executor is None:
+                _decrypt_executor = ThreadPoolExecutor(
+                    max_workers=DECRYPT_WORKERS, thread_name_prefix='rei-decrypt')
+    return _decrypt_executor
+
+
+def decrypt_tokens(encrypted_texts, password: str):
+    """
+    并行解密多个值
+    
+    Args:
+        encrypted_texts: 加密数据列表
+        password: 解密密码
+        
+    Returns:
+        与输入顺序一致的列表，元素为明文字符串，解密失败的位置为异常对象
+    """
+    def decrypt(text):
+        try:
+            return TokenCrypto.decrypt_token(text, password)
+        except Exception as e:
+            return e
+    
+    if len(encrypted_texts) <= 1:
+        return [decrypt(text) for text in encrypted_texts]
+    return list(_get_decrypt_executor().map(decrypt, encrypted_texts))
+
+
+# 批量更换密码时的线程数（PBKDF2 在 OpenSSL 中计算时会释放 GIL）
+REKEY_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _rekey_chunk(items, old_password, new_password, salt, iterations):
+    """
+    在工作线程中用新密码重新加密一组值
+
+    Returns:
+        [(键, 新的加密数据, 错误信息), ...]，成功时错误信息为 None，失败时新数据为 None
+    """
+    results = []
+    for key, encrypted_text in items:
+        try:
+            text = TokenCrypto.decrypt_token(encrypted_text, old_password)
+            results.append((key, TokenCrypto.encrypt_token(text, new_password, salt, iterations), None))
+        except Exception as e:
+            results.append((key, None, str(e)))
+    return results
+
+
+def rekey_tokens(items, old_password: str, new_password: str, salt: bytes, iterations: int,
+                 progress=None, cancel=None, workers=None):
+    """
+    用新密码批量重新加密（v2 格式）
+    
+    密钥派生分散到线程池中执行；相同盐的值通过共享的密钥缓存只派生一次密钥。
+    
+    Args:
+        items: [(键, 加密数据), ...]
+        old_password: 原密码
+        new_password: 新密码
+        salt: 新加密值使用的盐（保险库盐）
+        iterations: 新加密值使用的 PBKDF2 迭代次数
+        progress: 可选的进度回调 progress(done, total)，每完成一组调用一次
+        cancel: 可选的取消标记，置位后抛出 OperationCancelled
+        workers: 线程数，默认 REKEY_WORKERS
+        
+    Returns:
+        (rekeyed, failures)：rekeyed 为 {键: 新的加密数据}，failures 为 {键: 错误信息}
+    """
+    from .fs_utils import check_cancelled, OperationCancelled
+    
+    items = list(items)
+    total = len(items)
+    rekeyed = {}
+    failures = {}
+    if not total:
+        return rekeyed, failures
+    
+    workers = max(1, min(workers or REKEY_WORKERS, total))
+    # 每个工作线程分到约 4 组，兼顾进度粒度和调度开销
+    chunk_size = max(1, min(32, -(-total // (workers * 4))))
+    chunks = [items[i:i + chunk_size] for i in range(0, total, chunk_size)]
+    
+    done = 0
+    pending = set()
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='rei-rekey')
+    try:
+        pending = {
+            executor.submit(_rekey_chunk, chunk, old_password, new_password, salt, iterations)
+            for chunk in chunks
+        }
+        while pending:
+            check_cancelled(cancel)
+            finished, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in finished:
+                for key, encrypted_text, error in future.result():
+                    if error is None:
+                        rekeyed[key] = encrypted_text
+                    else:
+                        failures[key] = error
+                    done += 1
+            if finished and progress is not None:
+                progress(done, total)
+    except OperationCancelled:
+        # 逐个取消尚未开始的分组（shutdown 的 cancel_futures 参数需要 Python 3.9+）
+        for future in pending:
+            future.cancel()
+        raise
+    finally:
+        executor.shutdown(wait=True)
+    return rekeyed, failures
@@ -0,0 +1,214 @@
+"""
+文件后缀索引
+为目录树维护 “目录 → 后缀 → 文件名” 的增量索引，并持久化到磁盘。
+重新扫描时只进入 mtime 发生变化的目录，未变化的目录直接复用索引内容。
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from .fs_utils import get_extension
+from .fs_walker import walk_tree, scan_entries, DEFAULT_EXCLUDES
+
+# 索引文件的存放目录
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'extension_index')
+
+# 索引格式版本，格式变化时递增以丢弃旧索引
+INDEX_VERSION = 4
+
+# 遍历目录树的线程数
+WALK_WORKERS = 8
+
+# get-extensions 接口在 exclude_common=true 时不计入统计的目录名（支持通配符）；
+# 默认与 ReiFileCounter 节点一样不排除任何目录
+EXCLUDES = DEFAULT_EXCLUDES
+
+# 内存中最多保留的目录树索引数量
+MAX_CACHED_INDEXES = 16
+
+# mtime 距扫描开始不足该时长（纳秒）的目录不视为稳定，下次查询时会重新扫描，
+# 避免同一时间精度内的修改被漏掉
+MTIME_GRACE_NS = 2_000_000_000
+
+_indexes = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+class ExtensionIndex:
+    """
+    单个目录树的后缀索引
+
+    每个目录保存一条记录：
+        {"mtime_ns": int, "files": [文件名, ...], "counts": {后缀: 数量}, "dirs": [子目录名, ...]}
+    files 保持目录列表（os.scandir）的顺序；没有后缀的文件在 counts 中记在空字符串键下。
+    遍历规则与 os.walk 一致：不跟随指向目录的符号链接，无法访问的目录视为空目录；
+    exclude 中的目录（如 .git、node_modules）不计入统计。
+    """
+
+    def __init__(self, root, exclude=()):
+        self.root = root
+        self.exclude = tuple(exclude)
+        key = '\0'.join((root,) + self.exclude)
+        self.index_path = os.path.join(
+            CACHE_DIR, hashlib.sha1(key.encode('utf-8', 'surrogatepass')).hexdigest() + '.json')
+        self._dirs = {}
+        self._summary = None
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (data.get('version') == INDEX_VERSION and data.get('root') == self.root
+                and tuple(data.get('exclude', ())) == self.exclude):
+            self._dirs = data.get('dirs', {})
+
+    def _save(self):
+        data = {'version': INDEX_VERSION, 'root': self.root, 'exclude': list(self.exclude), 'dirs': self._dirs}
+        tmp_path = f'{self.index_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"[ReiTools] 无法写入后缀索引 {self.index_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _scan_dir(path, mtime_ns):
+        try:
+            listing, _ = scan_entries('', path, None)
+        except OSError:
+            # 无法访问的目录视为空目录，并在下次查询时重试
+            return {'mtime_ns': 0, 'files': [], 'counts': {}, 'dirs': []}
+        counts = {}
+        for name in listing['files']:
+            ext = get_extension(name)
+            counts[ext] = counts.get(ext, 0) + 1
+        return {'mtime_ns': mtime_ns, 'files': listing['files'], 'counts': counts, 'dirs': listing['dirs']}
+
+    def refresh(self, cancel=None, progress=None, progress_files=5000, progress_interval=0.2):
+        """
+        与磁盘同步索引，只重新扫描 mtime 变化过的目录
+
+        目录由 fs_walker 并行遍历，跳过 exclude 中的目录。
+
+        Args:
+            cancel: 可选的取消标记，置位后抛出 OperationCancelled，已有索引保持不变
+            progress: 可选的进度回调 progress(total_files, extension_count)，
+                每处理 progress_files 个文件或每隔 progress_interval 秒调用一次，
+                参数为目前已遍历部分的统计（无后缀文件不计入 extension_count）
+        """
+        with self._lock:
+            stable_before = time.time_ns() - MTIME_GRACE_NS
+            old_dirs = self._dirs
+
+            def visit(rel, path, st):
+                record = old_dirs.get(rel)
+                rescanned = False
+                if record is None or not record['mtime_ns'] or record['mtime_ns'] != st.st_mtime_ns:
+                    mtime_ns = st.st_mtime_ns
+                    record = self._scan_dir(path, mtime_ns if mtime_ns < stable_before else 0)
+                    rescanned = True
+                return (record, rescanned), record['dirs']
+
+            seen = {'files': 0, 'counts': {}, 'reported_files': 0, 'reported_at': time.monotonic()}
+
+            def on_result(rel, payload):
+                record, _ = payload
+                for ext, count in record['counts'].items():
+                    seen['files'] += count
+                    if ext:
+                        seen['counts'][ext] = seen['counts'].get(ext, 0) + count
+                now = time.monotonic()
+                if (seen['files'] - seen['reported_files'] >= progress_files
+                        or now - seen['reported_at'] >= progress_interval):
+                    progress(seen['files'], dict(seen['counts']))
+                    seen['reported_files'] = seen['files']
+                    seen['reported_at'] = now
+
+            results = walk_tree(
+                self.root, visit, workers=WALK_WORKERS, exclude=self.exclude, cancel=cancel,
+                on_result=on_result if progress is not None else None
+            )
+            new_dirs = {rel: record for rel, (record, _) in results}
+            changed = any(rescanned for _, (_, rescanned) in results)
+
+            if changed or len(new_dirs) != len(old_dirs):
+                self._dirs = new_dirs
+                self._summary = None
+                self._save()
+        return self
+
+    def summary(self):
+        """
+        Returns:
+            (total_files, extension_count)，extension_count 不包含无后缀的文件
+        """
+        with self._lock:
+            if self._summary is None:
+                total_files = 0
+                extension_count = {}
+                for record in self._dirs.values():
+                    for ext, count in record['counts'].items():
+                        total_files += count
+                        if ext:
+                            extension_count[ext] = extension_count.get(ext, 0) + count
+                self._summary = (total_files, extension_count)
+            total_files, extension_count = self._summary
+            return total_files, dict(extension_count)
+
+    def files(self, extension=None):
+        """
+        返回索引中文件的完整路径
+        目录按路径分量排序（与 fs_walker.walk_tree 一致），目录内的文件保持目录列表的顺序
+
+        Args:
+            extension: 只返回该后缀（小写、不带点号）的文件，None 表示全部
+        """
+        with self._lock:
+            result = []
+            for rel in sorted(self._dirs, key=lambda rel: rel.split(os.sep)):
+                record = self._dirs[rel]
+                if extension is not None and not record['counts'].get(extension):
+                    continue
+                base = os.path.join(self.root, rel) if rel else self.root
+                names = record['files']
+                if extension is not None:
+                    names = [name for name in names if get_extension(name) == extension]
+                result.extend(os.path.join(base, name) for name in names)
+            return result
+
+
+def get_extension_index(directory_path, exclude=(), cancel=None, **refresh_options):
+    """
+    获取目录树的后缀索引（已与磁盘同步）
+
+    Args:
+        directory_path: 目录的绝对路径
+        exclude: 不计入索引的目录名通配符，默认不排除任何目录（与 os.walk 一致）
+        cancel: 可选的取消标记
+        **refresh_options: 传给 ExtensionIndex.refresh 的进度参数
+    """
+    root = os.path.abspath(directory_path)
+    cache_key = (root, tuple(exclude))
+    with _indexes_lock:
+        index = _indexes.get(cache_key)
+        if index is None:
+            index = ExtensionIndex(root, exclude)
+            _indexes[cache_key] = index
+            while len(_indexes) > MAX_CACHED_INDEXES:
+                _indexes.popitem(last=False)
+        else:
+            _indexes.move_to_end(cache_key)
+    return index.refresh(cancel=cancel, **refresh_options)
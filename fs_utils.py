@@ -0,0 +1,354 @@
+"""
+文件系统列表工具
+基于 os.scandir 的目录列表引擎，供 server.py 中的浏览接口共用
+"""
+import base64
+import heapq
+import json
+import os
+import stat
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+
+class OperationCancelled(Exception):
+    """阻塞的文件系统操作被取消（例如客户端已断开连接）"""
+
+
+def check_cancelled(cancel):
+    """cancel 已置位时抛出 OperationCancelled"""
+    if cancel is not None and cancel.is_set():
+        raise OperationCancelled()
+
+
+def get_access_checker():
+    """
+    返回一个根据 stat 结果的权限位判断读写权限的函数
+
+    与 os.access 不同，这里不会对每个条目再发起系统调用，
+    进程身份只在创建检查函数时读取一次。
+    注意：ACL 等扩展权限不会被考虑。
+    """
+    if os.name == 'nt':
+        def check(st, mode):
+            if mode & os.W_OK:
+                return bool(st.st_mode & stat.S_IWRITE)
+            return True
+        return check
+
+    euid = os.geteuid()
+    groups = set(os.getgroups())
+    groups.add(os.getegid())
+
+    def check(st, mode):
+        # root 对读写总是有权限
+        if euid == 0:
+            return True
+        if st.st_uid == euid:
+            bits = (st.st_mode >> 6) & 0o7
+        elif st.st_gid in groups:
+            bits = (st.st_mode >> 3) & 0o7
+        else:
+            bits = st.st_mode & 0o7
+        return (bits & mode) == mode
+
+    return check
+
+
+def scan_directory(path, skip_hidden=True, skip_prefixes=(), cancel=None):
+    """
+    列出目录中的条目
+
+    Args:
+        path: 目录路径
+        skip_hidden: 是否跳过以 '.' 开头的条目
+        skip_prefixes: 额外需要跳过的名称前缀
+        cancel: 可选的取消标记（threading.Event），置位后抛出 OperationCancelled
+
+    Returns:
+        (entry, stat_result) 列表，stat_result 跟随符号链接；
+        无法 stat 的条目（例如失效的符号链接）会被跳过
+
+    Raises:
+        PermissionError / OSError: 目录本身无法读取时抛出
+    """
+    results = []
+    with os.scandir(path) as it:
+        for entry in it:
+            check_cancelled(cancel)
+            name = entry.name
+            if skip_hidden and name.startswith('.'):
+                continue
+            if skip_prefixes and name.startswith(skip_prefixes):
+                continue
+            try:
+                # Windows 上 stat 信息来自目录读取本身，POSIX 上只需一次 stat
+                st = entry.stat()
+            except OSError:
+                continue
+            results.append((entry, st))
+    return results
+
+
+def count_children(path, skip_hidden=True, sample=None):
+    """
+    统计目录的子项数量
+
+    Args:
+        path: 目录路径
+        skip_hidden: 是否跳过以 '.' 开头的条目
+        sample: 只对前 sample 个子项区分文件/目录，None 表示全部
+
+    Returns:
+        (children_count, file_count, dir_count)，无法访问时返回 (0, 0, 0)
+    """
+    children_count = 0
+    file_count = 0
+    dir_count = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if skip_hidden and entry.name.startswith('.'):
+                    continue
+                children_count += 1
+                if sample is not None and children_count > sample:
+                    continue
+                # is_dir/is_file 优先使用目录项自带的类型信息，无需额外 stat
+                try:
+                    if entry.is_dir():
+                        dir_count += 1
+                    elif entry.is_file():
+                        file_count += 1
+                except OSError:
+                    continue
+    except OSError:
+        return 0, 0, 0
+    return children_count, file_count, dir_count
+
+
+def get_extension(name):
+    """返回小写且不带点号的文件后缀"""
+    return os.path.splitext(name)[1].lower().lstrip('.')
+
+
+# 服务端排序支持的键
+SORT_FIELDS = ('name', 'mtime', 'size', 'type')
+
+
+class _Descending:
+    """反转比较顺序的包装，用于降序排序时保持“目录优先”"""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def _raw_sort_key(item, sort):
+    """返回条目的原始排序值（可 JSON 序列化，名称作为最终的决胜键）"""
+    name = item["name"]
+    if sort == 'mtime':
+        value = [item.get("modified", 0)]
+    elif sort == 'size':
+        value = [item.get("size", 0)]
+    elif sort == 'type':
+        value = [item.get("extension", "")]
+    else:
+        value = []
+    return [item["type"] != "directory", value + [name.lower(), name]]
+
+
+def _wrap_sort_key(raw, order):
+    group, value = raw
+    value = tuple(value)
+    if order == 'desc':
+        value = _Descending(value)
+    return (group, value)
+
+
+def encode_cursor(raw_key):
+    """将排序键编码为不透明的游标字符串"""
+    data = json.dumps(raw_key, ensure_ascii=False, separators=(',', ':'))
+    return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii')
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_str(value):
+    return isinstance(value, str)
+
+
+# 各排序键的原始排序值中，名称之前的字段类型（与 _raw_sort_key 对应）
+_CURSOR_VALUE_TYPES = {
+    'name': (),
+    'mtime': (_is_number,),
+    'size': (_is_number,),
+    'type': (_is_str,),
+}
+
+
+def decode_cursor(cursor, sort='name'):
+    """
+    解析游标字符串，并检查其结构与 sort 对应的排序键一致
+    格式错误时抛出 ValueError（否则与真实排序键比较时会引发 TypeError）
+    """
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+        group, value = raw
+    except Exception:
+        raise ValueError("无效的游标")
+    checks = _CURSOR_VALUE_TYPES.get(sort, ()) + (_is_str, _is_str)
+    if (not isinstance(group, bool) or not isinstance(value, list) or len(value) != len(checks)
+            or not all(check(item) for check, item in zip(checks, value))):
+        raise ValueError("无效的游标")
+    return [group, value]
+
+
+def paginate_items(items, sort='name', order='asc', limit=None, cursor=None):
+    """
+    对目录条目进行排序和游标分页（目录始终排在文件之前）
+
+    指定 limit 时使用堆做部分选择，只取出排在游标之后的前 limit 个条目，
+    复杂度为 O(n log k)，而不是对整个列表排序。
+
+    Args:
+        items: 条目字典列表
+        sort: 排序键，取值见 SORT_FIELDS
+        order: 'asc' 或 'desc'
+        limit: 每页数量，None 表示返回全部
+        cursor: 上一页返回的 next_cursor
+
+    Returns:
+        (page_items, next_cursor)，没有更多数据时 next_cursor 为 None
+    """
+    if sort not in SORT_FIELDS:
+        raise ValueError(f"不支持的排序键: {sort}")
+    if order not in ('asc', 'desc'):
+        raise ValueError(f"不支持的排序方向: {order}")
+
+    def key(item):
+        return _wrap_sort_key(_raw_sort_key(item, sort), order)
+
+    if cursor:
+        cursor_key = _wrap_sort_key(decode_cursor(cursor, sort), order)
+        items = [item for item in items if cursor_key < key(item)]
+
+    if limit is None:
+        return sorted(items, key=key), None
+
+    # 多取一个用于判断是否还有下一页
+    page = heapq.nsmallest(limit + 1, items, key=key)
+    if len(page) <= limit:
+        return page, None
+    page = page[:limit]
+    return page, encode_cursor(_raw_sort_key(page[-1], sort))
+
+
+class ListingCache:
+    """
+    目录列表缓存
+
+    以 (列表类型, 解析后的路径, 列表参数...) 为键缓存目录条目，
+    命中前只 stat 目录一次，并与缓存时的 st_mtime_ns 比较。
+    同时按条目数量和估算的内存占用做 LRU 淘汰。
+
+    注意：目录的 mtime 只在直接子项增删改名时变化，文件大小或子目录内容的变化
+    不会使缓存失效，因此缓存还有 max_age 秒的最长有效期。
+    """
+
+    # mtime 距现在不足该时长（纳秒）的目录不缓存，避免同一时间精度内的修改被漏掉
+    MTIME_GRACE_NS = 2_000_000_000
+
+    def __init__(self, max_entries=256, max_bytes=64 * 1024 * 1024, max_age=30.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _estimate_size(items):
+        size = sys.getsizeof(items)
+        for item in items:
+            size += sys.getsizeof(item)
+            for value in item.values():
+                size += sys.getsizeof(value)
+        return size
+
+    def get(self, key, path):
+        """
+        返回缓存的条目列表并附带目录当前的 mtime_ns
+
+        Returns:
+            (items, mtime_ns)；未命中时 items 为 None，mtime_ns 用于随后的 put
+
+        Raises:
+            OSError: 目录无法 stat 时抛出
+        """
+        mtime_ns = os.stat(path).st_mtime_ns
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                cached_mtime, cached_at, items, _ = entry
+                if cached_mtime == mtime_ns and time.monotonic() - cached_at < self.max_age:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return items, mtime_ns
+                self._remove(key)
+            self.misses += 1
+        return None, mtime_ns
+
+    def put(self, key, items, mtime_ns):
+        """缓存条目列表，mtime_ns 应为列出目录之前 get 返回的值"""
+        if time.time_ns() - mtime_ns < self.MTIME_GRACE_NS:
+            return
+        size = self._estimate_size(items)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (mtime_ns, time.monotonic(), items, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[3]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """返回缓存的命中统计和容量信息"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "max_age": self.max_age,
+            }
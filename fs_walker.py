@@ -0,0 +1,130 @@
+"""
+并行目录树遍历
+将各子目录的扫描分发到线程池中执行，适用于延迟较高的网络存储
+"""
+import fnmatch
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from .fs_utils import check_cancelled
+
+# 默认的线程数
+DEFAULT_WORKERS = 8
+
+# 默认跳过的目录名（支持通配符）
+DEFAULT_EXCLUDES = ('.git', '__pycache__', 'node_modules')
+
+
+def scan_entries(rel, path, st, follow_symlinks=False):
+    """
+    默认的目录访问函数：列出目录中的文件和子目录
+
+    Returns:
+        ({"files": [文件名, ...], "dirs": [子目录名, ...]}, 子目录名列表)；
+        follow_symlinks 为 False 时与 os.walk 相同，符号链接目录既不计为文件也不进入
+    """
+    files = []
+    dirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if follow_symlinks or not entry.is_symlink():
+                    dirs.append(entry.name)
+                continue
+            files.append(entry.name)
+    return {'files': files, 'dirs': dirs}, dirs
+
+
+def walk_tree(root, visit=scan_entries, workers=DEFAULT_WORKERS, exclude=DEFAULT_EXCLUDES,
+              max_depth=None, cancel=None, on_result=None):
+    """
+    并行遍历目录树
+
+    每个目录先 stat 一次，按 (st_dev, st_ino) 去重以避免符号链接造成的循环，
+    然后在线程池中调用 visit(rel, path, st)。visit 返回 (payload, 子目录名列表)，
+    子目录中匹配 exclude 的会被跳过。visit 抛出 OSError 的目录会被忽略。
+
+    Args:
+        root: 根目录
+        visit: 目录访问函数，在工作线程中调用
+        workers: 线程数，1 表示在当前线程中顺序遍历
+        exclude: 需要跳过的目录名通配符
+        max_depth: 最大深度（根目录为 0），None 表示不限制
+        cancel: 可选的取消标记，置位后抛出 OperationCancelled
+        on_result: 可选回调 on_result(rel, payload)，每个目录完成时在调用线程中执行
+
+    Returns:
+        [(rel, payload), ...]，按相对路径排序，结果与线程数无关
+    """
+    seen = set()
+    seen_lock = threading.Lock()
+    results = []
+
+    def run(rel):
+        check_cancelled(cancel)
+        path = os.path.join(root, rel) if rel else root
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = (st.st_dev, st.st_ino)
+        with seen_lock:
+            if key in seen:
+                return None
+            seen.add(key)
+        try:
+            return visit(rel, path, st)
+        except OSError:
+            return None
+
+    def children(rel, depth, subdirs):
+        if max_depth is not None and depth >= max_depth:
+            return []
+        return [
+            (os.path.join(rel, name) if rel else name, depth + 1)
+            for name in subdirs
+            if not any(fnmatch.fnmatch(name, pattern) for pattern in exclude)
+        ]
+
+    def collect(rel, outcome):
+        if outcome is None:
+            return None
+        payload, subdirs = outcome
+        results.append((rel, payload))
+        if on_result is not None:
+            on_result(rel, payload)
+        return subdirs
+
+    if workers <= 1:
+        stack = [('', 0)]
+        while stack:
+            rel, depth = stack.pop()
+            subdirs = collect(rel, run(rel))
+            if subdirs:
+                stack.extend(children(rel, depth, subdirs))
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='rei-walk') as executor:
+            pending = {executor.submit(run, ''): ('', 0)}
+            try:
+                while pending:
+                    check_cancelled(cancel)
+                    done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        rel, depth = pending.pop(future)
+                        subdirs = collect(rel, future.result())
+                        if subdirs:
+                            for child in children(rel, depth, subdirs):
+                                pending[executor.submit(run, child[0])] = child
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+
+    results.sort(key=lambda item: item[0].split(os.sep))
+    return results
+
@@ -1,20 +1,63 @@
 import { app } from '/scripts/app.js';
 import { api } from '/scripts/api.js';
 
+// v2 加密格式的前缀（与 crypto_utils.V2_PREFIX 一致）
+const V2_PREFIX = 'rei:v2:';
+
 class ReiConfigManager {
   constructor() {
     this.configs = {};
     this.configTypes = {}; // 存储每个配置项的类型信息
     this.currentEditingKey = null;
+    this.vault = null; // 保险库加密参数
+    this.derivedKeys = new Map(); // 已派生的密钥缓存
+    this.configVersion = null; // 服务端配置版本号，用于增量同步
+    this.syncTimer = null;
   }
 
-  // 加密功能
-  async encryptToken(text, password) {
-    try {
-      const encoder = new TextEncoder();
-      const data = encoder.encode(text);
-      const passwordData = encoder.encode(password);
+  // base64 与字节数组互相转换
+  bytesToBase64(bytes) {
+    let binary = '';
+    for (let i = 0; i < bytes.length; i++) {
+      binary += String.fromCharCode(bytes[i]);
+    }
+    return btoa(binary);
+  }
+
+  base64ToBytes(text) {
+    return new Uint8Array(
+      atob(text)
+        .split('')
+        .map((char) => char.charCodeAt(0))
+    );
+  }
+
+  // 获取保险库加密参数（共享盐和迭代次数）
+  async getVaultParams() {
+    if (!this.vault) {
+      const response = await api.fetchApi('/api/rei/config/vault', {
+        method: 'GET',
+      });
+      if (!response.ok) {
+        throw new Error(`获取保险库参数失败: HTTP ${response.status}`);
+      }
+      this.vault = await response.json();
+    }
+    return this.vault;
+  }
+
+  // 派生 AES 密钥，同一密码、盐和迭代次数只派生一次
+  async deriveAesKey(password, salt, iterations) {
+    const encoder = new TextEncoder();
+    const passwordData = encoder.encode(password);
+    const passwordDigest = new Uint8Array(
+      await crypto.subtle.digest('SHA-256', passwordData)
+    );
+    const cacheKey = `${this.bytesToBase64(salt)}:${iterations}:${this.bytesToBase64(
+      passwordDigest
+    )}`;
 
+    if (!this.derivedKeys.has(cacheKey)) {
       // 使用密码生成密钥
       const key = await crypto.subtle.importKey(
         'raw',
@@ -24,93 +67,104 @@ class ReiConfigManager {
         ['deriveKey']
       );
 
-      // 生成随机盐
-      const salt = crypto.getRandomValues(new Uint8Array(16));
-
       // 派生密钥
-      const derivedKey = await crypto.subtle.deriveKey(
+      const derivedKey = crypto.subtle.deriveKey(
         {
           name: 'PBKDF2',
           salt: salt,
-          iterations: 100000,
+          iterations: iterations,
           hash: 'SHA-256',
         },
         key,
         { name: 'AES-GCM', length: 256 },
         false,
-        ['encrypt']
+        ['encrypt', 'decrypt']
       );
+      this.derivedKeys.set(cacheKey, derivedKey);
+      derivedKey.catch(() => this.derivedKeys.delete(cacheKey));
+    }
+    return this.derivedKeys.get(cacheKey);
+  }
+
+  // v2 头部：迭代次数 (uint32 大端) + 盐长度 (1 byte) + 盐
+  packV2Header(salt, iterations) {
+    const header = new Uint8Array(5 + salt.length);
+    new DataView(header.buffer).setUint32(0, iterations, false);
+    header[4] = salt.length;
+    header.set(salt, 5);
+    return header;
+  }
+
+  // 加密功能（v2 格式，使用保险库盐）
+  async encryptToken(text, password) {
+    try {
+      const encoder = new TextEncoder();
+      const data = encoder.encode(text);
+
+      const vault = await this.getVaultParams();
+      const salt = this.base64ToBytes(vault.salt);
+      const iterations = vault.iterations;
+      const derivedKey = await this.deriveAesKey(password, salt, iterations);
 
       // 生成随机IV
       const iv = crypto.getRandomValues(new Uint8Array(12));
 
-      // 加密
+      // 加密，头部作为附加认证数据
+      const header = this.packV2Header(salt, iterations);
       const encrypted = await crypto.subtle.encrypt(
-        { name: 'AES-GCM', iv: iv },
+        { name: 'AES-GCM', iv: iv, additionalData: header },
         derivedKey,
         data
       );
 
-      // 组合盐、IV和加密数据
+      // 组合头部、IV和加密数据
       const result = new Uint8Array(
-        salt.length + iv.length + encrypted.byteLength
+        header.length + iv.length + encrypted.byteLength
       );
-      result.set(salt, 0);
-      result.set(iv, salt.length);
-      result.set(new Uint8Array(encrypted), salt.length + iv.length);
+      result.set(header, 0);
+      result.set(iv, header.length);
+      result.set(new Uint8Array(encrypted), header.length + iv.length);
 
       // 转换为 base64
-      return btoa(String.fromCharCode(...result));
+      return V2_PREFIX + this.bytesToBase64(result);
     } catch (error) {
       console.error('加密失败:', error);
       throw new Error('Token 加密失败');
     }
   }
 
-  // 解密功能
+  // 解密功能（支持 v1 和 v2 格式）
   async decryptToken(encryptedText, password) {
     try {
-      const encoder = new TextEncoder();
-      const passwordData = encoder.encode(password);
-
-      // 从 base64 解码
-      const encryptedData = new Uint8Array(
-        atob(encryptedText)
-          .split('')
-          .map((char) => char.charCodeAt(0))
-      );
-
-      // 提取盐、IV和加密数据
-      const salt = encryptedData.slice(0, 16);
-      const iv = encryptedData.slice(16, 28);
-      const encrypted = encryptedData.slice(28);
+      let salt, iv, encrypted, iterations;
+      let params = {};
 
-      // 使用密码生成密钥
-      const key = await crypto.subtle.importKey(
-        'raw',
-        passwordData,
-        { name: 'PBKDF2' },
-        false,
-        ['deriveKey']
-      );
+      if (encryptedText.startsWith(V2_PREFIX)) {
+        // v2：头部 + IV + 加密数据
+        const encryptedData = this.base64ToBytes(
+          encryptedText.slice(V2_PREFIX.length)
+        );
+        const view = new DataView(encryptedData.buffer);
+        iterations = view.getUint32(0, false);
+        const headerLength = 5 + encryptedData[4];
+        salt = encryptedData.slice(5, headerLength);
+        iv = encryptedData.slice(headerLength, headerLength + 12);
+        encrypted = encryptedData.slice(headerLength + 12);
+        params = { additionalData: encryptedData.slice(0, headerLength) };
+      } else {
+        // v1：提取盐、IV和加密数据
+        const encryptedData = this.base64ToBytes(encryptedText);
+        salt = encryptedData.slice(0, 16);
+        iv = encryptedData.slice(16, 28);
+        encrypted = encryptedData.slice(28);
+        iterations = 100000;
+      }
 
-      // 派生密钥
-      const derivedKey = await crypto.subtle.deriveKey(
-        {
-          name: 'PBKDF2',
-          salt: salt,
-          iterations: 100000,
-          hash: 'SHA-256',
-        },
-        key,
-        { name: 'AES-GCM', length: 256 },
-        false,
-        ['decrypt']
-      );
+      const derivedKey = await this.deriveAesKey(password, salt, iterations);
 
       // 解密
       const decrypted = await crypto.subtle.decrypt(
-        { name: 'AES-GCM', iv: iv },
+        { name: 'AES-GCM', iv: iv, ...params },
         derivedKey,
         encrypted
       );
@@ -127,30 +181,26 @@ class ReiConfigManager {
   async loadConfigs() {
     console.log('开始加载配置...');
     try {
-      // 并行加载配置数据和类型信息
-      const [configResponse, typesResponse] = await Promise.all([
-        api.fetchApi('/api/rei/config/get_all', { method: 'GET' }),
-        api.fetchApi('/api/rei/config/get_types', { method: 'GET' }),
-      ]);
+      // 一次请求同时获取配置值、类型信息和版本号
+      const response = await api.fetchApi('/api/rei/config/snapshot', {
+        method: 'GET',
+      });
 
-      console.log('API 响应状态:', configResponse.status, typesResponse.status);
+      console.log('API 响应状态:', response.status);
 
-      if (configResponse.ok) {
-        this.configs = await configResponse.json();
+      if (response.ok) {
+        const snapshot = await response.json();
+        this.configs = snapshot.values;
+        this.configTypes = snapshot.types;
+        this.configVersion = snapshot.version;
         console.log('成功加载配置:', this.configs);
         this.showMessage('配置加载成功', 'success');
       } else {
         this.configs = {};
-        console.error('无法获取配置:', configResponse.statusText);
-        this.showMessage(`加载配置失败: ${configResponse.statusText}`, 'error');
-      }
-
-      if (typesResponse.ok) {
-        this.configTypes = await typesResponse.json();
-        console.log('成功加载配置类型:', this.configTypes);
-      } else {
-        console.warn('类型信息加载失败，使用默认类型推断');
         this.configTypes = {};
+        this.configVersion = null;
+        console.error('无法获取配置:', response.statusText);
+        this.showMessage(`加载配置失败: ${response.statusText}`, 'error');
       }
 
       this.renderConfigList();
@@ -158,11 +208,83 @@ class ReiConfigManager {
       console.error('加载配置失败:', error);
       this.configs = {};
       this.configTypes = {};
+      this.configVersion = null;
       this.showMessage(`加载配置失败: ${error.message}`, 'error');
       this.renderConfigList();
     }
   }
 
+  // 增量同步：只获取上次同步之后变化和删除的配置
+  async syncConfigs() {
+    if (this.configVersion === null) return;
+    try {
+      const response = await api.fetchApi(
+        `/api/rei/config/snapshot?since=${this.configVersion}`,
+        { method: 'GET' }
+      );
+      if (!response.ok) return;
+      const delta = await response.json();
+      if (delta.version === this.configVersion) return;
+
+      if (delta.full) {
+        this.configs = delta.values;
+        this.configTypes = delta.types;
+      } else {
+        Object.assign(this.configs, delta.values);
+        Object.assign(this.configTypes, delta.types);
+        delta.deleted.forEach((key) => {
+          delete this.configs[key];
+          delete this.configTypes[key];
+        });
+      }
+      this.configVersion = delta.version;
+      this.renderConfigList();
+    } catch (error) {
+      console.warn('同步配置失败:', error);
+    }
+  }
+
+  // 应用服务端推送的配置变更事件（rei.config.changed）
+  applyConfigEvent(event) {
+    if (this.configVersion === null || event.version <= this.configVersion) {
+      return;
+    }
+    // 事件过大或中间漏掉了版本时，改为增量拉取
+    if (event.resync || event.since > this.configVersion) {
+      this.syncConfigs();
+      return;
+    }
+    Object.assign(this.configs, event.values);
+    Object.assign(this.configTypes, event.types);
+    event.deleted.forEach((key) => {
+      delete this.configs[key];
+      delete this.configTypes[key];
+    });
+    this.configVersion = event.version;
+    this.renderConfigList();
+  }
+
+  // 面板可见时定期增量同步（变更通常由 websocket 推送，这里只作为兜底）
+  startSync(interval = 60000) {
+    this.stopSync();
+    this.syncTimer = setInterval(() => {
+      if (!document.getElementById('rei-config-container')) {
+        this.stopSync();
+        return;
+      }
+      if (document.visibilityState === 'visible') {
+        this.syncConfigs();
+      }
+    }, interval);
+  }
+
+  stopSync() {
+    if (this.syncTimer) {
+      clearInterval(this.syncTimer);
+      this.syncTimer = null;
+    }
+  }
+
   async saveConfig(key, value, type) {
     if (!key.trim()) {
       this.showMessage('错误: 键名不能为空', 'error');
@@ -206,12 +328,19 @@ class ReiConfigManager {
       formData.append('value', finalValue);
       formData.append('type', type);
       formData.append('encrypted', isEncrypted ? 'true' : 'false');
+      // 乐观并发检查：配置在其他页面或进程中被修改过时服务端返回 409
+      formData.append('expected_revision', String(this.getRevision(key)));
 
       const response = await api.fetchApi('/api/rei/config/update', {
         method: 'POST',
         body: formData,
       });
 
+      if (response.status === 409) {
+        await this.handleConflict(response);
+        return false;
+      }
+
       if (!response.ok) {
         try {
           const errorData = await response.json();
@@ -221,6 +350,8 @@ class ReiConfigManager {
         }
       }
 
+      const result = await response.json();
+
       // 更新本地配置
       let convertedValue = finalValue; // 使用处理后的值（可能是加密后的）
       if (type === 'integer' && !isEncrypted) convertedValue = parseInt(value);
@@ -235,6 +366,7 @@ class ReiConfigManager {
       this.configTypes[key] = {
         type: type,
         encrypted: isEncrypted,
+        revision: result.revision,
       };
       this.renderConfigList();
       this.showMessage(`成功保存配置: ${key}`, 'success');
@@ -245,17 +377,42 @@ class ReiConfigManager {
     }
   }
 
+  // 本地看到的配置版本号，不存在的键为 0
+  getRevision(key) {
+    if (!(key in this.configs)) return 0;
+    return (this.configTypes[key] && this.configTypes[key].revision) || 1;
+  }
+
+  // 配置已被其他页面或进程修改：提示并同步最新配置
+  async handleConflict(response) {
+    let message = '配置已被修改';
+    try {
+      const errorData = await response.json();
+      message = errorData.error || message;
+    } catch (parseError) {
+      // 忽略解析错误
+    }
+    this.showMessage(`${message}，已同步最新配置，请确认后重试`, 'error');
+    await this.syncConfigs();
+  }
+
   async deleteConfig(key) {
     console.log('删除配置:', key);
     try {
       const formData = new FormData();
       formData.append('key', key);
+      formData.append('expected_revision', String(this.getRevision(key)));
 
       const response = await api.fetchApi('/api/rei/config/delete', {
         method: 'POST',
         body: formData,
       });
 
+      if (response.status === 409) {
+        await this.handleConflict(response);
+        return;
+      }
+
       if (!response.ok) {
         try {
           const errorData = await response.json();
@@ -274,6 +431,93 @@ class ReiConfigManager {
     }
   }
 
+  async rekeyPassword() {
+    const passwordInput = document.getElementById('rei-encryption-password');
+    const newPasswordInput = document.getElementById('rei-new-password');
+    const rekeyBtn = document.getElementById('rei-rekey-btn');
+    const oldPassword = passwordInput.value;
+    const newPassword = newPasswordInput.value;
+
+    if (!oldPassword || !newPassword) {
+      this.showMessage('请同时输入当前密码和新密码', 'error');
+      return;
+    }
+    if (
+      !confirm('确定要用新密码重新加密所有已加密的 Token 吗？请务必牢记新密码。')
+    ) {
+      return;
+    }
+
+    const originalText = rekeyBtn.textContent;
+    rekeyBtn.disabled = true;
+    try {
+      const response = await api.fetchApi('/api/rei/config/rekey?stream=true', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+          old_password: oldPassword,
+          new_password: newPassword,
+        }),
+      });
+
+      if (!response.ok) {
+        try {
+          const errorData = await response.json();
+          throw new Error(errorData.error || '更换密码失败');
+        } catch (parseError) {
+          throw new Error(`更换密码失败: HTTP ${response.status}`);
+        }
+      }
+
+      // 以 NDJSON 流式读取进度
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      let result = null;
+
+      const handleLine = (line) => {
+        if (!line.trim()) return;
+        const data = JSON.parse(line);
+        if (data.type === 'error') {
+          throw new Error(data.error);
+        }
+        if (data.type === 'progress') {
+          rekeyBtn.textContent = `${data.done}/${data.total}`;
+        } else if (data.type === 'done') {
+          result = data;
+        }
+      };
+
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop();
+        lines.forEach(handleLine);
+      }
+      handleLine(buffer);
+
+      if (!result) {
+        throw new Error('更换密码未完成');
+      }
+
+      passwordInput.value = newPassword;
+      newPasswordInput.value = '';
+      await this.loadConfigs();
+      let message = `成功用新密码重新加密 ${result.rekeyed} 个 Token`;
+      if (result.conflicts && result.conflicts.length) {
+        message += `，以下配置在此期间被修改，未更换: ${result.conflicts.join(', ')}`;
+      }
+      this.showMessage(message, result.conflicts.length ? 'info' : 'success');
+    } catch (error) {
+      this.showMessage(`更换密码失败: ${error.message}`, 'error');
+    } finally {
+      rekeyBtn.disabled = false;
+      rekeyBtn.textContent = originalText;
+    }
+  }
+
   showInlineError(configKey, message) {
     // 在配置项附近显示浮动错误提示
     const configItems = document.querySelectorAll('.rei-config-item');
@@ -1215,6 +1459,30 @@ class ReiConfigManager {
                         <div style="color: #999; font-size: 10px; margin-top: 4px;">
                             ⚠️ 请牢记此密码，丢失后无法恢复加密的 Token
                         </div>
+                        <label style="display: block; margin: 8px 0 4px 0; color: #ccc; font-size: 11px;">更换密码（用上面的密码解密后重新加密所有 Token）:</label>
+                        <div style="display: flex; gap: 6px;">
+                            <input type="password" id="rei-new-password" placeholder="请输入新密码" style="
+                                flex: 1;
+                                min-width: 0;
+                                padding: 6px;
+                                border: 1px solid #666;
+                                background: #444;
+                                color: white;
+                                border-radius: 4px;
+                                font-size: 12px;
+                                box-sizing: border-box;
+                            ">
+                            <button id="rei-rekey-btn" style="
+                                padding: 6px 10px;
+                                background: #FF9800;
+                                color: white;
+                                border: none;
+                                border-radius: 4px;
+                                cursor: pointer;
+                                font-size: 12px;
+                                white-space: nowrap;
+                            ">更换密码</button>
+                        </div>
                     </div>
                 </div>
                 
@@ -1471,12 +1739,19 @@ class ReiConfigManager {
           } else {
             passwordSection.style.display = 'none';
             document.getElementById('rei-encryption-password').value = '';
+            document.getElementById('rei-new-password').value = '';
           }
         };
       }
 
-      // 初始加载配置
+      const rekeyBtn = document.getElementById('rei-rekey-btn');
+      if (rekeyBtn) {
+        rekeyBtn.onclick = () => this.rekeyPassword();
+      }
+
+      // 初始加载配置，之后定期增量同步
       this.loadConfigs();
+      this.startSync();
     }, 100);
   }
 }
@@ -1485,6 +1760,11 @@ class ReiConfigManager {
 const reiConfigManager = new ReiConfigManager();
 window.reiConfigManager = reiConfigManager;
 
+// 接收服务端推送的配置变更
+api.addEventListener('rei.config.changed', (event) => {
+  reiConfigManager.applyConfigEvent(event.detail);
+});
+
 // 注册侧边栏标签页
 app.registerExtension({
   name: 'Rei.ConfigManager.Sidebar',
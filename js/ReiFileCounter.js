@@ -23,38 +23,84 @@ function updateExtensionDropdown(node) {
 
   console.log('[ReiFileCounter] 开始获取文件后缀列表...');
 
-  // 调用API获取文件后缀列表
+  // 应用后缀列表到下拉框
+  const applyExtensions = (extensions) => {
+    const currentSelectedValue = fileExtensionWidget.value;
+    fileExtensionWidget.options.values = Array.from(new Set(extensions));
+    if (!fileExtensionWidget.options.values.includes(currentSelectedValue)) {
+      fileExtensionWidget.value = fileExtensionWidget.options.values[0];
+    }
+    node.setDirtyCanvas?.(true, true);
+  };
+
+  // 取消上一次尚未完成的请求
+  if (node._reiExtensionsAbort) {
+    node._reiExtensionsAbort.abort();
+  }
+  const controller = new AbortController();
+  node._reiExtensionsAbort = controller;
+
+  // 调用API获取文件后缀列表（NDJSON 流式模式，边遍历边更新下拉框）
   fetch(
     `/api/rei/filesystem/get-extensions?path=${encodeURIComponent(
       directoryPathWidget.value
-    )}`
+    )}&stream=true`,
+    { signal: controller.signal }
   )
-    .then((response) => {
+    .then(async (response) => {
       if (!response.ok) {
         throw new Error(`HTTP ${response.status}: ${response.statusText}`);
       }
-      return response.json();
+
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      let result = null;
+
+      const handleLine = (line) => {
+        if (!line.trim()) return;
+        const data = JSON.parse(line);
+        if (data.type === 'error') {
+          throw new Error(data.error);
+        }
+        applyExtensions(data.extensions || []);
+        if (data.type === 'done') {
+          result = data;
+        }
+      };
+
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop();
+        lines.forEach(handleLine);
+      }
+      handleLine(buffer);
+      return result;
     })
     .then((data) => {
-      if (data.error) {
-        throw new Error(data.error);
-      }
-
-      const extensions = data.extensions || [];
-      const currentSelectedValue = fileExtensionWidget.value;
-      fileExtensionWidget.options.values = Array.from(new Set(extensions));
-      if (!fileExtensionWidget.options.values.includes(currentSelectedValue)) {
-        fileExtensionWidget.value = fileExtensionWidget.options.values[0];
+      if (!data) {
+        throw new Error('后缀统计未完成');
       }
       // 添加文件后缀选项
       //   extensions.forEach((ext) => {
       //     fileExtensionWidget.options[ext] = `.${ext}`;
       //   });
 
-      console.log(`[ReiFileCounter] 成功加载 ${extensions.length} 个文件后缀`);
+      console.log(
+        `[ReiFileCounter] 成功加载 ${(data.extensions || []).length} 个文件后缀`
+      );
     })
     .catch((error) => {
+      if (error.name === 'AbortError') return;
       console.error('[ReiFileCounter] 获取文件后缀列表失败:', error);
+    })
+    .finally(() => {
+      if (node._reiExtensionsAbort === controller) {
+        node._reiExtensionsAbort = null;
+      }
     });
 }
 
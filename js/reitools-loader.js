@@ -3,7 +3,9 @@
  * 这个文件负责在ComfyUI中加载React组件
  */
 import { app } from '/scripts/app.js';
+import { api } from '/scripts/api.js';
 window.comfyUIAPP = app;
+window.comfyUIAPI = api;
 (function () {
   'use strict';
 
@@ -0,0 +1,243 @@
+"""
+预设的内容寻址存储
+设置环境变量 REI_PRESET_STORAGE=blobs 后，保存预设时 content 被拆分为压缩的 blob
+（以未压缩内容的 sha256 命名，安装了 zstandard 时使用 zstd，否则使用 gzip），
+预设文件只保存元数据和 blob 引用。相同的子文档（如工作流中相同的节点）只保存一份。
+两种格式的预设文件都可以读取，切换存储方式后旧文件在下次保存时转换。
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 选择预设存储方式的环境变量，取值为 file（默认）或 blobs
+STORAGE_ENV = 'REI_PRESET_STORAGE'
+
+# blob 目录（位于预设目录下，以点开头的目录不会被当作预设）
+BLOBS_DIRNAME = '.blobs'
+
+# 编码后小于该字节数的子文档直接内联在上一级中，不单独保存为 blob
+BLOB_MIN_SIZE = 1024
+
+# 修改时间距今不足该秒数的 blob 不会被清理，避免删除正在保存的预设刚写入的 blob
+BLOB_GC_GRACE_SECONDS = 600
+
+# blob 引用的格式：{"$rei_blob": "<sha256>"}
+BLOB_REF_KEY = '$rei_blob'
+
+# 预设内容中只有一个键且键为 BLOB_REF_KEY 或 LITERAL_KEY 的对象保存为 {"$rei_literal": 原对象}，
+# 避免被当作 blob 引用
+LITERAL_KEY = '$rei_literal'
+
+_DIGEST_RE = re.compile(r'[0-9a-f]{64}')
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 10
+
+
+def blob_storage_enabled():
+    """是否使用 blob 方式保存预设"""
+    return os.environ.get(STORAGE_ENV, 'file').lower() == 'blobs'
+
+
+def is_manifest(preset_data):
+    """预设文件是否为 blob 方式保存的清单"""
+    return isinstance(preset_data, dict) and 'content_ref' in preset_data
+
+
+def _encode(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _is_reserved(value):
+    return isinstance(value, dict) and len(value) == 1 and (BLOB_REF_KEY in value or LITERAL_KEY in value)
+
+
+class BlobStore:
+    """
+    预设目录下的 blob 存储
+
+    blob 保存在 .blobs/<哈希前两位>/<哈希>.zst 或 .gz 中，内容是子文档的紧凑 JSON，
+    其中较大的下级子文档被替换为 blob 引用。
+    """
+
+    def __init__(self, presets_dir):
+        self.root = os.path.join(presets_dir, BLOBS_DIRNAME)
+
+    def _path(self, digest, suffix):
+        if not isinstance(digest, str) or not _DIGEST_RE.fullmatch(digest):
+            raise ValueError(f"无效的 blob 哈希: {digest!r}")
+        return os.path.join(self.root, digest[:2], digest + suffix)
+
+    def put(self, raw):
+        """保存 blob，已存在时只更新修改时间，返回 sha256"""
+        digest = hashlib.sha256(raw).hexdigest()
+        for suffix in ('.zst', '.gz'):
+            path = self._path(digest, suffix)
+            try:
+                # 刷新修改时间，避免刚被复用的 blob 在清理的保护期之外被删除
+                os.utime(path)
+                return digest
+            except FileNotFoundError:
+                continue
+        if zstandard is not None:
+            path = self._path(digest, '.zst')
+            data = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+        else:
+            path = self._path(digest, '.gz')
+            data = gzip.compress(raw, compresslevel=GZIP_LEVEL, mtime=0)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return digest
+
+    def get(self, digest):
+        """
+        读取 blob 的原始内容
+
+        Raises:
+            FileNotFoundError: blob 不存在
+            ValueError: 哈希不是 64 位小写十六进制
+        """
+        try:
+            with open(self._path(digest, '.zst'), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            with open(self._path(digest, '.gz'), 'rb') as f:
+                return gzip.decompress(f.read())
+        if zstandard is None:
+            raise IOError(f"blob {digest} 使用 zstd 压缩，需要安装 zstandard")
+        return zstandard.ZstdDecompressor().decompress(data)
+
+    def store_tree(self, value, digests):
+        """
+        自底向上保存值：编码后不小于 BLOB_MIN_SIZE 的子文档保存为 blob
+
+        Args:
+            value: 任意 JSON 值
+            digests: 收集引用到的所有 blob 哈希的集合
+
+        Returns:
+            内联的值或 blob 引用
+        """
+        if isinstance(value, dict):
+            node = {key: self.store_tree(item, digests) for key, item in value.items()}
+            if _is_reserved(value):
+                node = {LITERAL_KEY: node}
+        elif isinstance(value, list):
+            node = [self.store_tree(item, digests) for item in value]
+        else:
+            node = value
+        raw = _encode(node)
+        if len(raw) < BLOB_MIN_SIZE:
+            return node
+        digest = self.put(raw)
+        digests.add(digest)
+        return {BLOB_REF_KEY: digest}
+
+    def load_tree(self, node, cache=None):
+        """
+        将 store_tree 的结果还原为原始值，cache 用于复用同一次读取中重复的 blob
+
+        Raises:
+            ValueError: blob 引用或转义对象无效
+        """
+        if cache is None:
+            cache = {}
+        if _is_reserved(node):
+            if LITERAL_KEY in node:
+                literal = node[LITERAL_KEY]
+                if not isinstance(literal, dict):
+                    raise ValueError(f"无效的 {LITERAL_KEY} 对象")
+                return {key: self.load_tree(item, cache) for key, item in literal.items()}
+            digest = node[BLOB_REF_KEY]
+            if digest not in cache:
+                cache[digest] = self.load_tree(json.loads(self.get(digest)), cache)
+            return cache[digest]
+        if isinstance(node, dict):
+            return {key: self.load_tree(item, cache) for key, item in node.items()}
+        if isinstance(node, list):
+            return [self.load_tree(item, cache) for item in node]
+        return node
+
+    def collect_garbage(self, referenced):
+        """
+        删除未被引用的 blob（修改时间在 BLOB_GC_GRACE_SECONDS 之内的除外）
+
+        Args:
+            referenced: 仍被引用的 blob 哈希集合
+
+        Returns:
+            删除的 blob 数量
+        """
+        removed = 0
+        expire_before = time.time() - BLOB_GC_GRACE_SECONDS
+        try:
+            shards = os.listdir(self.root)
+        except FileNotFoundError:
+            return 0
+        for shard in shards:
+            shard_path = os.path.join(self.root, shard)
+            try:
+                entries = list(os.scandir(shard_path))
+            except (NotADirectoryError, FileNotFoundError):
+                continue
+            for entry in entries:
+                digest = entry.name.split('.', 1)[0]
+                if digest in referenced:
+                    continue
+                try:
+                    if entry.stat().st_mtime >= expire_before:
+                        continue
+                    os.remove(entry.path)
+                    removed += 1
+                except OSError:
+                    continue
+        return removed
+
+
+def build_manifest(preset_data, store):
+    """
+    将预设的 content 保存到 blob 存储，返回写入预设文件的清单
+
+    清单中 content 被替换为 content_ref（content 的内联值或 blob 引用，字段顺序不变），
+    并增加 blobs：引用到的所有 blob 哈希（清理 blob 时使用，无需读取 blob）
+    """
+    digests = set()
+    manifest = {}
+    for key, value in preset_data.items():
+        if key == 'content':
+            manifest['content_ref'] = store.store_tree(value, digests)
+        else:
+            manifest[key] = value
+    manifest.setdefault('content_ref', None)
+    manifest['blobs'] = sorted(digests)
+    return manifest
+
+
+def expand_manifest(manifest, store, with_content=True):
+    """将清单还原为预设数据（with_content 为 False 时不读取 blob，content 为 None）"""
+    preset_data = {}
+    for key, value in manifest.items():
+        if key == 'content_ref':
+            preset_data['content'] = store.load_tree(value) if with_content else None
+        elif key != 'blobs':
+            preset_data[key] = value
+    return preset_data
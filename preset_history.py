@@ -0,0 +1,263 @@
+"""
+预设的修订历史
+每次保存预设时记录一个修订版本：大多数版本只保存相对上一版本的 JSON Patch（RFC 6902）增量，
+每隔 SNAPSHOT_INTERVAL 个版本保存一次完整快照，读取任意版本最多需要应用
+SNAPSHOT_INTERVAL - 1 个增量。
+
+历史保存在 presets/.history/<预设名>/ 中：
+    log.jsonl                      每行一个版本的元数据
+    <版本号>.snapshot.json.gz      完整快照
+    <版本号>.delta.json.gz         相对上一版本的增量
+"""
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+
+# 历史目录（位于预设目录下，以点开头的目录不会被当作预设）
+HISTORY_DIRNAME = '.history'
+
+# 每隔多少个版本保存一次完整快照
+SNAPSHOT_INTERVAL = 10
+
+# 增量编码后超过完整内容的该比例时，直接保存快照
+MAX_DELTA_RATIO = 0.5
+
+_locks = {}
+_locks_lock = threading.Lock()
+
+
+def _encode(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _escape(key):
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+
+def _unescape(token):
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def _same(old, new):
+    """
+    严格比较两个 JSON 值：任意层级中 bool/int/float 类型不同（Python 中 1 == True、7 == 7.0）
+    或对象的键顺序不同都视为不相等
+    """
+    if type(old) is not type(new) or old != new:
+        return False
+    if isinstance(old, dict):
+        return list(old) == list(new) and all(_same(value, new[key]) for key, value in old.items())
+    if isinstance(old, list):
+        return all(_same(a, b) for a, b in zip(old, new))
+    return True
+
+
+def make_patch(old, new):
+    """
+    生成将 old 变为 new 的 JSON Patch（只使用 add/remove/replace）
+
+    列表先去掉相同的前缀和后缀，中间部分逐项比较，多出的元素按位置删除或添加，
+    因此在工作流中追加、删除或修改节点都只产生很小的增量。
+    对象新增的键在应用时追加到末尾；键的顺序无法这样还原时（中间插入或重新排序）整体替换该对象。
+    """
+    ops = []
+    _diff(old, new, '', ops)
+    return ops
+
+
+def _diff(old, new, path, ops):
+    if _same(old, new):
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        kept = [key for key in old if key in new]
+        added = [key for key in new if key not in old]
+        if list(new) != kept + added:
+            ops.append({'op': 'replace', 'path': path, 'value': new})
+            return
+        for key in old:
+            if key not in new:
+                ops.append({'op': 'remove', 'path': f'{path}/{_escape(key)}'})
+        for key, value in new.items():
+            if key in old:
+                _diff(old[key], value, f'{path}/{_escape(key)}', ops)
+            else:
+                ops.append({'op': 'add', 'path': f'{path}/{_escape(key)}', 'value': value})
+    elif isinstance(old, list) and isinstance(new, list):
+        limit = min(len(old), len(new))
+        prefix = 0
+        while prefix < limit and _same(old[prefix], new[prefix]):
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and _same(old[-1 - suffix], new[-1 - suffix]):
+            suffix += 1
+        old_count = len(old) - prefix - suffix
+        new_count = len(new) - prefix - suffix
+        common = min(old_count, new_count)
+        for i in range(prefix, prefix + common):
+            _diff(old[i], new[i], f'{path}/{i}', ops)
+        # 从后往前删除，前面元素的下标不受影响
+        for i in range(prefix + old_count - 1, prefix + common - 1, -1):
+            ops.append({'op': 'remove', 'path': f'{path}/{i}'})
+        for i in range(prefix + common, prefix + new_count):
+            ops.append({'op': 'add', 'path': f'{path}/{i}', 'value': new[i]})
+    else:
+        ops.append({'op': 'replace', 'path': path, 'value': new})
+
+
+def apply_patch(document, ops):
+    """
+    将 JSON Patch 应用到 document（会直接修改 document），返回结果
+
+    Raises:
+        ValueError: 路径无效或操作不受支持
+    """
+    for op in ops:
+        tokens = [_unescape(token) for token in op['path'].split('/')[1:]]
+        if not tokens:
+            if op['op'] not in ('add', 'replace'):
+                raise ValueError(f"无法对根节点执行 {op['op']}")
+            document = op['value']
+            continue
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            index = len(parent) if last == '-' else int(last)
+            if op['op'] == 'add':
+                parent.insert(index, op['value'])
+            elif op['op'] == 'remove':
+                del parent[index]
+            elif op['op'] == 'replace':
+                parent[index] = op['value']
+            else:
+                raise ValueError(f"不支持的操作: {op['op']}")
+        elif isinstance(parent, dict):
+            if op['op'] in ('add', 'replace'):
+                parent[last] = op['value']
+            elif op['op'] == 'remove':
+                del parent[last]
+            else:
+                raise ValueError(f"不支持的操作: {op['op']}")
+        else:
+            raise ValueError(f"路径无效: {op['path']}")
+    return document
+
+
+class PresetHistory:
+    """单个预设的修订历史"""
+
+    def __init__(self, presets_dir, preset_name):
+        self.preset_name = preset_name
+        self.root = os.path.join(presets_dir, HISTORY_DIRNAME, preset_name)
+        self.log_path = os.path.join(self.root, 'log.jsonl')
+        with _locks_lock:
+            # 同一预设的保存和历史记录需要串行执行
+            self.lock = _locks.setdefault(self.root, threading.RLock())
+
+    def revisions(self):
+        """
+        Returns:
+            版本元数据列表（按版本号升序）：
+            {"revision", "saved_at", "kind": "snapshot"|"delta", "sha256", "bytes"}
+        """
+        entries = []
+        try:
+            with open(self.log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        # 写到一半的行（例如进程被中断）
+                        continue
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _data_path(self, revision, kind):
+        return os.path.join(self.root, f'{revision:06d}.{kind}.json.gz')
+
+    def _read_data(self, revision, kind):
+        with open(self._data_path(revision, kind), 'rb') as f:
+            return json.loads(gzip.decompress(f.read()))
+
+    def _write_data(self, revision, kind, raw):
+        path = self._data_path(revision, kind)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(gzip.compress(raw, mtime=0))
+        os.replace(tmp_path, path)
+        return os.path.getsize(path)
+
+    def _append(self, entries, preset_data, raw, base=None):
+        """记录一个新版本（调用方需持有锁），base 为上一版本的数据"""
+        revision = entries[-1]['revision'] + 1 if entries else 1
+        last_snapshot = max(
+            (entry['revision'] for entry in entries if entry['kind'] == 'snapshot'), default=0)
+        kind = 'snapshot'
+        data = raw
+        if base is not None and last_snapshot and revision - last_snapshot < SNAPSHOT_INTERVAL:
+            delta = _encode(make_patch(base, preset_data))
+            if len(delta) <= len(raw) * MAX_DELTA_RATIO:
+                kind = 'delta'
+                data = delta
+        os.makedirs(self.root, exist_ok=True)
+        entry = {
+            'revision': revision,
+            'saved_at': preset_data.get('updated_at') or datetime.now().isoformat(),
+            'kind': kind,
+            'sha256': hashlib.sha256(raw).hexdigest(),
+            'bytes': self._write_data(revision, kind, data),
+        }
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        entries.append(entry)
+        return entry
+
+    def record(self, preset_data, previous=None):
+        """
+        记录新保存的版本
+
+        Args:
+            preset_data: 新保存的预设数据
+            previous: 保存前磁盘上的预设数据（不存在时为 None）。与最后一个版本不一致时
+                （例如在历史功能启用前保存、或被手动修改过），先将其记录为一个版本
+
+        Returns:
+            新版本的元数据
+        """
+        with self.lock:
+            entries = self.revisions()
+            if previous is not None:
+                previous_raw = _encode(previous)
+                if not entries or entries[-1]['sha256'] != hashlib.sha256(previous_raw).hexdigest():
+                    base = self._get(entries, entries[-1]['revision']) if entries else None
+                    self._append(entries, previous, previous_raw, base)
+            return self._append(entries, preset_data, _encode(preset_data), base=previous)
+
+    def _get(self, entries, revision):
+        target = next((entry for entry in entries if entry['revision'] == revision), None)
+        if target is None:
+            return None
+        snapshot = max(
+            entry['revision'] for entry in entries
+            if entry['kind'] == 'snapshot' and entry['revision'] <= revision)
+        document = self._read_data(snapshot, 'snapshot')
+        for entry in entries:
+            if snapshot < entry['revision'] <= revision:
+                document = apply_patch(document, self._read_data(entry['revision'], 'delta'))
+        return document
+
+    def get(self, revision):
+        """读取指定版本的完整预设数据，版本不存在时返回 None"""
+        with self.lock:
+            return self._get(self.revisions(), revision)
+
+    def delete(self):
+        """删除该预设的全部历史"""
+        with self.lock:
+            shutil.rmtree(self.root, ignore_errors=True)
@@ -0,0 +1,362 @@
+"""
+预设元数据索引
+为预设目录维护 “文件名 → 列表字段” 的索引，并持久化到磁盘。
+列出预设时只 stat 每个文件，mtime/size 未变化的预设直接使用索引中的摘要，
+只有新增或修改过的预设才会被完整解析。
+索引同时记录 content 字段在文件中的字节范围，读取其他字段时可以跳过 content，
+只返回 content 时可以直接发送文件中的原始字节。
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from .preset_blobs import BlobStore, is_manifest, expand_manifest
+
+# 索引文件的存放目录
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'preset_index')
+
+# 索引格式版本，格式变化时递增以丢弃旧索引
+INDEX_VERSION = 3
+
+# 内存中最多保留的预设目录索引数量
+MAX_CACHED_INDEXES = 4
+
+# mtime 距扫描开始不足该时长（纳秒）的文件不视为稳定，下次列出时会重新解析，
+# 避免同一时间精度内的修改被漏掉
+MTIME_GRACE_NS = 2_000_000_000
+
+# 定位 content 字段时用来替换 content 的标记值
+_CONTENT_MARKER = '\x00rei-preset-content\x00'
+
+_indexes = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def preset_summary(preset_name, preset_data):
+    """预设的摘要信息（列表和变更事件中使用）"""
+    return {
+        'name': preset_name,
+        'filename': f'{preset_name}.json',
+        'title': preset_data.get('title', preset_name),
+        'description': preset_data.get('description', ''),
+        'created_at': preset_data.get('created_at', ''),
+        'updated_at': preset_data.get('updated_at', '')
+    }
+
+
+def encode_preset(preset_data):
+    """将预设编码为写入文件的字节（与历史版本一致：indent=2，不转义中文）"""
+    return json.dumps(preset_data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def content_span(raw, preset_data):
+    """
+    计算 content 字段的值在预设文件中的字节范围
+
+    将 content 替换为标记值后重新编码元数据，文件内容与编码结果的前缀、后缀都一致时，
+    中间部分就是 content 的编码。手动编辑过格式的文件无法定位，返回 None。
+
+    Args:
+        raw: 预设文件的字节
+        preset_data: 解析后的预设
+
+    Returns:
+        [起始偏移, 结束偏移] 或 None
+    """
+    if not isinstance(preset_data, dict) or 'content' not in preset_data:
+        return None
+    marked = encode_preset({**preset_data, 'content': _CONTENT_MARKER})
+    encoded_marker = json.dumps(_CONTENT_MARKER).encode('utf-8')
+    if marked.count(encoded_marker) != 1:
+        return None
+    prefix, _, suffix = marked.partition(encoded_marker)
+    if len(raw) < len(prefix) + len(suffix) or not raw.startswith(prefix) or not raw.endswith(suffix):
+        return None
+    return [len(prefix), len(raw) - len(suffix)]
+
+
+class PresetIndex:
+    """
+    单个预设目录的元数据索引
+
+    每个预设文件保存一条记录：
+        {"mtime_ns": int, "size": int, "stable": bool, "summary": {...} 或 None,
+         "content_span": [起始偏移, 结束偏移] 或 None, "blobs": [blob 哈希, ...] 或 None}
+    blobs 只在预设文件为 blob 存储的清单时存在（见 preset_blobs）。
+    summary 为 None 表示文件无法解析，文件变化前不再重复解析；
+    stable 为 False 的记录（mtime 距离扫描时间太近）在下次列出时会重新解析。
+    """
+
+    def __init__(self, presets_dir):
+        self.presets_dir = presets_dir
+        self.index_path = os.path.join(
+            CACHE_DIR, hashlib.sha1(presets_dir.encode('utf-8', 'surrogatepass')).hexdigest() + '.json')
+        self._files = {}
+        # 记录每次变化时递增，用于判断依赖索引的数据（如搜索索引）是否需要同步
+        self.generation = 0
+        # 文件名 -> 最后一次变化时的 generation，按变化顺序排列
+        self._changes = OrderedDict()
+        # 早于该 generation 的变化记录已被清理，只能返回完整列表
+        self._forgotten = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == INDEX_VERSION and data.get('presets_dir') == self.presets_dir:
+            self._files = data.get('files', {})
+
+    def _save(self):
+        data = {'version': INDEX_VERSION, 'presets_dir': self.presets_dir, 'files': self._files}
+        tmp_path = f'{self.index_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"[ReiTools] 无法写入预设索引 {self.index_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _record(st, summary, span, blobs, stable_before):
+        return {
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'stable': st.st_mtime_ns < stable_before,
+            'summary': summary,
+            'content_span': span,
+            'blobs': blobs,
+        }
+
+    @staticmethod
+    def _parse(raw, filename):
+        """
+        解析预设文件的摘要、content 的字节范围和引用的 blob，
+        无法解析时返回 (None, None, None)
+        """
+        try:
+            preset_data = json.loads(raw)
+            if not isinstance(preset_data, dict):
+                raise ValueError('预设内容不是 JSON 对象')
+        except ValueError as e:
+            print(f"[ReiTools] 无法读取预设文件 {filename}: {e}")
+            return None, None, None
+        blobs = preset_data.get('blobs') if is_manifest(preset_data) else None
+        return (preset_summary(os.path.splitext(filename)[0], preset_data),
+                content_span(raw, preset_data), blobs)
+
+    @staticmethod
+    def _is_current(record, st):
+        return (record is not None and record['stable']
+                and record['mtime_ns'] == st.st_mtime_ns and record['size'] == st.st_size)
+
+    def refresh(self):
+        """与磁盘同步索引，只重新解析 mtime/size 变化过的预设文件"""
+        with self._lock:
+            stable_before = time.time_ns() - MTIME_GRACE_NS
+            old_files = self._files
+            new_files = {}
+            changed = []
+            with os.scandir(self.presets_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.json'):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    record = old_files.get(entry.name)
+                    if not self._is_current(record, st):
+                        try:
+                            with open(entry.path, 'rb') as f:
+                                raw = f.read()
+                        except OSError as e:
+                            print(f"[ReiTools] 无法读取预设文件 {entry.name}: {e}")
+                            continue
+                        record = self._record(st, *self._parse(raw, entry.name), stable_before)
+                        changed.append(entry.name)
+                    new_files[entry.name] = record
+
+            changed.extend(filename for filename in old_files if filename not in new_files)
+            if changed:
+                self._files = new_files
+                self._mark_changed(changed)
+                self._save()
+        return self
+
+    def update(self, filename, preset_data, span=None, blobs=None):
+        """
+        预设文件写入后直接更新对应的记录，不需要重新解析文件，返回新的记录
+        preset_data 为预设数据（不是清单），blobs 为写入的清单引用的 blob
+        """
+        path = os.path.join(self.presets_dir, filename)
+        with self._lock:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return
+            summary = preset_summary(os.path.splitext(filename)[0], preset_data)
+            record = self._record(st, summary, span, blobs, time.time_ns() - MTIME_GRACE_NS)
+            self._files[filename] = record
+            self._mark_changed([filename])
+            self._save()
+            return record
+
+    def remove(self, filename):
+        """预设文件删除后移除对应的记录"""
+        with self._lock:
+            if self._files.pop(filename, None) is not None:
+                self._mark_changed([filename])
+                self._save()
+
+    def open_preset(self, filename):
+        """
+        打开预设文件，并返回与打开的文件一致的索引记录（文件变化过时重新解析）
+
+        Returns:
+            (二进制文件对象, 记录)，文件不存在时返回 None；调用方负责关闭文件
+        """
+        try:
+            f = open(os.path.join(self.presets_dir, filename), 'rb')
+        except FileNotFoundError:
+            return None
+        try:
+            st = os.fstat(f.fileno())
+            with self._lock:
+                record = self._files.get(filename)
+                if not self._is_current(record, st):
+                    raw = f.read()
+                    record = self._record(st, *self._parse(raw, filename), time.time_ns() - MTIME_GRACE_NS)
+                    self._files[filename] = record
+                    self._mark_changed([filename])
+                    self._save()
+            return f, record
+        except BaseException:
+            f.close()
+            raise
+
+    def read_preset(self, filename, fields=None):
+        """
+        读取预设
+
+        Args:
+            filename: 预设文件名
+            fields: 只返回这些字段，None 表示全部。不包含 content 且能定位 content 时，
+                只读取并解析 content 之外的部分；不包含 content 的清单不会读取 blob
+
+        Returns:
+            预设字典，文件不存在时返回 None
+
+        Raises:
+            ValueError: 文件不是有效的 JSON
+        """
+        opened = self.open_preset(filename)
+        if opened is None:
+            return None
+        f, record = opened
+        with f:
+            span = record['content_span']
+            if fields is not None and 'content' not in fields and span is not None:
+                start, end = span
+                f.seek(0)
+                head = f.read(start)
+                f.seek(end)
+                preset_data = json.loads(head + b'null' + f.read())
+            else:
+                f.seek(0)
+                preset_data = json.loads(f.read())
+        if is_manifest(preset_data):
+            preset_data = expand_manifest(
+                preset_data, BlobStore(self.presets_dir), with_content=fields is None or 'content' in fields)
+        if fields is not None and isinstance(preset_data, dict):
+            preset_data = {field: preset_data[field] for field in fields if field in preset_data}
+        return preset_data
+
+    def referenced_blobs(self):
+        """所有预设清单引用的 blob 哈希集合"""
+        with self._lock:
+            return {digest for record in self._files.values() for digest in record.get('blobs') or ()}
+
+    def _mark_changed(self, filenames):
+        """递增 generation 并记录变化的文件（调用方需持有锁）"""
+        self.generation += 1
+        for filename in filenames:
+            self._changes[filename] = self.generation
+            self._changes.move_to_end(filename)
+        # 已删除文件的变化记录不需要一直保留
+        if len(self._changes) > 2 * len(self._files) + 1000:
+            self._changes = OrderedDict(
+                (filename, generation) for filename, generation in self._changes.items()
+                if filename in self._files)
+            self._forgotten = self.generation
+
+    def changes_since(self, generation=None):
+        """
+        获取自 generation 以来变化过的预设记录
+
+        Returns:
+            (当前 generation, {文件名: 记录或 None（已删除）}, 是否为完整列表)。
+            generation 为 None 或早于可追溯的范围时返回完整列表，
+            调用方应丢弃列表中没有出现的文件
+        """
+        with self._lock:
+            if generation is None or generation < self._forgotten:
+                return self.generation, dict(self._files), True
+            changes = {}
+            for filename in reversed(self._changes):
+                if self._changes[filename] <= generation:
+                    break
+                changes[filename] = self._files.get(filename)
+            return self.generation, changes, False
+
+    def presets(self):
+        """
+        Returns:
+            所有可解析预设的摘要列表（包含 size 和 modified），按修改时间倒序
+        """
+        with self._lock:
+            result = [
+                {
+                    **record['summary'],
+                    'size': record['size'],
+                    'modified': record['mtime_ns'] / 1e9,
+                }
+                for record in self._files.values()
+                if record['summary'] is not None
+            ]
+        result.sort(key=lambda x: x['modified'], reverse=True)
+        return result
+
+
+def get_preset_index(presets_dir, refresh=True):
+    """
+    获取预设目录的元数据索引
+
+    Args:
+        presets_dir: 预设目录的绝对路径（需要已存在）
+        refresh: 是否先与磁盘同步
+    """
+    presets_dir = os.path.abspath(presets_dir)
+    with _indexes_lock:
+        index = _indexes.get(presets_dir)
+        if index is None:
+            index = PresetIndex(presets_dir)
+            _indexes[presets_dir] = index
+            while len(_indexes) > MAX_CACHED_INDEXES:
+                _indexes.popitem(last=False)
+        else:
+            _indexes.move_to_end(presets_dir)
+    return index.refresh() if refresh else index
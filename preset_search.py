@@ -0,0 +1,344 @@
+"""
+预设搜索
+在内存中为预设的 title/description/tags/author 以及 content 中的文本（如提示词、模型路径）
+建立倒排索引。保存和删除预设时增量更新，其他变化（如手动复制进目录的预设）
+在预设索引下次与磁盘同步（列出预设）后按文件的 mtime/size 增量同步。
+"""
+import bisect
+import heapq
+import math
+import os
+import re
+import threading
+from operator import itemgetter
+
+# 各字段命中时的权重
+FIELD_WEIGHTS = {
+    'title': 5.0,
+    'tags': 4.0,
+    'author': 2.0,
+    'description': 2.0,
+    'content': 1.0,
+}
+
+# 每个预设最多索引的 content 文本字符数
+MAX_CONTENT_TEXT = 20000
+
+# 超过该长度的词不建立索引（通常是 base64 等无意义的长串）
+MAX_TERM_LENGTH = 64
+
+# 查询词作为前缀时最多扩展的词数；前缀命中的得分按 PREFIX_FACTOR 折算
+MAX_PREFIX_EXPANSIONS = 50
+PREFIX_FACTOR = 0.5
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# 中日韩文字没有空格分词，按单字和相邻两字建立索引
+_CJK = '\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af'
+_TOKEN_RE = re.compile(f'([^\\W{_CJK}]+)|([{_CJK}]+)')
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def _tokens(text):
+    """文档分词：普通词整体作为一个词，中日韩文字生成单字和两字词"""
+    for match in _TOKEN_RE.finditer(text.lower()):
+        word, cjk = match.groups()
+        if word:
+            if len(word) <= MAX_TERM_LENGTH:
+                yield word
+        else:
+            yield from cjk
+            for i in range(len(cjk) - 1):
+                yield cjk[i:i + 2]
+
+
+def _query_terms(text):
+    """
+    查询分词：中日韩文字只使用两字词（单个字时使用单字），结果去重
+    只有最后一个词是长度不小于 2 的普通词时才允许前缀匹配（用户可能还没输入完）
+    Returns:
+        [(词, 是否允许前缀匹配), ...]
+    """
+    terms = {}
+    last = None
+    for match in _TOKEN_RE.finditer(text.lower()):
+        word, cjk = match.groups()
+        if word:
+            last = word[:MAX_TERM_LENGTH] if len(word) >= 2 else None
+            terms.setdefault(word[:MAX_TERM_LENGTH], False)
+        else:
+            last = None
+            if len(cjk) == 1:
+                terms.setdefault(cjk, False)
+            else:
+                for i in range(len(cjk) - 1):
+                    terms.setdefault(cjk[i:i + 2], False)
+    if last is not None:
+        terms[last] = True
+    return list(terms.items())
+
+
+def _content_text(value, parts, budget):
+    """收集 content 中的字符串（深度优先），总长度不超过 budget，返回剩余额度"""
+    if budget <= 0:
+        return budget
+    if isinstance(value, str):
+        parts.append(value[:budget])
+        return budget - len(parts[-1])
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, list):
+        return budget
+    for item in value:
+        budget = _content_text(item, parts, budget)
+        if budget <= 0:
+            break
+    return budget
+
+
+def _document_terms(preset_data):
+    """计算预设的 {词: 权重}，同一字段中重复出现的词按对数累加"""
+    tags = preset_data.get('tags')
+    fields = {
+        'title': str(preset_data.get('title', '')),
+        'tags': ' '.join(str(tag) for tag in tags) if isinstance(tags, list) else '',
+        'author': str(preset_data.get('author', '')),
+        'description': str(preset_data.get('description', '')),
+    }
+    parts = []
+    _content_text(preset_data.get('content'), parts, MAX_CONTENT_TEXT)
+    fields['content'] = ' '.join(parts)
+
+    terms = {}
+    for field, text in fields.items():
+        counts = {}
+        for term in _tokens(text):
+            counts[term] = counts.get(term, 0) + 1
+        weight = FIELD_WEIGHTS[field]
+        for term, count in counts.items():
+            terms[term] = terms.get(term, 0.0) + weight * (1 + math.log(count))
+    return terms
+
+
+class PresetSearchIndex:
+    """
+    单个预设目录的倒排索引
+
+    _postings: {词: {文件名: 权重}}
+    _docs: {文件名: {"signature": (mtime_ns, size), "terms": {...}, "tags": {...}, "result": {...}}}
+    _vocabulary: 有序的词列表，用于前缀匹配
+    _recent: 按修改时间倒序排列的 (-mtime_ns, 文件名)，用于没有查询词时的排序
+    两个有序列表在批量同步期间为 None，结束后重新排序一次
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings = {}
+        self._tags = {}
+        self._docs = {}
+        self._vocabulary = []
+        self._recent = []
+        # 最近一次同步时预设索引的 generation，None 表示尚未建立
+        self._generation = None
+
+    def _remove(self, filename):
+        doc = self._docs.pop(filename, None)
+        if doc is None:
+            return
+        for term in doc['terms']:
+            postings = self._postings[term]
+            del postings[filename]
+            if not postings:
+                del self._postings[term]
+                if self._vocabulary is not None:
+                    del self._vocabulary[bisect.bisect_left(self._vocabulary, term)]
+        if self._recent is not None:
+            del self._recent[bisect.bisect_left(self._recent, doc['order'])]
+        for tag in doc['tags']:
+            names = self._tags[tag]
+            names.discard(filename)
+            if not names:
+                del self._tags[tag]
+
+    def _add(self, filename, preset_data, record):
+        self._remove(filename)
+        terms = _document_terms(preset_data)
+        for term, weight in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                if self._vocabulary is not None:
+                    bisect.insort(self._vocabulary, term)
+            postings[filename] = weight
+        tags = preset_data.get('tags')
+        tags = [str(tag) for tag in tags] if isinstance(tags, list) else []
+        tag_keys = {tag.lower() for tag in tags}
+        for tag in tag_keys:
+            self._tags.setdefault(tag, set()).add(filename)
+        order = (-record['mtime_ns'], filename)
+        if self._recent is not None:
+            bisect.insort(self._recent, order)
+        self._docs[filename] = {
+            'signature': (record['mtime_ns'], record['size']),
+            'order': order,
+            'terms': terms,
+            'tags': tag_keys,
+            'result': {
+                **record['summary'],
+                'tags': tags,
+                'author': str(preset_data.get('author', '')),
+                'size': record['size'],
+                'modified': record['mtime_ns'] / 1e9,
+            },
+        }
+
+    def _sorted_lists(self):
+        """批量同步后重建有序列表"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        if self._recent is None:
+            self._recent = sorted(doc['order'] for doc in self._docs.values())
+
+    @property
+    def ready(self):
+        """是否已经与预设索引同步过（首次搜索前需要先让预设索引与磁盘同步）"""
+        return self._generation is not None
+
+    def update(self, filename, preset_data, record):
+        """预设保存后使用已有的预设数据更新索引（record 为预设索引中的新记录）"""
+        with self._lock:
+            if record is None or record['summary'] is None:
+                self._remove(filename)
+            else:
+                self._add(filename, preset_data, record)
+
+    def remove(self, filename):
+        """预设删除后移除索引"""
+        with self._lock:
+            self._remove(filename)
+
+    def sync(self, preset_index):
+        """
+        与预设索引同步：只处理预设索引中自上次同步以来变化过的记录，
+        并且只重新读取 mtime/size 与已索引版本不同的预设
+        """
+        if preset_index.generation == self._generation:
+            return
+        generation, records, full = preset_index.changes_since(self._generation)
+        with self._lock:
+            removed = [
+                filename for filename, record in records.items()
+                if record is None or record['summary'] is None
+            ]
+            if full:
+                removed.extend(filename for filename in self._docs if filename not in records)
+            for filename in removed:
+                self._remove(filename)
+            stale = [
+                filename for filename, record in records.items()
+                if record is not None and record['summary'] is not None
+                and (filename not in self._docs
+                     or self._docs[filename]['signature'] != (record['mtime_ns'], record['size']))
+            ]
+        for filename in stale:
+            try:
+                preset_data = preset_index.read_preset(filename)
+            except (OSError, ValueError) as e:
+                print(f"[ReiTools] 无法为预设 {filename} 建立搜索索引: {e}")
+                continue
+            if isinstance(preset_data, dict):
+                with self._lock:
+                    if len(stale) > 1:
+                        # 批量添加时逐个插入有序列表的开销是平方级的，结束后统一排序
+                        self._vocabulary = None
+                        self._recent = None
+                    self._add(filename, preset_data, records[filename])
+        with self._lock:
+            self._sorted_lists()
+            self._generation = generation
+
+    def _match(self, term, prefix):
+        """返回词（以及前缀扩展出的词）命中的 {文件名: 得分}"""
+        total = len(self._docs)
+        matched = [(term, 1.0)] if term in self._postings else []
+        if prefix:
+            self._sorted_lists()
+            start = bisect.bisect_right(self._vocabulary, term)
+            for candidate in self._vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+                if not candidate.startswith(term):
+                    break
+                matched.append((candidate, PREFIX_FACTOR))
+        scores = {}
+        for candidate, factor in matched:
+            postings = self._postings[candidate]
+            idf = math.log(1 + total / len(postings)) * factor
+            for filename, weight in postings.items():
+                score = idf * weight
+                if score > scores.get(filename, 0.0):
+                    scores[filename] = score
+        return scores
+
+    def search(self, query='', tags=(), offset=0, limit=DEFAULT_PAGE_SIZE):
+        """
+        搜索预设
+
+        所有查询词都需要命中（最后的词可以是前缀），tags 中的标签都需要存在（不区分大小写）。
+        有查询词时按相关度排序，否则按修改时间倒序。
+
+        Returns:
+            (总数, 当前页的结果列表)
+        """
+        with self._lock:
+            candidates = None
+            for tag in tags:
+                names = self._tags.get(tag.lower(), set())
+                candidates = set(names) if candidates is None else candidates & names
+
+            terms = _query_terms(query)
+            if terms:
+                scores = None
+                # 从命中最少的词开始求交集
+                for term_scores in sorted((self._match(term, prefix) for term, prefix in terms), key=len):
+                    if scores is None:
+                        scores = {
+                            name: score for name, score in term_scores.items()
+                            if candidates is None or name in candidates
+                        }
+                    else:
+                        scores = {
+                            name: score + term_scores[name] for name, score in scores.items()
+                            if name in term_scores
+                        }
+                    if not scores:
+                        break
+                scores = scores or {}
+                total = len(scores)
+                # 只需要排出当前页之前的部分
+                page = heapq.nlargest(offset + limit, scores.items(), key=itemgetter(1))[offset:]
+            else:
+                self._sorted_lists()
+                if candidates is None:
+                    orders = self._recent
+                else:
+                    orders = sorted(self._docs[name]['order'] for name in candidates)
+                total = len(orders)
+                page = [(name, None) for _, name in orders[offset:offset + limit]]
+
+            results = [
+                {**self._docs[name]['result'], 'score': round(score, 4) if score is not None else None}
+                for name, score in page
+            ]
+            return total, results
+
+
+def get_search_index(presets_dir):
+    """获取预设目录的搜索索引（未与预设索引同步）"""
+    presets_dir = os.path.abspath(presets_dir)
+    with _indexes_lock:
+        index = _indexes.get(presets_dir)
+        if index is None:
+            index = _indexes[presets_dir] = PresetSearchIndex()
+        return index
@@ -1,27 +1,78 @@
+import asyncio
+import base64
 import json
 import os
+import stat
 from datetime import datetime
 from aiohttp import web
 from server import PromptServer
 import folder_paths
-from .utils import load_config, save_config
+from .utils import (
+    get_config_snapshot, get_config_changes, get_vault_params, add_config_listener,
+    modify_config, get_config_revision, check_config_revision, ConfigConflict, build_config_entry,
+)
+from .async_utils import run_blocking, CancelToken
+from .crypto_utils import rekey_tokens
+from .change_events import ChangeNotifier
+from .extension_index import get_extension_index, EXCLUDES as EXTENSION_INDEX_EXCLUDES
+from .preset_index import get_preset_index, preset_summary, encode_preset, content_span
+from .preset_search import get_search_index, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from .preset_blobs import BlobStore, blob_storage_enabled, build_manifest
+from .preset_history import PresetHistory
+from .fs_utils import (
+    get_access_checker, scan_directory, count_children, get_extension, check_cancelled,
+    SORT_FIELDS, decode_cursor, paginate_items, ListingCache,
+)
 
 # 获取路由实例
 routes = PromptServer.instance.routes
 
+# 目录列表缓存（按目录 mtime 校验）
+_listing_cache = ListingCache()
+
+# 配置和预设变更的 websocket 推送
+_change_notifier = ChangeNotifier(PromptServer.instance.send_sync)
+
+def _config_display_value(config_obj):
+    """提取配置项的值用于前端显示"""
+    if isinstance(config_obj, dict):
+        return config_obj.get("value", "")
+    # 兼容旧格式
+    return config_obj
+
+def _config_type_info(config_obj):
+    """提取配置项的类型信息"""
+    if isinstance(config_obj, dict):
+        return {
+            "type": config_obj.get("type", "string"),
+            "encrypted": config_obj.get("encrypted", False),
+            "revision": get_config_revision(config_obj)
+        }
+    # 兼容旧格式
+    return {
+        "type": "string",
+        "encrypted": False,
+        "revision": get_config_revision(config_obj)
+    }
+
+def _notify_config_changed(since, version, changed, deleted):
+    """配置变化时推送变化键的显示值和类型信息"""
+    _change_notifier.config_changed(
+        since, version,
+        {key: _config_display_value(config_obj) for key, config_obj in changed.items()},
+        {key: _config_type_info(config_obj) for key, config_obj in changed.items()},
+        deleted
+    )
+
+add_config_listener(_notify_config_changed)
+
 @routes.get('/api/rei/config/get_all')
 async def get_all_configs(request):
     """获取所有配置值"""
     try:
-        configs = load_config()
+        configs = get_config_snapshot()
         # 提取值用于前端显示
-        config_values = {}
-        for key, config_obj in configs.items():
-            if isinstance(config_obj, dict):
-                config_values[key] = config_obj.get("value", "")
-            else:
-                # 兼容旧格式
-                config_values[key] = config_obj
+        config_values = {key: _config_display_value(config_obj) for key, config_obj in configs.items()}
         return web.json_response(config_values)
     except Exception as e:
         print(f"[ReiConfig] 获取配置失败: {e}")
@@ -34,20 +85,8 @@ async def get_all_configs(request):
 async def get_config_types(request):
     """获取所有配置类型信息（从配置对象中提取）"""
     try:
-        configs = load_config()
-        types = {}
-        for key, config_obj in configs.items():
-            if isinstance(config_obj, dict):
-                types[key] = {
-                    "type": config_obj.get("type", "string"),
-                    "encrypted": config_obj.get("encrypted", False)
-                }
-            else:
-                # 兼容旧格式
-                types[key] = {
-                    "type": "string",
-                    "encrypted": False
-                }
+        configs = get_config_snapshot()
+        types = {key: _config_type_info(config_obj) for key, config_obj in configs.items()}
         return web.json_response(types)
     except Exception as e:
         print(f"[ReiConfig] 获取配置类型失败: {e}")
@@ -56,43 +95,227 @@ async def get_config_types(request):
             status=500
         )
 
+@routes.get('/api/rei/config/snapshot')
+async def get_config_snapshot_with_version(request):
+    """
+    同时获取配置值和类型信息，并附带版本号
+    带 ?since=<version> 时只返回该版本之后变化和删除的键（full 为 false）；
+    无法增量同步时（例如服务重启前的版本）返回完整配置（full 为 true）
+    返回: {"version": ..., "full": bool, "values": {...}, "types": {...}, "deleted": [...]}
+    """
+    since = request.query.get('since')
+    if since is not None:
+        try:
+            since = int(since)
+        except ValueError:
+            return web.json_response({"error": "since 必须是整数"}, status=400)
+    try:
+        version, full, changed, deleted = get_config_changes(since)
+        return web.json_response({
+            "version": version,
+            "full": full,
+            "values": {key: _config_display_value(config_obj) for key, config_obj in changed.items()},
+            "types": {key: _config_type_info(config_obj) for key, config_obj in changed.items()},
+            "deleted": deleted
+        })
+    except Exception as e:
+        print(f"[ReiConfig] 获取配置快照失败: {e}")
+        return web.json_response(
+            {"error": f"获取配置快照失败: {str(e)}"}, 
+            status=500
+        )
+
+@routes.get('/api/rei/config/export')
+async def export_configs(request):
+    """
+    导出完整配置（与 env_config.json 格式相同，作为附件下载）
+    使用 SQLite 后端时可以用来手动查看和编辑配置
+    """
+    try:
+        configs = get_config_snapshot()
+        return web.Response(
+            text=json.dumps(configs, indent=4, ensure_ascii=False),
+            content_type='application/json',
+            headers={'Content-Disposition': 'attachment; filename="env_config.json"'}
+        )
+    except Exception as e:
+        print(f"[ReiConfig] 导出配置失败: {e}")
+        return web.json_response(
+            {"error": f"导出配置失败: {str(e)}"}, 
+            status=500
+        )
+
+def _get_presets_dir():
+    """获取预设目录路径"""
+    base_path = folder_paths.base_path
+    return os.path.join(base_path, 'custom_nodes', 'ComfyUI-ReiTools', 'presets')
+
+def _read_preset_list(presets_dir):
+    """读取预设目录中所有预设的摘要信息（按修改时间倒序）"""
+    # 确保预设目录存在
+    if not os.path.exists(presets_dir):
+        os.makedirs(presets_dir)
+    
+    # 摘要来自预设索引，只有新增或修改过的预设文件会被重新解析
+    return get_preset_index(presets_dir).presets()
+
+def _read_preset_file(preset_path, fields=None):
+    """读取预设文件（fields 为需要的字段列表，None 表示全部），不存在时返回 None"""
+    index = get_preset_index(os.path.dirname(preset_path), refresh=False)
+    return index.read_preset(os.path.basename(preset_path), fields)
+
+# 发送预设 content 时每次读取的字节数
+PRESET_CONTENT_CHUNK_SIZE = 256 * 1024
+
+def _open_preset_content(preset_path):
+    """
+    准备发送预设的 content
+
+    Returns:
+        None：预设不存在
+        ('bytes', 文件对象, 起始偏移, 结束偏移)：content 在文件中的原始字节范围，调用方负责关闭文件
+        ('value', content)：无法定位 content（例如手动编辑过格式或 blob 存储的清单）时读取出的值
+    """
+    index = get_preset_index(os.path.dirname(preset_path), refresh=False)
+    filename = os.path.basename(preset_path)
+    opened = index.open_preset(filename)
+    if opened is None:
+        return None
+    f, record = opened
+    if record['content_span'] is not None:
+        start, end = record['content_span']
+        return 'bytes', f, start, end
+    f.close()
+    preset_data = index.read_preset(filename, ['content'])
+    if preset_data is None:
+        return None
+    if not isinstance(preset_data, dict):
+        raise ValueError('预设内容不是 JSON 对象')
+    return 'value', preset_data.get('content')
+
+def _read_chunk(f, offset, size):
+    f.seek(offset)
+    return f.read(size)
+
+async def _send_file_range(request, f, start, end):
+    """以 application/json 发送已打开文件中 [start, end) 的字节"""
+    response = web.StreamResponse(headers={'Content-Type': 'application/json; charset=utf-8'})
+    response.content_length = end - start
+    await response.prepare(request)
+    offset = start
+    try:
+        while offset < end:
+            chunk = await run_blocking(
+                request, 'presets', _read_chunk, f, offset, min(PRESET_CONTENT_CHUNK_SIZE, end - offset))
+            if not chunk:
+                # 响应头已发送，只能提前结束；长度不足的响应会被客户端视为失败
+                print(f"[ReiTools] 发送预设内容时文件被截断: {f.name}")
+                break
+            await response.write(chunk)
+            offset += len(chunk)
+        else:
+            await response.write_eof()
+    except ConnectionResetError:
+        # 客户端已断开
+        pass
+    return response
+
+def _write_preset_file(preset_path, preset_data):
+    """
+    原子地写入预设文件（必要时创建预设目录），正在读取旧文件的请求不受影响
+    使用 blob 存储时 content 写入 blob，预设文件只保存清单
+    """
+    presets_dir = os.path.dirname(preset_path)
+    if not os.path.exists(presets_dir):
+        os.makedirs(presets_dir)
+    stored_data = preset_data
+    blobs = None
+    if blob_storage_enabled():
+        stored_data = build_manifest(preset_data, BlobStore(presets_dir))
+        blobs = stored_data['blobs']
+    raw = encode_preset(stored_data)
+    tmp_path = f'{preset_path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp_path, preset_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    filename = os.path.basename(preset_path)
+    record = get_preset_index(presets_dir, refresh=False).update(
+        filename, preset_data, content_span(raw, stored_data), blobs)
+    get_search_index(presets_dir).update(filename, preset_data, record)
+
+def _save_preset(preset_path, preset_name, data):
+    """
+    保存预设并记录修订版本
+    覆盖已有预设时保留其 created_at，不使用客户端提交的值
+
+    Returns:
+        (预设数据, 新版本的元数据)，记录历史失败时版本为 None（预设本身已保存）
+    """
+    presets_dir, filename = os.path.split(preset_path)
+    history = PresetHistory(presets_dir, preset_name)
+    with history.lock:
+        try:
+            previous = get_preset_index(presets_dir, refresh=False).read_preset(filename)
+        except ValueError:
+            # 已有文件无法解析，按新预设处理
+            previous = None
+        if not isinstance(previous, dict):
+            previous = None
+        
+        # 构建预设数据
+        current_time = datetime.now().isoformat()
+        preset_data = {
+            'name': preset_name,
+            'title': data.get('title', preset_name),
+            'description': data.get('description', ''),
+            'content': data['content'],
+            'created_at': (previous or {}).get('created_at') or current_time,
+            'updated_at': current_time,
+            'version': data.get('version', '1.0'),
+            'author': data.get('author', ''),
+            'tags': data.get('tags', [])
+        }
+        _write_preset_file(preset_path, preset_data)
+        
+        try:
+            revision = history.record(preset_data, previous)
+        except (OSError, ValueError) as e:
+            print(f"[ReiTools] 记录预设 {preset_name} 的修订历史失败: {e}")
+            revision = None
+    return preset_data, revision
+
+def _remove_preset_file(preset_path):
+    """删除预设文件，不存在时返回 False"""
+    if not os.path.exists(preset_path):
+        return False
+    os.remove(preset_path)
+    presets_dir, filename = os.path.split(preset_path)
+    get_preset_index(presets_dir, refresh=False).remove(filename)
+    get_search_index(presets_dir).remove(filename)
+    PresetHistory(presets_dir, os.path.splitext(filename)[0]).delete()
+    
+    # 清理不再被任何预设引用的 blob（先与磁盘同步，确保所有清单都已计入）
+    blob_store = BlobStore(presets_dir)
+    if os.path.isdir(blob_store.root):
+        removed = blob_store.collect_garbage(get_preset_index(presets_dir).referenced_blobs())
+        if removed:
+            print(f"[ReiTools] 已清理 {removed} 个未被引用的预设 blob")
+    return True
+
 @routes.get('/api/rei/presets/list')
 async def list_presets(request):
     """获取所有预设列表"""
     try:
         # 获取预设目录
-        base_path = folder_paths.base_path
-        presets_dir = os.path.join(base_path, 'custom_nodes', 'ComfyUI-ReiTools', 'presets')
-        
-        # 确保预设目录存在
-        if not os.path.exists(presets_dir):
-            os.makedirs(presets_dir)
-            
-        presets = []
-        for filename in os.listdir(presets_dir):
-            if filename.endswith('.json'):
-                preset_path = os.path.join(presets_dir, filename)
-                try:
-                    stat_info = os.stat(preset_path)
-                    with open(preset_path, 'r', encoding='utf-8') as f:
-                        preset_data = json.load(f)
-                    
-                    presets.append({
-                        'name': os.path.splitext(filename)[0],
-                        'filename': filename,
-                        'title': preset_data.get('title', os.path.splitext(filename)[0]),
-                        'description': preset_data.get('description', ''),
-                        'created_at': preset_data.get('created_at', ''),
-                        'updated_at': preset_data.get('updated_at', ''),
-                        'size': stat_info.st_size,
-                        'modified': stat_info.st_mtime
-                    })
-                except (json.JSONDecodeError, IOError) as e:
-                    print(f"[ReiTools] 无法读取预设文件 {filename}: {e}")
-                    continue
-        
-        # 按修改时间排序
-        presets.sort(key=lambda x: x['modified'], reverse=True)
+        presets_dir = _get_presets_dir()
+        presets = await run_blocking(request, 'presets', _read_preset_list, presets_dir)
         
         return web.json_response({
             'presets': presets,
@@ -107,6 +330,45 @@ async def list_presets(request):
             status=500
         )
 
+def _search_presets(presets_dir, query, tags, offset, limit):
+    """在预设目录中搜索，返回 (总数, 当前页结果)"""
+    if not os.path.exists(presets_dir):
+        os.makedirs(presets_dir)
+    search_index = get_search_index(presets_dir)
+    # 首次搜索时先让预设索引与磁盘同步，之后只同步预设索引中已记录的变化
+    search_index.sync(get_preset_index(presets_dir, refresh=not search_index.ready))
+    return search_index.search(query, tags, offset, limit)
+
+@routes.get('/api/rei/presets/search')
+async def search_presets(request):
+    """按关键词（q）和标签（tag，可重复）搜索预设，支持 offset/limit 分页"""
+    try:
+        query = request.query.get('q', '')
+        tags = [tag.strip() for tag in request.query.getall('tag', []) if tag.strip()]
+        try:
+            offset = max(0, int(request.query.get('offset', 0)))
+            limit = min(MAX_PAGE_SIZE, max(1, int(request.query.get('limit', DEFAULT_PAGE_SIZE))))
+        except ValueError:
+            return web.json_response({'error': 'offset/limit 必须是整数'}, status=400)
+        
+        presets_dir = _get_presets_dir()
+        total, results = await run_blocking(
+            request, 'presets', _search_presets, presets_dir, query, tags, offset, limit)
+        
+        return web.json_response({
+            'results': results,
+            'total': total,
+            'offset': offset,
+            'limit': limit
+        })
+        
+    except Exception as e:
+        print(f"[ReiTools] 搜索预设失败: {e}")
+        return web.json_response(
+            {'error': f'搜索预设失败: {str(e)}'}, 
+            status=500
+        )
+
 @routes.get('/api/rei/presets/get/{preset_name}')
 async def get_preset(request):
     """获取指定预设的内容"""
@@ -114,19 +376,21 @@ async def get_preset(request):
         preset_name = request.match_info['preset_name']
         
         # 获取预设目录
-        base_path = folder_paths.base_path
-        presets_dir = os.path.join(base_path, 'custom_nodes', 'ComfyUI-ReiTools', 'presets')
+        presets_dir = _get_presets_dir()
         preset_path = os.path.join(presets_dir, f'{preset_name}.json')
         
-        if not os.path.exists(preset_path):
+        # 可选的字段投影，例如 ?fields=tags,updated_at；不需要 content 时不会读取 content
+        fields = request.query.get('fields')
+        if fields is not None:
+            fields = [field.strip() for field in fields.split(',') if field.strip()]
+        
+        preset_data = await run_blocking(request, 'presets', _read_preset_file, preset_path, fields)
+        if preset_data is None:
             return web.json_response(
                 {'error': '预设不存在'}, 
                 status=404
             )
         
-        with open(preset_path, 'r', encoding='utf-8') as f:
-            preset_data = json.load(f)
-        
         return web.json_response(preset_data)
         
     except Exception as e:
@@ -136,6 +400,36 @@ async def get_preset(request):
             status=500
         )
 
+@routes.get('/api/rei/presets/content/{preset_name}')
+async def get_preset_content(request):
+    """只获取指定预设的 content，直接发送文件中的原始字节，不经过 JSON 解析和编码"""
+    try:
+        preset_name = request.match_info['preset_name']
+        
+        # 获取预设目录
+        presets_dir = _get_presets_dir()
+        preset_path = os.path.join(presets_dir, f'{preset_name}.json')
+        
+        opened = await run_blocking(request, 'presets', _open_preset_content, preset_path)
+        if opened is None:
+            return web.json_response(
+                {'error': '预设不存在'}, 
+                status=404
+            )
+        if opened[0] == 'value':
+            return web.json_response(opened[1])
+        
+        _, f, start, end = opened
+        with f:
+            return await _send_file_range(request, f, start, end)
+        
+    except Exception as e:
+        print(f"[ReiTools] 获取预设内容失败: {e}")
+        return web.json_response(
+            {'error': f'获取预设内容失败: {str(e)}'}, 
+            status=500
+        )
+
 @routes.post('/api/rei/presets/save')
 async def save_preset(request):
     """保存预设"""
@@ -159,38 +453,20 @@ async def save_preset(request):
             )
         
         # 获取预设目录
-        base_path = folder_paths.base_path
-        presets_dir = os.path.join(base_path, 'custom_nodes', 'ComfyUI-ReiTools', 'presets')
-        
-        # 确保预设目录存在
-        if not os.path.exists(presets_dir):
-            os.makedirs(presets_dir)
-        
+        presets_dir = _get_presets_dir()
         preset_path = os.path.join(presets_dir, f'{preset_name}.json')
         
-        # 构建预设数据
-        current_time = datetime.now().isoformat()
-        preset_data = {
-            'name': preset_name,
-            'title': data.get('title', preset_name),
-            'description': data.get('description', ''),
-            'content': data['content'],
-            'created_at': data.get('created_at', current_time),
-            'updated_at': current_time,
-            'version': data.get('version', '1.0'),
-            'author': data.get('author', ''),
-            'tags': data.get('tags', [])
-        }
-        
-        # 保存预设文件
-        with open(preset_path, 'w', encoding='utf-8') as f:
-            json.dump(preset_data, f, ensure_ascii=False, indent=2)
+        # 保存预设文件并记录修订版本
+        preset_data, revision = await run_blocking(
+            request, 'presets', _save_preset, preset_path, preset_name, data)
+        _change_notifier.preset_changed(preset_name, 'saved', preset_summary(preset_name, preset_data))
         
         return web.json_response({
             'success': True,
             'message': '预设保存成功',
             'preset_name': preset_name,
-            'preset_path': preset_path
+            'preset_path': preset_path,
+            'revision': revision['revision'] if revision else None
         })
         
     except json.JSONDecodeError:
@@ -205,6 +481,76 @@ async def save_preset(request):
             status=500
         )
 
+def _read_preset_history(presets_dir, preset_name, revision=None):
+    """读取预设的版本列表（revision 为 None）或指定版本的内容，不存在时返回 None"""
+    history = PresetHistory(presets_dir, preset_name)
+    if revision is None:
+        return history.revisions() or None
+    return history.get(revision)
+
+@routes.get('/api/rei/presets/history/{preset_name}')
+async def list_preset_revisions(request):
+    """获取预设的修订版本列表"""
+    try:
+        preset_name = request.match_info['preset_name']
+        presets_dir = _get_presets_dir()
+        
+        revisions = await run_blocking(request, 'presets', _read_preset_history, presets_dir, preset_name)
+        if revisions is None:
+            return web.json_response(
+                {'error': '预设没有修订历史'}, 
+                status=404
+            )
+        
+        return web.json_response({
+            'preset_name': preset_name,
+            'revisions': [
+                {
+                    'revision': entry['revision'],
+                    'saved_at': entry['saved_at'],
+                    'kind': entry['kind'],
+                    'bytes': entry['bytes']
+                }
+                for entry in revisions
+            ],
+            'count': len(revisions)
+        })
+        
+    except Exception as e:
+        print(f"[ReiTools] 获取预设历史失败: {e}")
+        return web.json_response(
+            {'error': f'获取预设历史失败: {str(e)}'}, 
+            status=500
+        )
+
+@routes.get('/api/rei/presets/history/{preset_name}/{revision}')
+async def get_preset_revision(request):
+    """获取预设指定修订版本的完整内容（可以直接提交给保存接口以回滚）"""
+    try:
+        preset_name = request.match_info['preset_name']
+        try:
+            revision = int(request.match_info['revision'])
+        except ValueError:
+            return web.json_response({'error': '版本号必须是整数'}, status=400)
+        presets_dir = _get_presets_dir()
+        
+        preset_data = await run_blocking(
+            request, 'presets', _read_preset_history, presets_dir, preset_name, revision)
+        if preset_data is None:
+            return web.json_response(
+                {'error': '版本不存在'}, 
+                status=404
+            )
+        
+        return web.json_response(preset_data)
+        
+    except Exception as e:
+        print(f"[ReiTools] 获取预设版本失败: {e}")
+        return web.json_response(
+            {'error': f'获取预设版本失败: {str(e)}'}, 
+            status=500
+        )
+
 @routes.delete('/api/rei/presets/delete/{preset_name}')
 async def delete_preset(request):
     """删除预设"""
@@ -212,17 +558,16 @@ async def delete_preset(request):
         preset_name = request.match_info['preset_name']
         
         # 获取预设目录
-        base_path = folder_paths.base_path
-        presets_dir = os.path.join(base_path, 'custom_nodes', 'ComfyUI-ReiTools', 'presets')
+        presets_dir = _get_presets_dir()
         preset_path = os.path.join(presets_dir, f'{preset_name}.json')
         
-        if not os.path.exists(preset_path):
+        removed = await run_blocking(request, 'presets', _remove_preset_file, preset_path)
+        if not removed:
             return web.json_response(
                 {'error': '预设不存在'}, 
                 status=404
             )
-        
-        os.remove(preset_path)
+        _change_notifier.preset_changed(preset_name, 'deleted')
         
         return web.json_response({
             'success': True,
@@ -237,6 +582,234 @@ async def delete_preset(request):
             status=500
         )
 
+def _browse_file_icon(file_extension):
+    """返回 ComfyUI 文件浏览器中文件的图标和分类"""
+    if file_extension in ['png', 'jpg', 'jpeg', 'gif', 'webp', 'bmp', 'svg']:
+        return "🖼️", "image"
+    elif file_extension in ['txt', 'md', 'readme']:
+        return "📄", "text"
+    elif file_extension in ['json', 'yaml', 'yml']:
+        return "📋", "config"
+    elif file_extension in ['py', 'pyw']:
+        return "🐍", "python"
+    elif file_extension in ['js', 'ts', 'jsx', 'tsx']:
+        return "📜", "javascript"
+    elif file_extension in ['css', 'scss', 'sass']:
+        return "🎨", "style"
+    elif file_extension in ['html', 'htm']:
+        return "🌐", "web"
+    elif file_extension in ['zip', 'rar', '7z', 'tar', 'gz']:
+        return "📦", "archive"
+    else:
+        return "📄", "other"
+
+def _system_file_icon(file_extension):
+    """返回系统文件浏览器中文件的图标"""
+    if file_extension in ['jpg', 'jpeg', 'png', 'gif', 'bmp', 'webp', 'svg']:
+        return "🖼️"
+    elif file_extension in ['mp4', 'avi', 'mov', 'mkv', 'wmv']:
+        return "🎬"
+    elif file_extension in ['mp3', 'wav', 'flac', 'aac']:
+        return "🎵"
+    elif file_extension in ['pdf']:
+        return "📄"
+    elif file_extension in ['doc', 'docx']:
+        return "📝"
+    elif file_extension in ['xls', 'xlsx']:
+        return "📊"
+    elif file_extension in ['zip', 'rar', '7z', 'tar', 'gz']:
+        return "📦"
+    elif file_extension in ['py', 'js', 'ts', 'java', 'cpp', 'c']:
+        return "💻"
+    else:
+        return "📄"
+
+def _parse_listing_params(query):
+    """解析目录列表的排序和分页参数，参数无效时抛出 ValueError"""
+    sort = query.get('sort', 'name')
+    order = query.get('order', 'asc').lower()
+    if sort not in SORT_FIELDS:
+        raise ValueError(f"不支持的排序键: {sort}")
+    if order not in ('asc', 'desc'):
+        raise ValueError(f"不支持的排序方向: {order}")
+    
+    limit = query.get('limit')
+    if limit:
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ValueError(f"无效的 limit: {limit}")
+        if limit <= 0:
+            raise ValueError(f"无效的 limit: {limit}")
+    else:
+        limit = None
+    
+    cursor = query.get('cursor') or None
+    if cursor:
+        decode_cursor(cursor, sort)
+    return sort, order, limit, cursor
+
+def _paginate_listing(items, sort, order, limit, cursor):
+    """排序并分页，返回当前页条目和需要合并到响应中的统计/分页字段"""
+    total_files = 0
+    total_directories = 0
+    for item in items:
+        if item["type"] == "directory":
+            total_directories += 1
+        else:
+            total_files += 1
+    
+    page, next_cursor = paginate_items(items, sort, order, limit, cursor)
+    return page, {
+        "total_items": len(items),
+        "total_files": total_files,
+        "total_directories": total_directories,
+        "sort": sort,
+        "order": order,
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
+    }
+
+def _list_browse_items(target_path, relative_path, show_files, file_types, cancel=None):
+    """列出 ComfyUI 目录下的条目（未排序）"""
+    access = get_access_checker()
+    dir_entries = []
+    
+    # 跳过隐藏文件和特殊目录
+    for entry, item_stat in scan_directory(target_path, skip_hidden=True, skip_prefixes=('__pycache__',), cancel=cancel):
+        item_name = entry.name
+        item_relative_path = os.path.join(relative_path, item_name) if relative_path else item_name
+        
+        item_info = {
+            "name": item_name,
+            "path": item_relative_path.replace(os.sep, '/'),  # 统一使用正斜杠
+            "modified": item_stat.st_mtime,
+            "created": item_stat.st_ctime,
+            "is_readable": access(item_stat, os.R_OK),
+        }
+        
+        if stat.S_ISDIR(item_stat.st_mode):
+            item_info["type"] = "directory"
+            item_info["is_writable"] = access(item_stat, os.W_OK)
+            
+        elif stat.S_ISREG(item_stat.st_mode) and show_files:
+            file_extension = get_extension(item_name)
+            
+            # 如果指定了文件类型过滤
+            if file_types and file_extension not in file_types:
+                continue
+                
+            item_info["type"] = "file"
+            item_info["size"] = item_stat.st_size
+            item_info["extension"] = file_extension
+            item_info["is_writable"] = access(item_stat, os.W_OK)
+            
+            # 添加文件类型图标
+            item_info["icon"], item_info["category"] = _browse_file_icon(file_extension)
+        else:
+            continue  # 跳过文件（如果不显示文件）或其他类型
+        
+        dir_entries.append(item_info)
+    
+    return dir_entries
+
+def _list_system_items(target_path, system, show_files, cancel=None):
+    """列出系统目录下的条目（未排序）"""
+    access = get_access_checker()
+    dir_entries = []
+    
+    # 跳过隐藏文件和特殊目录（但保留系统目录）
+    for entry, item_stat in scan_directory(target_path, skip_hidden=(system != 'windows'), cancel=cancel):
+        item_name = entry.name
+        item_path = os.path.join(target_path, item_name)
+        
+        item_info = {
+            "name": item_name,
+            "path": item_path,
+            "modified": item_stat.st_mtime,
+            "created": item_stat.st_ctime,
+            "is_readable": access(item_stat, os.R_OK),
+        }
+        
+        if stat.S_ISDIR(item_stat.st_mode):
+            item_info["type"] = "directory"
+            item_info["icon"] = "📁"
+        else:
+            if not show_files:
+                continue
+            
+            item_info["type"] = "file"
+            file_extension = get_extension(item_name)
+            item_info["size"] = item_stat.st_size
+            item_info["extension"] = file_extension
+            item_info["is_writable"] = access(item_stat, os.W_OK)
+            
+            # 设置文件图标
+            item_info["icon"] = _system_file_icon(file_extension)
+        
+        dir_entries.append(item_info)
+    
+    return dir_entries
+
+def _fill_browse_child_counts(items, target_path, cancel=None):
+    """为当前页中的目录统计子项数量（只区分前10个，避免性能问题）"""
+    for item in items:
+        if item["type"] == "directory":
+            check_cancelled(cancel)
+            children_count, file_count, dir_count = count_children(
+                os.path.join(target_path, item["name"]), skip_hidden=True, sample=10)
+            item["children_count"] = children_count
+            item["file_count"] = file_count
+            item["dir_count"] = dir_count
+
+def _system_child_counts(path):
+    """计算系统目录的子目录和文件数量"""
+    children_count, _, dir_count = count_children(path, skip_hidden=False)
+    return {
+        "children_count": children_count,
+        "file_count": children_count - dir_count,
+        "dir_count": dir_count,
+    }
+
+def _fill_system_child_counts(items, cancel=None):
+    """为当前页中的目录计算子目录和文件数量"""
+    for item in items:
+        if item["type"] == "directory":
+            check_cancelled(cancel)
+            item.update(_system_child_counts(item["path"]))
+
+def _build_browse_page(target_path, relative_path, show_files, file_types,
+                       sort, order, limit, cursor, cancel=None):
+    """列出、排序并分页 ComfyUI 目录（在线程池中执行）"""
+    cache_key = ('browse', target_path, relative_path, show_files, tuple(sorted(file_types)))
+    items, mtime_ns = _listing_cache.get(cache_key, target_path)
+    if items is None:
+        items = _list_browse_items(target_path, relative_path, show_files, file_types, cancel=cancel)
+        _listing_cache.put(cache_key, items, mtime_ns)
+    items, page_info = _paginate_listing(items, sort, order, limit, cursor)
+    # 子项数量取决于子目录的内容，不随当前目录的 mtime 失效，只写入副本而不写回缓存
+    page = [dict(item) for item in items]
+    _fill_browse_child_counts(page, target_path, cancel=cancel)
+    return page, page_info
+
+def _build_system_page(target_path, system, show_files, sort, order, limit, cursor,
+                       with_counts=True, cancel=None):
+    """
+    列出、排序并分页系统目录（在线程池中执行）
+    with_counts 为 False 时不计算子项数量，由客户端通过 child-counts 接口按需获取
+    """
+    cache_key = ('browse-system', target_path, show_files)
+    items, mtime_ns = _listing_cache.get(cache_key, target_path)
+    if items is None:
+        items = _list_system_items(target_path, system, show_files, cancel=cancel)
+        _listing_cache.put(cache_key, items, mtime_ns)
+    items, page_info = _paginate_listing(items, sort, order, limit, cursor)
+    page = [dict(item) for item in items]
+    if with_counts:
+        _fill_system_child_counts(page, cancel=cancel)
+    return page, page_info
+
 @routes.get('/api/rei/filesystem/browse')
 async def browse_filesystem(request):
     """浏览ComfyUI文件系统（受限制版本）"""
@@ -247,6 +820,11 @@ async def browse_filesystem(request):
         file_types = request.query.get('file_types', '').split(',') if request.query.get('file_types') else []
         base_dir = request.query.get('base_dir', '')  # 新增：允许指定base目录
         
+        try:
+            sort, order, limit, cursor = _parse_listing_params(request.query)
+        except ValueError as e:
+            return web.json_response({"error": str(e)}, status=400)
+        
         # 获取ComfyUI根目录
         comfyui_root = folder_paths.base_path
         
@@ -322,110 +900,12 @@ async def browse_filesystem(request):
             return web.json_response(file_info)
         
         # 读取目录内容
-        items = []
         try:
-            dir_entries = []
-            
-            # 收集所有条目
-            for item_name in os.listdir(target_path):
-                # 跳过隐藏文件和特殊目录
-                if item_name.startswith('.') or item_name.startswith('__pycache__'):
-                    continue
-                
-                item_path = os.path.join(target_path, item_name)
-                item_relative_path = os.path.join(relative_path, item_name) if relative_path else item_name
-                
-                try:
-                    item_stat = os.stat(item_path)
-                    
-                    item_info = {
-                        "name": item_name,
-                        "path": item_relative_path.replace(os.sep, '/'),  # 统一使用正斜杠
-                        "modified": item_stat.st_mtime,
-                        "created": item_stat.st_ctime,
-                        "is_readable": os.access(item_path, os.R_OK),
-                    }
-                    
-                    if os.path.isdir(item_path):
-                        item_info["type"] = "directory"
-                        # 统计子项数量
-                        try:
-                            sub_items = [x for x in os.listdir(item_path) if not x.startswith('.')]
-                            item_info["children_count"] = len(sub_items)
-                            
-                            # 统计子目录中的文件和文件夹数量
-                            file_count = 0
-                            dir_count = 0
-                            for sub_item in sub_items[:10]:  # 只检查前10个，避免性能问题
-                                sub_path = os.path.join(item_path, sub_item)
-                                if os.path.isfile(sub_path):
-                                    file_count += 1
-                                elif os.path.isdir(sub_path):
-                                    dir_count += 1
-                            
-                            item_info["file_count"] = file_count
-                            item_info["dir_count"] = dir_count
-                            
-                        except (PermissionError, OSError):
-                            item_info["children_count"] = 0
-                            item_info["file_count"] = 0
-                            item_info["dir_count"] = 0
-                            
-                        item_info["is_writable"] = os.access(item_path, os.W_OK)
-                        
-                    elif os.path.isfile(item_path) and show_files:
-                        file_extension = os.path.splitext(item_name)[1].lower().lstrip('.')
-                        
-                        # 如果指定了文件类型过滤
-                        if file_types and file_extension not in file_types:
-                            continue
-                            
-                        item_info["type"] = "file"
-                        item_info["size"] = item_stat.st_size
-                        item_info["extension"] = file_extension
-                        item_info["is_writable"] = os.access(item_path, os.W_OK)
-                        
-                        # 添加文件类型图标
-                        if file_extension in ['png', 'jpg', 'jpeg', 'gif', 'webp', 'bmp', 'svg']:
-                            item_info["icon"] = "🖼️"
-                            item_info["category"] = "image"
-                        elif file_extension in ['txt', 'md', 'readme']:
-                            item_info["icon"] = "📄"
-                            item_info["category"] = "text"
-                        elif file_extension in ['json', 'yaml', 'yml']:
-                            item_info["icon"] = "📋"
-                            item_info["category"] = "config"
-                        elif file_extension in ['py', 'pyw']:
-                            item_info["icon"] = "🐍"
-                            item_info["category"] = "python"
-                        elif file_extension in ['js', 'ts', 'jsx', 'tsx']:
-                            item_info["icon"] = "📜"
-                            item_info["category"] = "javascript"
-                        elif file_extension in ['css', 'scss', 'sass']:
-                            item_info["icon"] = "🎨"
-                            item_info["category"] = "style"
-                        elif file_extension in ['html', 'htm']:
-                            item_info["icon"] = "🌐"
-                            item_info["category"] = "web"
-                        elif file_extension in ['zip', 'rar', '7z', 'tar', 'gz']:
-                            item_info["icon"] = "📦"
-                            item_info["category"] = "archive"
-                        else:
-                            item_info["icon"] = "📄"
-                            item_info["category"] = "other"
-                    else:
-                        continue  # 跳过文件（如果不显示文件）或其他类型
-                    
-                    dir_entries.append(item_info)
-                    
-                except (OSError, PermissionError):
-                    # 跳过无法访问的文件/目录
-                    continue
-            
-            # 排序：目录优先，然后按名称排序
-            dir_entries.sort(key=lambda x: (x["type"] != "directory", x["name"].lower()))
-            items = dir_entries
-        
+            items, page_info = await run_blocking(
+                request, 'browse', _build_browse_page,
+                target_path, relative_path, show_files, file_types,
+                sort, order, limit, cursor, cancel=CancelToken()
+            )
         except PermissionError:
             return web.json_response(
                 {"error": "权限不足，无法访问该目录"}, 
@@ -479,9 +959,7 @@ async def browse_filesystem(request):
             "parent_path": parent_path,
             "items": items,
             "breadcrumbs": breadcrumbs,
-            "total_items": len(items),
-            "total_files": len([x for x in items if x["type"] == "file"]),
-            "total_directories": len([x for x in items if x["type"] == "directory"]),
+            **page_info,
             "base_path": os.path.basename(actual_base_path),
             "base_dir": base_dir_cleaned,  # 新增：返回当前使用的base目录
             "comfyui_root": os.path.basename(comfyui_root),  # 新增：返回ComfyUI根目录信息
@@ -512,6 +990,13 @@ async def browse_system_filesystem(request):
         path = request.query.get('path', '')
         show_files = request.query.get('show_files', 'true').lower() == 'true'
         file_types = request.query.get('file_types', '').split(',') if request.query.get('file_types') else []
+        # counts=false 时不计算子项数量，由客户端通过 child-counts 接口按需获取，避免首屏等待最慢的子目录
+        with_counts = request.query.get('counts', 'true').lower() == 'true'
+        
+        try:
+            sort, order, limit, cursor = _parse_listing_params(request.query)
+        except ValueError as e:
+            return web.json_response({"error": str(e)}, status=400)
         
         # 根据操作系统确定根目录
         system = platform.system().lower()
@@ -595,93 +1080,12 @@ async def browse_system_filesystem(request):
         if system == 'windows' and len(target_path) == 2 and target_path[1] == ':':
             target_path = target_path + '/'
         # 读取目录内容
-        items = []
         try:
-            dir_entries = []
-            
-            # 收集所有条目
-            for item_name in os.listdir(target_path):
-                # 跳过隐藏文件和特殊目录（但保留系统目录）
-                if item_name.startswith('.') and system != 'windows':
-                    continue
-                
-                item_path = os.path.join(target_path, item_name)
-                
-                try:
-                    item_stat = os.stat(item_path)
-                    
-                    item_info = {
-                        "name": item_name,
-                        "path": item_path,
-                        "modified": item_stat.st_mtime,
-                        "created": item_stat.st_ctime,
-                        "is_readable": os.access(item_path, os.R_OK),
-                    }
-                    
-                    if os.path.isdir(item_path):
-                        item_info["type"] = "directory"
-                        item_info["icon"] = "📁"
-                        
-                        # 计算子目录和文件数量
-                        try:
-                            children = os.listdir(item_path)
-                            item_info["children_count"] = len(children)
-                            
-                            file_count = 0
-                            dir_count = 0
-                            for child in children:
-                                child_path = os.path.join(item_path, child)
-                                if os.path.isdir(child_path):
-                                    dir_count += 1
-                                else:
-                                    file_count += 1
-                            
-                            item_info["file_count"] = file_count
-                            item_info["dir_count"] = dir_count
-                        except (OSError, PermissionError):
-                            item_info["children_count"] = 0
-                            item_info["file_count"] = 0
-                            item_info["dir_count"] = 0
-                    else:
-                        if not show_files:
-                            continue
-                        
-                        item_info["type"] = "file"
-                        file_extension = os.path.splitext(item_path)[1].lower().lstrip('.')
-                        item_info["size"] = item_stat.st_size
-                        item_info["extension"] = file_extension
-                        item_info["is_writable"] = os.access(item_path, os.W_OK)
-                        
-                        # 设置文件图标
-                        if file_extension in ['jpg', 'jpeg', 'png', 'gif', 'bmp', 'webp', 'svg']:
-                            item_info["icon"] = "🖼️"
-                        elif file_extension in ['mp4', 'avi', 'mov', 'mkv', 'wmv']:
-                            item_info["icon"] = "🎬"
-                        elif file_extension in ['mp3', 'wav', 'flac', 'aac']:
-                            item_info["icon"] = "🎵"
-                        elif file_extension in ['pdf']:
-                            item_info["icon"] = "📄"
-                        elif file_extension in ['doc', 'docx']:
-                            item_info["icon"] = "📝"
-                        elif file_extension in ['xls', 'xlsx']:
-                            item_info["icon"] = "📊"
-                        elif file_extension in ['zip', 'rar', '7z', 'tar', 'gz']:
-                            item_info["icon"] = "📦"
-                        elif file_extension in ['py', 'js', 'ts', 'java', 'cpp', 'c']:
-                            item_info["icon"] = "💻"
-                        else:
-                            item_info["icon"] = "📄"
-                    
-                    dir_entries.append(item_info)
-                    
-                except (OSError, PermissionError):
-                    # 跳过无法访问的文件/目录
-                    continue
-            
-            # 排序：目录优先，然后按名称排序
-            dir_entries.sort(key=lambda x: (x["type"] != "directory", x["name"].lower()))
-            items = dir_entries
-        
+            items, page_info = await run_blocking(
+                request, 'browse-system', _build_system_page,
+                target_path, system, show_files,
+                sort, order, limit, cursor, with_counts=with_counts, cancel=CancelToken()
+            )
         except PermissionError:
             return web.json_response(
                 {"error": "权限不足，无法访问该目录"}, 
@@ -742,9 +1146,7 @@ async def browse_system_filesystem(request):
             "parent_path": parent_path,
             "items": items,
             "breadcrumbs": breadcrumbs,
-            "total_items": len(items),
-            "total_files": len([x for x in items if x["type"] == "file"]),
-            "total_directories": len([x for x in items if x["type"] == "directory"]),
+            **page_info,
             "base_path": "系统根目录",
             "system_type": system,
             "current_time": datetime.now().isoformat()
@@ -761,6 +1163,164 @@ async def browse_system_filesystem(request):
             status=500
         )
 
+def _extension_excludes(request):
+    """
+    get-extensions 要排除的目录
+    默认不排除任何目录，与 ReiFileCounter 节点的统计一致；
+    查询参数 exclude_common=true 时跳过 .git、node_modules 等常见目录
+    """
+    if request.query.get('exclude_common', 'false').lower() in ('1', 'true'):
+        return EXTENSION_INDEX_EXCLUDES
+    return ()
+
+def _count_extensions(directory_path, exclude=(), cancel=None, **progress_options):
+    """统计目录下的文件数量和各后缀的文件数量（使用增量后缀索引）"""
+    return get_extension_index(
+        directory_path, exclude=exclude, cancel=cancel, **progress_options).summary()
+
+def _extensions_payload(directory_path, total_files, extension_count):
+    """构建后缀统计的响应数据，后缀按数量排序"""
+    available_extensions = sorted(extension_count.keys(), 
+                                key=lambda x: extension_count[x], 
+                                reverse=True)
+    return {
+        'directory_path': directory_path,
+        'total_files': total_files,
+        'extensions': available_extensions,
+        'extension_counts': extension_count
+    }
+
+async def _stream_blocking(request, route, func, *args, progress_payload, done_payload,
+                           error_payload, **kwargs):
+    """
+    在线程池中执行 func，并以 NDJSON 流式返回进度
+    func 需要接受 progress 和 cancel 关键字参数。每次 progress(...) 调用的参数经
+    progress_payload 转换后输出为 {"type": "progress", ...}；结束时 func 的返回值经
+    done_payload 转换后输出为 {"type": "done", ...}；func 抛出异常时输出
+    {"type": "error", **error_payload(e)}。客户端断开时置位 cancel 以停止 func。
+    """
+    response = web.StreamResponse(headers={'Content-Type': 'application/x-ndjson; charset=utf-8'})
+    await response.prepare(request)
+    
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    cancel = CancelToken()
+    
+    def on_progress(*progress_args):
+        # 在线程池中调用，转交给事件循环写出
+        loop.call_soon_threadsafe(queue.put_nowait, progress_args)
+    
+    async def write_line(payload):
+        await response.write((json.dumps(payload, ensure_ascii=False) + '\n').encode('utf-8'))
+    
+    task = asyncio.ensure_future(run_blocking(
+        request, route, func, *args, cancel=cancel, progress=on_progress, **kwargs
+    ))
+    try:
+        while not task.done():
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait({task, getter}, return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                getter.cancel()
+                continue
+            await write_line({'type': 'progress', **progress_payload(*getter.result())})
+        
+        try:
+            result = task.result()
+        except Exception as e:
+            await write_line({'type': 'error', **error_payload(e)})
+        else:
+            await write_line({'type': 'done', **done_payload(result)})
+        await response.write_eof()
+    except (ConnectionResetError, asyncio.CancelledError) as e:
+        # 客户端已断开，停止后台任务
+        cancel.set()
+        task.cancel()
+        if isinstance(e, asyncio.CancelledError):
+            raise
+    return response
+
+async def _stream_extensions(request, directory_path):
+    """
+    以 NDJSON 流式返回后缀统计
+    遍历过程中按文件数或时间间隔输出 {"type": "progress", ...}，
+    结束时输出 {"type": "done", ...}，出错时输出 {"type": "error", "error": ...}
+    """
+    try:
+        progress_files = max(1, int(request.query.get('progress_files', 5000)))
+        progress_interval = max(0.0, int(request.query.get('progress_ms', 200)) / 1000)
+    except ValueError:
+        return web.json_response({"error": "progress_files/progress_ms 必须是整数"}, status=400)
+    
+    def payload(total_files, extension_count):
+        return _extensions_payload(directory_path, total_files, extension_count)
+    
+    def error_payload(e):
+        if isinstance(e, PermissionError):
+            return {'error': f"没有权限访问目录: {directory_path}"}
+        print(f"[ReiConfig] 获取文件后缀失败: {e}")
+        return {'error': f"获取文件后缀失败: {str(e)}"}
+    
+    return await _stream_blocking(
+        request, 'get-extensions', _count_extensions, directory_path,
+        progress_payload=payload, done_payload=lambda result: payload(*result),
+        error_payload=error_payload, exclude=_extension_excludes(request),
+        progress_files=progress_files, progress_interval=progress_interval
+    )
+
+@routes.get('/api/rei/filesystem/cache-stats')
+async def get_listing_cache_stats(request):
+    """获取目录列表缓存的命中统计"""
+    return web.json_response(_listing_cache.stats())
+
+# 单次 child-counts 请求最多接受的路径数量
+MAX_CHILD_COUNT_PATHS = 1000
+
+@routes.post('/api/rei/filesystem/child-counts')
+async def get_child_counts(request):
+    """
+    批量计算目录的子项数量
+    请求体: {"paths": [目录路径, ...]}
+    以 NDJSON 流式返回，每完成一个目录输出一行
+    {"path": ..., "children_count": ..., "file_count": ..., "dir_count": ...}，
+    先完成的先返回，最后输出 {"type": "done", "count": ...}
+    """
+    try:
+        data = await request.json()
+        paths = data.get('paths') if isinstance(data, dict) else None
+        if not isinstance(paths, list) or not all(isinstance(p, str) for p in paths):
+            return web.json_response({"error": "paths 必须是字符串数组"}, status=400)
+        if len(paths) > MAX_CHILD_COUNT_PATHS:
+            return web.json_response(
+                {"error": f"一次最多计算 {MAX_CHILD_COUNT_PATHS} 个目录"}, 
+                status=400
+            )
+    except json.JSONDecodeError:
+        return web.json_response({"error": "无效的JSON数据"}, status=400)
+    
+    response = web.StreamResponse(headers={'Content-Type': 'application/x-ndjson; charset=utf-8'})
+    await response.prepare(request)
+    
+    async def count_one(path):
+        return path, await run_blocking(request, 'child-counts', _system_child_counts, path)
+    
+    tasks = [asyncio.ensure_future(count_one(path)) for path in dict.fromkeys(paths)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            path, counts = await next_done
+            line = json.dumps({"path": path, **counts}, ensure_ascii=False) + '\n'
+            await response.write(line.encode('utf-8'))
+        await response.write(
+            (json.dumps({"type": "done", "count": len(tasks)}) + '\n').encode('utf-8'))
+        await response.write_eof()
+    except (ConnectionResetError, asyncio.CancelledError) as e:
+        # 客户端已断开，取消尚未开始的计算
+        for task in tasks:
+            task.cancel()
+        if isinstance(e, asyncio.CancelledError):
+            raise
+    return response
+
 @routes.get('/api/rei/filesystem/get-extensions')
 async def get_directory_extensions(request):
     """获取指定目录下的所有文件后缀列表"""
@@ -789,29 +1349,18 @@ async def get_directory_extensions(request):
                 status=400
             )
         
-        # 统计所有文件后缀
-        extension_count = {}
-        total_files = 0
+        # 流式模式：边遍历边返回进度
+        if request.query.get('stream', 'false').lower() in ('1', 'true'):
+            return await _stream_extensions(request, directory_path)
         
-        for root, dirs, files in os.walk(directory_path):
-            for file in files:
-                total_files += 1
-                _, ext = os.path.splitext(file)
-                ext = ext.lower().lstrip('.')  # 移除点号并转为小写
-                if ext:  # 只统计有后缀的文件
-                    extension_count[ext] = extension_count.get(ext, 0) + 1
+        # 统计所有文件后缀
+        total_files, extension_count = await run_blocking(
+            request, 'get-extensions', _count_extensions, directory_path,
+            exclude=_extension_excludes(request), cancel=CancelToken()
+        )
         
         # 生成可用后缀列表（按数量排序）
-        available_extensions = sorted(extension_count.keys(), 
-                                    key=lambda x: extension_count[x], 
-                                    reverse=True)
-        
-        return web.json_response({
-            'directory_path': directory_path,
-            'total_files': total_files,
-            'extensions': available_extensions,
-            'extension_counts': extension_count
-        })
+        return web.json_response(_extensions_payload(directory_path, total_files, extension_count))
         
     except PermissionError:
         return web.json_response(
@@ -825,9 +1374,176 @@ async def get_directory_extensions(request):
             status=500
         )
 
+@routes.get('/api/rei/config/vault')
+async def get_vault(request):
+    """获取保险库加密参数（v2 加密格式使用的共享盐和迭代次数）"""
+    try:
+        params = await run_blocking(request, 'config', get_vault_params)
+        return web.json_response(params)
+    except Exception as e:
+        print(f"[ReiConfig] 获取保险库参数失败: {e}")
+        return web.json_response(
+            {"error": f"获取保险库参数失败: {str(e)}"}, 
+            status=500
+        )
+
+@routes.get('/api/rei/config/vault/calibrate')
+async def calibrate_vault(request):
+    """测量本机 KDF 速度，返回达到目标耗时所需的迭代次数（不修改保险库）"""
+    try:
+        target_ms = int(request.query.get('target_ms', 250))
+        if not 10 <= target_ms <= 10000:
+            raise ValueError
+    except ValueError:
+        return web.json_response({"error": "target_ms 必须是 10-10000 之间的整数"}, status=400)
+    try:
+        from .crypto_utils import calibrate_iterations
+        iterations = await run_blocking(request, 'config', calibrate_iterations, target_ms / 1000)
+        return web.json_response({"iterations": iterations, "target_ms": target_ms})
+    except Exception as e:
+        print(f"[ReiConfig] KDF 校准失败: {e}")
+        return web.json_response(
+            {"error": f"KDF 校准失败: {str(e)}"}, 
+            status=500
+        )
+
+def _rekey_configs(old_password, new_password, cancel=None, progress=None):
+    """
+    用新密码重新加密所有加密的配置项，全部成功后一次性原子写入配置文件
+    
+    任一项无法用原密码解密时不写入任何修改。重新加密期间被其他请求修改过的项
+    保持原样，并在结果的 conflicts 中列出。
+    
+    Returns:
+        {"rekeyed": 重新加密的数量, "total": 加密项数量, "conflicts": [键, ...]}
+    
+    Raises:
+        ValueError: 有配置项无法用原密码解密时抛出
+    """
+    snapshot = get_config_snapshot()
+    originals = {
+        key: config_obj.get("value", "")
+        for key, config_obj in snapshot.items()
+        if isinstance(config_obj, dict) and config_obj.get("encrypted", False)
+    }
+    if not originals:
+        return {"rekeyed": 0, "total": 0, "conflicts": []}
+    
+    # 新的加密值使用保险库的盐和迭代次数（v2 格式）
+    vault = get_vault_params()
+    rekeyed, failures = rekey_tokens(
+        originals.items(), old_password, new_password,
+        base64.b64decode(vault['salt']), vault['iterations'],
+        progress=progress, cancel=cancel
+    )
+    if failures:
+        raise ValueError(f"以下配置无法用原密码解密: {', '.join(sorted(failures))}")
+    check_cancelled(cancel)
+    
+    def apply(configs):
+        conflicts = []
+        now = datetime.now().isoformat()
+        for key, encrypted_value in rekeyed.items():
+            config_obj = configs.get(key)
+            if not isinstance(config_obj, dict) or config_obj.get("value") != originals[key]:
+                conflicts.append(key)
+                continue
+            config_obj["value"] = encrypted_value
+            config_obj["updated_at"] = now
+            config_obj["revision"] = get_config_revision(config_obj) + 1
+        return conflicts
+    
+    conflicts = modify_config(apply)
+    return {"rekeyed": len(rekeyed) - len(conflicts), "total": len(originals), "conflicts": sorted(conflicts)}
+
+@routes.post('/api/rei/config/rekey')
+async def rekey_configs(request):
+    """
+    更换加密密码：用新密码重新加密所有加密的配置项
+    请求体: {"old_password": ..., "new_password": ...}
+    带 ?stream=true 时以 NDJSON 流式返回 {"type": "progress", "done": n, "total": m}，
+    结束时输出 {"type": "done", ...} 或 {"type": "error", "error": ...}
+    """
+    try:
+        data = await request.json()
+    except json.JSONDecodeError:
+        return web.json_response({"error": "无效的JSON数据"}, status=400)
+    if not isinstance(data, dict):
+        data = {}
+    old_password = data.get('old_password')
+    new_password = data.get('new_password')
+    if not isinstance(old_password, str) or not old_password:
+        return web.json_response({"error": "原密码不能为空"}, status=400)
+    if not isinstance(new_password, str) or not new_password:
+        return web.json_response({"error": "新密码不能为空"}, status=400)
+    
+    def error_payload(e):
+        print(f"[ReiConfig] 更换密码失败: {e}")
+        return {"error": f"更换密码失败: {str(e)}"}
+    
+    if request.query.get('stream', 'false').lower() in ('1', 'true'):
+        return await _stream_blocking(
+            request, 'rekey', _rekey_configs, old_password, new_password,
+            progress_payload=lambda done, total: {"done": done, "total": total},
+            done_payload=lambda result: {"success": True, **result},
+            error_payload=error_payload
+        )
+    
+    try:
+        result = await run_blocking(
+            request, 'rekey', _rekey_configs, old_password, new_password, cancel=CancelToken()
+        )
+        print(f"[ReiConfig] 成功更换密码: {result['rekeyed']}/{result['total']} 项")
+        return web.json_response({"success": True, **result})
+    except ValueError as e:
+        return web.json_response({"error": str(e)}, status=400)
+    except Exception as e:
+        return web.json_response(error_payload(e), status=500)
+
+def _parse_expected_revision(raw):
+    """解析客户端提交的 expected_revision，未提交时返回 None，格式错误时抛出 ValueError"""
+    if raw is None or raw == '':
+        return None
+    if isinstance(raw, (bool, float)):
+        raise ValueError
+    revision = int(raw)
+    if revision < 0:
+        raise ValueError
+    return revision
+
+def _conflict_response(e):
+    """乐观并发检查失败时的 409 响应，附带当前版本号以便客户端重新同步"""
+    return web.json_response(
+        {"error": str(e), "conflict": True, "key": e.key, "revision": e.current_revision}, 
+        status=409
+    )
+
+def _update_config_entry(key, converted_value, value_type, is_encrypted, expected_revision):
+    """在写锁内更新单个配置项，返回新的版本号"""
+    def apply(configs):
+        previous = configs.get(key)
+        check_config_revision(key, previous, expected_revision)
+        configs[key] = build_config_entry(converted_value, value_type, is_encrypted, previous)
+        return configs[key]["revision"]
+    return modify_config(apply)
+
+def _delete_config_entry(key, expected_revision):
+    """在写锁内删除单个配置项，键不存在时返回 False"""
+    def apply(configs):
+        if key not in configs:
+            return False
+        check_config_revision(key, configs[key], expected_revision)
+        del configs[key]
+        return True
+    return modify_config(apply)
+
 @routes.post('/api/rei/config/update')
 async def update_config(request):
-    """更新配置"""
+    """
+    更新配置
+    可选的 expected_revision 为客户端看到的版本号（新建时为 0），
+    与当前版本不一致时返回 409，不覆盖其他客户端的修改
+    """
     try:
         # 使用 FormData 方式接收数据
         data = await request.post()
@@ -842,6 +1558,11 @@ async def update_config(request):
                 status=400
             )
         
+        try:
+            expected_revision = _parse_expected_revision(data.get('expected_revision'))
+        except ValueError:
+            return web.json_response({"error": "expected_revision 必须是非负整数"}, status=400)
+        
         # 转换值类型
         converted_value = _convert_value(value, value_type)
         if converted_value is None and value_type != 'string':
@@ -851,22 +1572,20 @@ async def update_config(request):
             )
         
         # 保存配置（新的对象结构）
-        configs = load_config()
-        configs[key] = {
-            "value": converted_value,
-            "type": value_type,
-            "encrypted": is_encrypted,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
-        }
-        save_config(configs)
+        revision = await run_blocking(
+            request, 'config-write', _update_config_entry,
+            key, converted_value, value_type, is_encrypted, expected_revision
+        )
         
         print(f"[ReiConfig] 成功更新配置: {key} = {converted_value}")
         return web.json_response({
             "success": True,
-            "message": f"成功更新配置: {key}"
+            "message": f"成功更新配置: {key}",
+            "revision": revision
         })
         
+    except ConfigConflict as e:
+        return _conflict_response(e)
     except Exception as e:
         print(f"[ReiConfig] 更新配置失败: {e}")
         return web.json_response(
@@ -876,7 +1595,7 @@ async def update_config(request):
 
 @routes.post('/api/rei/config/delete')
 async def delete_config(request):
-    """删除配置"""
+    """删除配置（可选的 expected_revision 与 update 相同）"""
     try:
         # 使用 FormData 方式接收数据
         data = await request.post()
@@ -888,22 +1607,28 @@ async def delete_config(request):
                 status=400
             )
         
-        configs = load_config()
-        if key not in configs:
+        try:
+            expected_revision = _parse_expected_revision(data.get('expected_revision'))
+        except ValueError:
+            return web.json_response({"error": "expected_revision 必须是非负整数"}, status=400)
+        
+        removed = await run_blocking(
+            request, 'config-write', _delete_config_entry, key, expected_revision
+        )
+        if not removed:
             return web.json_response(
                 {"error": f"配置键 '{key}' 不存在"}, 
                 status=404
             )
         
-        del configs[key]
-        save_config(configs)
-        
         print(f"[ReiConfig] 成功删除配置: {key}")
         return web.json_response({
             "success": True,
             "message": f"成功删除配置: {key}"
         })
         
+    except ConfigConflict as e:
+        return _conflict_response(e)
     except Exception as e:
         print(f"[ReiConfig] 删除配置失败: {e}")
         return web.json_response(
@@ -911,6 +1636,114 @@ async def delete_config(request):
             status=500
         )
 
+# 单次批量修改最多接受的操作数量
+MAX_BATCH_OPERATIONS = 10000
+
+def _apply_config_operation(configs, operation):
+    """
+    将单个批量操作应用到 configs 上
+    
+    Returns:
+        {"key": ..., "op": ..., "success": bool, "revision": 新版本号（upsert 成功时）,
+         "error": 错误信息（失败时）, "conflict": true（版本冲突时）}
+    """
+    if not isinstance(operation, dict):
+        return {"key": None, "op": None, "success": False, "error": "操作必须是对象"}
+    op = operation.get('op')
+    key = operation.get('key')
+    result = {"key": key, "op": op, "success": False}
+    if not isinstance(key, str) or not key.strip():
+        result["error"] = "键名不能为空"
+        return result
+    key = key.strip()
+    result["key"] = key
+    
+    try:
+        expected_revision = _parse_expected_revision(operation.get('expected_revision'))
+    except (TypeError, ValueError):
+        result["error"] = "expected_revision 必须是非负整数"
+        return result
+    
+    try:
+        if op == 'delete':
+            if key not in configs:
+                result["error"] = f"配置键 '{key}' 不存在"
+                return result
+            check_config_revision(key, configs[key], expected_revision)
+            del configs[key]
+        elif op == 'upsert':
+            value = operation.get('value', '')
+            value_type = operation.get('type', 'string')
+            is_encrypted = operation.get('encrypted', False) is True
+            if not isinstance(value, str):
+                # JSON 中的数字、布尔值等按表单提交时的字符串形式处理
+                value = json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else str(value)
+            converted_value = _convert_value(value, value_type)
+            if converted_value is None and value_type != 'string':
+                result["error"] = f"无法将 '{value}' 转换为 {value_type} 类型"
+                return result
+            previous = configs.get(key)
+            check_config_revision(key, previous, expected_revision)
+            configs[key] = build_config_entry(converted_value, value_type, is_encrypted, previous)
+            result["revision"] = configs[key]["revision"]
+        else:
+            result["error"] = f"不支持的操作: {op}"
+            return result
+    except ConfigConflict as e:
+        result["error"] = str(e)
+        result["conflict"] = True
+        result["revision"] = e.current_revision
+        return result
+    
+    result["success"] = True
+    return result
+
+def _apply_config_batch(operations):
+    """
+    在同一份配置上依次执行所有操作，有修改时只写入一次
+    失败的操作不影响其他操作
+    """
+    results = modify_config(
+        lambda configs: [_apply_config_operation(configs, operation) for operation in operations]
+    )
+    applied = sum(1 for result in results if result["success"])
+    return {"applied": applied, "failed": len(results) - applied, "results": results}
+
+@routes.post('/api/rei/config/batch')
+async def batch_update_configs(request):
+    """
+    批量修改配置
+    请求体: {"operations": [
+        {"op": "upsert", "key": ..., "value": ..., "type": "string", "encrypted": false},
+        {"op": "delete", "key": ...}, ...
+    ]}
+    每个操作都可以带 expected_revision 做乐观并发检查（与 update 相同）。
+    按顺序应用到同一份配置上并一次性写入，返回每个操作的结果
+    """
+    try:
+        data = await request.json()
+    except json.JSONDecodeError:
+        return web.json_response({"error": "无效的JSON数据"}, status=400)
+    operations = data.get('operations') if isinstance(data, dict) else None
+    if not isinstance(operations, list):
+        return web.json_response({"error": "operations 必须是数组"}, status=400)
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        return web.json_response(
+            {"error": f"一次最多执行 {MAX_BATCH_OPERATIONS} 个操作"}, 
+            status=400
+        )
+    
+    try:
+        result = await run_blocking(request, 'config-write', _apply_config_batch, operations)
+        print(f"[ReiConfig] 批量修改配置: 成功 {result['applied']} 个，失败 {result['failed']} 个")
+        return web.json_response({"success": result["failed"] == 0, **result})
+    except Exception as e:
+        print(f"[ReiConfig] 批量修改配置失败: {e}")
+        return web.json_response(
+            {"error": f"批量修改配置失败: {str(e)}"}, 
+            status=500
+        )
+
 def _convert_value(value, value_type):
     """转换值类型"""
     try:
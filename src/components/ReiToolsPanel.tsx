@@ -1,4 +1,10 @@
-import React, { useCallback, useEffect, useMemo, useState } from 'react';
+import React, {
+  useCallback,
+  useEffect,
+  useMemo,
+  useRef,
+  useState,
+} from 'react';
 import { FloatingPanel } from './FloatingPanel';
 import FileSelector from '../utils/fileSelector';
 import './ReiToolsPanel.css';
@@ -51,6 +57,8 @@ export const ReiToolsPanel: React.FC<ReiToolsPanelProps> = ({
 
   // 预设管理相关状态
   const [selectedPreset, setSelectedPreset] = useState<any>(null);
+  // 本页面自己保存的预设，收到对应的变更事件时不提示
+  const ownPresetSaves = useRef<Set<string>>(new Set());
   const [presetName, setPresetName] = useState<string>('');
   const [presetTitle, setPresetTitle] = useState<string>('');
   const [presetDescription, setPresetDescription] = useState<string>('');
@@ -87,6 +95,7 @@ export const ReiToolsPanel: React.FC<ReiToolsPanelProps> = ({
         loraLoaderNodes: loraLoaderNodes,
       };
 
+      ownPresetSaves.current.add(presetName.trim());
       const response = await fetch('/api/rei/presets/save', {
         method: 'POST',
         headers: {
@@ -103,6 +112,7 @@ export const ReiToolsPanel: React.FC<ReiToolsPanelProps> = ({
       });
 
       if (!response.ok) {
+        ownPresetSaves.current.delete(presetName.trim());
         const errorData = await response.json();
         throw new Error(errorData.error || `HTTP ${response.status}`);
       }
@@ -933,6 +943,37 @@ export const ReiToolsPanel: React.FC<ReiToolsPanelProps> = ({
     [modelPaths, loraPaths, modelLoaderNodes, loraLoaderNodes]
   );
 
+  // 接收服务端推送的预设变更（rei.presets.changed），当前加载的预设被其他页面修改时提示
+  useEffect(() => {
+    const api = window.comfyUIAPI;
+    if (!api) return;
+
+    const handlePresetsChanged = (event: any) => {
+      const changes = event.detail?.changes || [];
+      changes.forEach((change: any) => {
+        if (
+          change.action === 'saved' &&
+          ownPresetSaves.current.delete(change.name)
+        ) {
+          return;
+        }
+        if (!selectedPreset || selectedPreset.name !== change.name) return;
+        if (change.action === 'deleted') {
+          setPresetMessage(`预设 "${change.name}" 已在其他页面被删除`);
+        } else if (change.preset?.updated_at !== selectedPreset.updated_at) {
+          setPresetMessage(
+            `预设 "${change.name}" 已在其他页面更新，重新加载可获取最新内容`
+          );
+        }
+      });
+    };
+
+    api.addEventListener('rei.presets.changed', handlePresetsChanged);
+    return () => {
+      api.removeEventListener('rei.presets.changed', handlePresetsChanged);
+    };
+  }, [selectedPreset]);
+
   // 当预设相关状态变化时刷新参数列表
   useEffect(() => {
     refreshParamsList('preset update');
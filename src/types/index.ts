@@ -85,6 +85,7 @@ declare global {
   interface Window {
     app?: ComfyUIApp;
     comfyUIAPP?: ComfyUIApp;
+    comfyUIAPI?: any;
     React?: any;
     ReactDOM?: any;
     ReiToolsUI?: any;
@@ -49,6 +49,7 @@ interface DirectoryData {
   total_items: number;
   total_files: number;
   total_directories: number;
+  next_cursor?: string | null;
   base_path: string;
   base_dir?: string; // 新增：当前使用的base目录
   comfyui_root?: string; // 新增：ComfyUI根目录信息
@@ -107,6 +108,121 @@ export async function fetchSystemFileSystemData(
   }
 }
 
+/**
+ * 批量获取目录的子项数量（流式返回，每完成一个目录回调一次）
+ */
+export async function fetchChildCounts(
+  paths: string[],
+  onResult: (
+    path: string,
+    counts: { children_count: number; file_count: number; dir_count: number }
+  ) => void
+) {
+  if (paths.length === 0) return;
+
+  const response = await fetch('/api/rei/filesystem/child-counts', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ paths }),
+  });
+
+  if (!response.ok || !response.body) {
+    throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  const handleLine = (line: string) => {
+    if (!line.trim()) return;
+    const data = JSON.parse(line);
+    if (data.path !== undefined) {
+      onResult(data.path, data);
+    }
+  };
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split('\n');
+    buffer = lines.pop() || '';
+    lines.forEach(handleLine);
+  }
+  handleLine(buffer);
+}
+
+// 目录列表每页的条目数量，其余条目滚动到底部或点击“加载更多”时按游标加载
+const DIRECTORY_PAGE_SIZE = 200;
+
+/**
+ * 目录列表的分页加载
+ * 内容区域滚动到底部或点击“加载更多”时，用上一页返回的 next_cursor 请求下一页
+ */
+function createListPager(
+  content: HTMLElement,
+  loadPage: (cursor: string) => Promise<void>
+) {
+  let nextCursor: string | null = null;
+  let loading = false;
+  let shown = 0;
+
+  const row = document.createElement('div');
+  row.style.cssText = `
+    text-align: center;
+    padding: 12px;
+    margin: 4px 0;
+    color: #4CAF50;
+    font-size: 13px;
+    cursor: pointer;
+    border-radius: 6px;
+    background: rgba(255, 255, 255, 0.05);
+  `;
+
+  async function loadMore() {
+    if (!nextCursor || loading) return;
+    const cursor = nextCursor;
+    loading = true;
+    row.textContent = '加载中...';
+    try {
+      await loadPage(cursor);
+    } catch (error) {
+      console.error('加载下一页失败:', error);
+      row.textContent = '加载失败，点击重试';
+    } finally {
+      loading = false;
+    }
+  }
+
+  row.addEventListener('click', loadMore);
+  content.addEventListener('scroll', () => {
+    if (content.scrollTop + content.clientHeight >= content.scrollHeight - 200) {
+      loadMore();
+    }
+  });
+
+  return {
+    // 切换目录时清空分页状态
+    reset() {
+      nextCursor = null;
+      shown = 0;
+      row.remove();
+    },
+    // 每渲染完一页调用一次，有下一页时在列表末尾显示“加载更多”
+    update(cursor: string | null, pageItems: number, total: number) {
+      nextCursor = cursor;
+      shown += pageItems;
+      if (cursor) {
+        row.textContent = `加载更多（已显示 ${shown} / ${total} 项）`;
+        content.appendChild(row);
+      } else {
+        row.remove();
+      }
+    },
+  };
+}
+
 /**
  * 创建文件选择器Promise
  * 返回一个Promise，用户选择文件后resolve，取消时reject
@@ -436,19 +552,27 @@ async function createNativeFileSelector(
     return new Date(timestamp * 1000).toLocaleString('zh-CN');
   }
 
-  // 加载目录内容的函数
-  async function loadDirectory(path: string) {
-    content.innerHTML =
-      '<div style="text-align: center; padding: 40px; color: #cccccc; font-size: 16px;">📂 加载中...</div>';
-    pathDisplay.innerHTML = '加载中...';
-    infoBar.innerHTML = '';
+  const pager = createListPager(content, (cursor) =>
+    loadDirectory(currentPath, cursor)
+  );
+
+  // 加载目录内容的函数，cursor 不为空时在当前列表后追加下一页
+  async function loadDirectory(path: string, cursor: string | null = null) {
+    const append = cursor !== null;
+    if (!append) {
+      pager.reset();
+      content.innerHTML =
+        '<div style="text-align: center; padding: 40px; color: #cccccc; font-size: 16px;">📂 加载中...</div>';
+      pathDisplay.innerHTML = '加载中...';
+      infoBar.innerHTML = '';
 
-    // 重置选择状态
-    selectedItem = null;
-    selectedInfo.textContent = '';
-    confirmButton.disabled = true;
-    confirmButton.style.opacity = '0.5';
-    confirmButton.style.cursor = 'not-allowed';
+      // 重置选择状态
+      selectedItem = null;
+      selectedInfo.textContent = '';
+      confirmButton.disabled = true;
+      confirmButton.style.opacity = '0.5';
+      confirmButton.style.cursor = 'not-allowed';
+    }
 
     try {
       const showFiles = mode === 'file' || mode === 'both';
@@ -465,6 +589,11 @@ async function createNativeFileSelector(
         url += `&file_types=${allowedExtensions.join(',')}`;
       }
 
+      url += `&limit=${DIRECTORY_PAGE_SIZE}`;
+      if (append) {
+        url += `&cursor=${encodeURIComponent(cursor)}`;
+      }
+
       const response = await fetch(url);
 
       if (!response.ok) {
@@ -480,41 +609,46 @@ async function createNativeFileSelector(
         throw new Error('响应数据格式错误');
       }
 
-      currentPath = data.path;
-      parentPath = data.parent_path;
-
-      // 更新路径显示
-      pathDisplay.innerHTML = `
-        <span style="color: #999;">当前路径:</span>
-        <span style="color: #4CAF50; font-family: monospace; margin-left: 8px; font-weight: bold;">
-          ${data.path || '根目录'}
-        </span>
-      `;
-
-      // 更新目录信息
-      infoBar.innerHTML = `
-        <span>📂 ${data.total_directories} 个文件夹</span>
-        <span>📄 ${data.total_files} 个文件</span>
-        <span>📊 共 ${data.total_items} 项</span>
-      `;
+      if (append) {
+        // 已切换到其他目录时丢弃这一页
+        if (data.path !== currentPath) return;
+      } else {
+        currentPath = data.path;
+        parentPath = data.parent_path;
+
+        // 更新路径显示
+        pathDisplay.innerHTML = `
+          <span style="color: #999;">当前路径:</span>
+          <span style="color: #4CAF50; font-family: monospace; margin-left: 8px; font-weight: bold;">
+            ${data.path || '根目录'}
+          </span>
+        `;
 
-      // 更新返回按钮状态
-      backButton.disabled = parentPath === null;
-      backButton.style.opacity = parentPath === null ? '0.5' : '1';
-      backButton.style.cursor = parentPath === null ? 'not-allowed' : 'pointer';
-
-      // 清空内容区域
-      content.innerHTML = '';
-
-      if (data.items.length === 0) {
-        content.innerHTML = `
-          <div style="text-align: center; padding: 60px 20px; color: #999999;">
-            <div style="font-size: 48px; margin-bottom: 16px;">📂</div>
-            <div style="font-size: 16px; margin-bottom: 8px;">此目录为空</div>
-            <div style="font-size: 14px; color: #666;">没有符合条件的文件或文件夹</div>
-          </div>
+        // 更新目录信息
+        infoBar.innerHTML = `
+          <span>📂 ${data.total_directories} 个文件夹</span>
+          <span>📄 ${data.total_files} 个文件</span>
+          <span>📊 共 ${data.total_items} 项</span>
         `;
-        return;
+
+        // 更新返回按钮状态
+        backButton.disabled = parentPath === null;
+        backButton.style.opacity = parentPath === null ? '0.5' : '1';
+        backButton.style.cursor = parentPath === null ? 'not-allowed' : 'pointer';
+
+        // 清空内容区域
+        content.innerHTML = '';
+
+        if (data.items.length === 0) {
+          content.innerHTML = `
+            <div style="text-align: center; padding: 60px 20px; color: #999999;">
+              <div style="font-size: 48px; margin-bottom: 16px;">📂</div>
+              <div style="font-size: 16px; margin-bottom: 8px;">此目录为空</div>
+              <div style="font-size: 14px; color: #666;">没有符合条件的文件或文件夹</div>
+            </div>
+          `;
+          return;
+        }
       }
 
       // 渲染文件列表
@@ -655,7 +789,11 @@ async function createNativeFileSelector(
 
         content.appendChild(itemElement);
       });
+
+      pager.update(data.next_cursor ?? null, data.items.length, data.total_items);
     } catch (error) {
+      if (append) throw error;
+
       content.innerHTML = `
         <div style="text-align: center; padding: 60px 20px; color: #f44336;">
           <div style="font-size: 48px; margin-bottom: 16px;">❌</div>
@@ -1003,30 +1141,57 @@ async function createNativeSystemFileSelector(
     return new Date(timestamp * 1000).toLocaleString('zh-CN');
   }
 
-  // 加载目录内容的函数
-  async function loadDirectory(path: string) {
-    content.innerHTML =
-      '<div style="text-align: center; padding: 40px; color: #cccccc; font-size: 16px;">📂 加载中...</div>';
-    pathDisplay.innerHTML = '加载中...';
-    infoBar.innerHTML = '';
+  // 格式化目录的子项数量
+  function formatChildCounts(counts: {
+    children_count?: number;
+    file_count?: number;
+    dir_count?: number;
+  }): string {
+    let detailText = `${counts.children_count || 0} 项`;
+    if (counts.file_count !== undefined && counts.dir_count !== undefined) {
+      detailText += ` (${counts.dir_count} 文件夹, ${counts.file_count} 文件)`;
+    }
+    return detailText;
+  }
 
-    // 重置选择状态
-    selectedItem = null;
-    selectedInfo.textContent = '';
-    confirmButton.disabled = true;
-    confirmButton.style.opacity = '0.5';
-    confirmButton.style.cursor = 'not-allowed';
+  const pager = createListPager(content, (cursor) =>
+    loadDirectory(currentPath, cursor)
+  );
+
+  // 加载目录内容的函数，cursor 不为空时在当前列表后追加下一页
+  async function loadDirectory(path: string, cursor: string | null = null) {
+    const append = cursor !== null;
+    if (!append) {
+      pager.reset();
+      content.innerHTML =
+        '<div style="text-align: center; padding: 40px; color: #cccccc; font-size: 16px;">📂 加载中...</div>';
+      pathDisplay.innerHTML = '加载中...';
+      infoBar.innerHTML = '';
+
+      // 重置选择状态
+      selectedItem = null;
+      selectedInfo.textContent = '';
+      confirmButton.disabled = true;
+      confirmButton.style.opacity = '0.5';
+      confirmButton.style.cursor = 'not-allowed';
+    }
 
     try {
       const showFiles = mode === 'file' || mode === 'both';
+      // 子项数量由 child-counts 接口异步补全
       let url = `/api/rei/filesystem/browse-system?path=${encodeURIComponent(
         path
-      )}&show_files=${showFiles}`;
+      )}&show_files=${showFiles}&counts=false`;
 
       if (allowedExtensions.length > 0) {
         url += `&file_types=${allowedExtensions.join(',')}`;
       }
 
+      url += `&limit=${DIRECTORY_PAGE_SIZE}`;
+      if (append) {
+        url += `&cursor=${encodeURIComponent(cursor)}`;
+      }
+
       const response = await fetch(url);
 
       if (!response.ok) {
@@ -1042,44 +1207,50 @@ async function createNativeSystemFileSelector(
         throw new Error('响应数据格式错误');
       }
 
-      currentPath = data.path;
-      parentPath = data.parent_path;
-
-      // 更新路径显示
-      pathDisplay.innerHTML = `
-        <span style="color: #999;">当前路径:</span>
-        <span style="color: #4CAF50; font-family: monospace; margin-left: 8px; font-weight: bold;">
-          ${data.path || '系统根目录'}
-        </span>
-      `;
-
-      // 更新目录信息
-      infoBar.innerHTML = `
-        <span>📂 ${data.total_directories} 个文件夹</span>
-        <span>📄 ${data.total_files} 个文件</span>
-        <span>📊 共 ${data.total_items} 项</span>
-      `;
+      if (append) {
+        // 已切换到其他目录时丢弃这一页
+        if (data.path !== currentPath) return;
+      } else {
+        currentPath = data.path;
+        parentPath = data.parent_path;
+
+        // 更新路径显示
+        pathDisplay.innerHTML = `
+          <span style="color: #999;">当前路径:</span>
+          <span style="color: #4CAF50; font-family: monospace; margin-left: 8px; font-weight: bold;">
+            ${data.path || '系统根目录'}
+          </span>
+        `;
 
-      // 更新返回按钮状态
-      backButton.disabled = parentPath === null;
-      backButton.style.opacity = parentPath === null ? '0.5' : '1';
-      backButton.style.cursor = parentPath === null ? 'not-allowed' : 'pointer';
-
-      // 清空内容区域
-      content.innerHTML = '';
-
-      if (data.items.length === 0) {
-        content.innerHTML = `
-          <div style="text-align: center; padding: 60px 20px; color: #999999;">
-            <div style="font-size: 48px; margin-bottom: 16px;">📂</div>
-            <div style="font-size: 16px; margin-bottom: 8px;">此目录为空</div>
-            <div style="font-size: 14px; color: #666;">没有符合条件的文件或文件夹</div>
-          </div>
+        // 更新目录信息
+        infoBar.innerHTML = `
+          <span>📂 ${data.total_directories} 个文件夹</span>
+          <span>📄 ${data.total_files} 个文件</span>
+          <span>📊 共 ${data.total_items} 项</span>
         `;
-        return;
+
+        // 更新返回按钮状态
+        backButton.disabled = parentPath === null;
+        backButton.style.opacity = parentPath === null ? '0.5' : '1';
+        backButton.style.cursor = parentPath === null ? 'not-allowed' : 'pointer';
+
+        // 清空内容区域
+        content.innerHTML = '';
+
+        if (data.items.length === 0) {
+          content.innerHTML = `
+            <div style="text-align: center; padding: 60px 20px; color: #999999;">
+              <div style="font-size: 48px; margin-bottom: 16px;">📂</div>
+              <div style="font-size: 16px; margin-bottom: 8px;">此目录为空</div>
+              <div style="font-size: 14px; color: #666;">没有符合条件的文件或文件夹</div>
+            </div>
+          `;
+          return;
+        }
       }
 
       // 渲染文件列表
+      const pendingCounts = new Map<string, HTMLElement>();
       data.items.forEach((item: FileItem) => {
         const itemElement = document.createElement('div');
         itemElement.style.cssText = `
@@ -1135,11 +1306,13 @@ async function createNativeSystemFileSelector(
         `;
 
         if (item.type === 'directory') {
-          let detailText = `${item.children_count || 0} 项`;
-          if (item.file_count !== undefined && item.dir_count !== undefined) {
-            detailText += ` (${item.dir_count} 文件夹, ${item.file_count} 文件)`;
+          if (item.children_count === undefined) {
+            // 子项数量由 child-counts 接口异步补全
+            details.innerHTML = '… 项';
+            pendingCounts.set(item.path, details);
+          } else {
+            details.innerHTML = formatChildCounts(item);
           }
-          details.innerHTML = detailText;
         } else {
           let detailText = formatFileSize(item.size || 0);
           if (item.extension) {
@@ -1217,7 +1390,22 @@ async function createNativeSystemFileSelector(
 
         content.appendChild(itemElement);
       });
+
+      // 逐步补全目录的子项数量；切换目录后不再更新旧的元素
+      const loadedPath = currentPath;
+      fetchChildCounts(Array.from(pendingCounts.keys()), (itemPath, counts) => {
+        const element = pendingCounts.get(itemPath);
+        if (element && currentPath === loadedPath) {
+          element.innerHTML = formatChildCounts(counts);
+        }
+      }).catch((error) => {
+        console.error('获取子项数量失败:', error);
+      });
+
+      pager.update(data.next_cursor ?? null, data.items.length, data.total_items);
     } catch (error) {
+      if (append) throw error;
+
       content.innerHTML = `
         <div style="text-align: center; padding: 60px 20px; color: #f44336;">
           <div style="font-size: 48px; margin-bottom: 16px;">❌</div>
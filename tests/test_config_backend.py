@@ -0,0 +1,72 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from _package import load_module
+
+config_backend = load_module('config_backend')
+
+
+class MigrateJsonToSqliteTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.json_path = os.path.join(tmp.name, 'env_config.json')
+        self.db_path = os.path.join(tmp.name, 'env_config.sqlite')
+        self.data = {
+            'token': {'value': 'rei:v2:abc', 'type': 'string', 'encrypted': True,
+                      'revision': 3, 'updated_at': '2026-01-01T00:00:00'},
+            'steps': {'value': 20, 'type': 'integer', 'encrypted': False},
+            'legacy': '旧格式的值',
+        }
+        with open(self.json_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False)
+
+    def backends(self):
+        backend = config_backend.SqliteConfigBackend(self.db_path)
+        self.addCleanup(lambda: backend._connect().close())
+        return config_backend.JsonConfigBackend(self.json_path), backend
+
+    def test_migrates_once(self):
+        json_backend, sqlite_backend = self.backends()
+        self.assertEqual(config_backend.migrate_json_to_sqlite(json_backend, sqlite_backend), 3)
+        self.assertEqual(sqlite_backend.read_all(), self.data)
+        self.assertFalse(os.path.exists(self.json_path))
+        self.assertTrue(os.path.exists(self.json_path + '.migrated'))
+        self.assertEqual(sqlite_backend.get_meta('migrated_from'), self.json_path)
+
+        # 已迁移过时即使 JSON 文件重新出现也不会再次导入
+        with open(self.json_path, 'w', encoding='utf-8') as f:
+            json.dump({'other': 1}, f)
+        self.assertEqual(config_backend.migrate_json_to_sqlite(json_backend, sqlite_backend), 0)
+        self.assertNotIn('other', sqlite_backend.read_all())
+
+    def test_index_columns(self):
+        json_backend, sqlite_backend = self.backends()
+        config_backend.migrate_json_to_sqlite(json_backend, sqlite_backend)
+        with sqlite3.connect(self.db_path) as conn:
+            rows = dict((key, rest) for key, *rest in conn.execute(
+                'SELECT key, type, encrypted, updated_at FROM configs'))
+        self.assertEqual(rows['token'], ['string', 1, '2026-01-01T00:00:00'])
+        self.assertEqual(rows['steps'], ['integer', 0, ''])
+        self.assertEqual(rows['legacy'], ['string', 0, ''])
+        self.assertEqual(sqlite_backend.read_keys(['steps', 'missing']), {'steps': self.data['steps']})
+
+    def test_skips_non_empty_database(self):
+        json_backend, sqlite_backend = self.backends()
+        sqlite_backend.write({'existing': 1}, ['existing'], [])
+        self.assertEqual(config_backend.migrate_json_to_sqlite(json_backend, sqlite_backend), 0)
+        self.assertEqual(sqlite_backend.read_all(), {'existing': 1})
+        self.assertTrue(os.path.exists(self.json_path))
+
+    def test_no_json_file(self):
+        os.remove(self.json_path)
+        json_backend, sqlite_backend = self.backends()
+        self.assertEqual(config_backend.migrate_json_to_sqlite(json_backend, sqlite_backend), 0)
+        self.assertTrue(sqlite_backend.is_empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
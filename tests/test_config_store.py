@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from _package import load_module
+
+try:
+    import folder_paths  # ComfyUI 提供
+except ImportError:
+    folder_paths = None
+
+
+@unittest.skipIf(folder_paths is None, '需要在 ComfyUI 环境中运行')
+class ConfigTestCase(unittest.TestCase):
+    """在临时目录中使用独立的配置存储"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base_path = tmp.name
+        self.utils = load_module('utils')
+        patches = [
+            mock.patch.object(folder_paths, 'base_path', tmp.name),
+            mock.patch.dict(os.environ, {'REI_CONFIG_BACKEND': 'json'}),
+            mock.patch.object(self.utils, '_backend', None),
+            mock.patch.object(self.utils, '_config_store', self.utils.ConfigStore()),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def put(self, key, value, expected_revision=None):
+        utils = self.utils
+
+        def apply(configs):
+            previous = configs.get(key)
+            utils.check_config_revision(key, previous, expected_revision)
+            configs[key] = utils.build_config_entry(value, 'string', False, previous)
+            return configs[key]['revision']
+        return utils.modify_config(apply)
+
+
+class ConfigRevisionTest(ConfigTestCase):
+    def test_revision_increments(self):
+        self.assertEqual(self.put('a', 'x', expected_revision=0), 1)
+        created_at = self.utils.get_config_snapshot()['a']['created_at']
+        self.assertEqual(self.put('a', 'y', expected_revision=1), 2)
+        entry = self.utils.get_config_snapshot()['a']
+        self.assertEqual((entry['value'], entry['revision'], entry['created_at']), ('y', 2, created_at))
+
+    def test_conflict_leaves_config_unchanged(self):
+        self.put('a', 'x')
+        self.put('a', 'y')
+        with self.assertRaises(self.utils.ConfigConflict) as ctx:
+            self.put('a', 'z', expected_revision=1)
+        self.assertEqual((ctx.exception.key, ctx.exception.expected_revision,
+                          ctx.exception.current_revision), ('a', 1, 2))
+        self.assertEqual(self.utils.get_config_snapshot()['a']['value'], 'y')
+
+    def test_create_conflicts_with_existing_key(self):
+        self.put('a', 'x')
+        with self.assertRaises(self.utils.ConfigConflict):
+            self.put('a', 'y', expected_revision=0)
+
+    def test_legacy_entry_is_revision_one(self):
+        self.utils.modify_config(lambda configs: configs.__setitem__('old', 'plain'))
+        self.assertEqual(self.put('old', 'new', expected_revision=1), 2)
+
+
+class ConfigManagerNodeTest(ConfigTestCase):
+    def setUp(self):
+        super().setUp()
+        self.node = load_module('ReiConfigManager').ReiConfigManager()
+
+    def test_update_keeps_revision_and_timestamps(self):
+        self.put('a', 'x')
+        created_at = self.utils.get_config_snapshot()['a']['created_at']
+        self.node.manage_config('update', 'a', '5', 'integer')
+        entry = self.utils.get_config_snapshot()['a']
+        self.assertEqual((entry['value'], entry['type'], entry['revision']), (5, 'integer', 2))
+        self.assertEqual(entry['created_at'], created_at)
+        self.assertIn('updated_at', entry)
+
+    def test_delete(self):
+        self.put('a', 'x')
+        self.node.manage_config('delete', 'a')
+        self.assertNotIn('a', self.utils.get_config_snapshot())
+        result = self.node.manage_config('delete', 'a')['result'][0]
+        self.assertIn('不存在', result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import base64
+import os
+import struct
+import threading
+import unittest
+
+from _package import load_module
+
+try:
+    crypto_utils = load_module('crypto_utils')
+except ImportError:  # 未安装 cryptography
+    crypto_utils = None
+
+
+@unittest.skipIf(crypto_utils is None, 'cryptography 未安装')
+class DerivedKeyCacheUsageTest(unittest.TestCase):
+    def setUp(self):
+        crypto_utils.key_cache.clear()
+        self.addCleanup(crypto_utils.key_cache.clear)
+
+    def cached(self):
+        return len(crypto_utils.key_cache._entries)
+
+    def test_random_salt_not_cached(self):
+        crypto_utils.TokenCrypto.encrypt_token('secret', 'pw', iterations=1000)
+        crypto_utils.TokenCrypto.encrypt_token('secret', 'pw', iterations=1000, version=2)
+        self.assertEqual(self.cached(), 0)
+
+    def test_vault_salt_and_decrypt_cached(self):
+        salt = os.urandom(16)
+        encrypted = crypto_utils.TokenCrypto.encrypt_token('secret', 'pw', salt, 1000)
+        self.assertEqual(self.cached(), 1)
+        crypto_utils.TokenCrypto.decrypt_token(encrypted, 'pw')
+        self.assertEqual(self.cached(), 1)
+
+        encrypted = crypto_utils.TokenCrypto.encrypt_token('secret', 'pw', iterations=1000)
+        crypto_utils.TokenCrypto.decrypt_token(encrypted, 'pw')
+        self.assertEqual(self.cached(), 2)
+
+
+@unittest.skipIf(crypto_utils is None, 'cryptography 未安装')
+class EnvelopeTest(unittest.TestCase):
+    def test_v1_round_trip(self):
+        crypto = crypto_utils.TokenCrypto
+        encrypted = crypto.encrypt_token('密钥 token', 'pw', version=1)
+        self.assertFalse(encrypted.startswith(crypto_utils.V2_PREFIX))
+        version, salt, iterations, _, _, aad = crypto.parse_envelope(encrypted)
+        self.assertEqual((version, len(salt), iterations, aad),
+                         (1, 16, crypto_utils.PBKDF2_ITERATIONS, None))
+        self.assertEqual(crypto.decrypt_token(encrypted, 'pw'), '密钥 token')
+
+    def test_v2_round_trip(self):
+        crypto = crypto_utils.TokenCrypto
+        salt = os.urandom(24)
+        encrypted = crypto.encrypt_token('密钥 token', 'pw', salt, 1234)
+        self.assertTrue(encrypted.startswith(crypto_utils.V2_PREFIX))
+        version, parsed_salt, iterations, _, _, _ = crypto.parse_envelope(encrypted)
+        self.assertEqual((version, parsed_salt, iterations), (2, salt, 1234))
+        self.assertEqual(crypto.decrypt_token(encrypted, 'pw'), '密钥 token')
+        with self.assertRaises(Exception):
+            crypto.decrypt_token(encrypted, 'wrong')
+
+    def test_v2_header_is_authenticated(self):
+        crypto = crypto_utils.TokenCrypto
+        encrypted = crypto.encrypt_token('secret', 'pw', os.urandom(16), 1000)
+        data = bytearray(base64.b64decode(encrypted[len(crypto_utils.V2_PREFIX):]))
+        data[0:4] = struct.pack('>I', 1001)
+        tampered = crypto_utils.V2_PREFIX + base64.b64encode(bytes(data)).decode('ascii')
+        with self.assertRaises(Exception):
+            crypto.decrypt_token(tampered, 'pw')
+
+    def test_v2_iterations_limit(self):
+        crypto = crypto_utils.TokenCrypto
+        header = struct.pack('>IB', crypto_utils.MAX_ITERATIONS + 1, 16) + os.urandom(16)
+        encrypted = crypto_utils.V2_PREFIX + base64.b64encode(header + os.urandom(28)).decode('ascii')
+        with self.assertRaises(ValueError):
+            crypto.parse_envelope(encrypted)
+        with self.assertRaises(Exception):
+            crypto.encrypt_token('secret', 'pw', os.urandom(16), crypto_utils.MAX_ITERATIONS + 1)
+
+
+@unittest.skipIf(crypto_utils is None, 'cryptography 未安装')
+class RekeyTokensTest(unittest.TestCase):
+    def setUp(self):
+        self.fs_utils = load_module('fs_utils')
+        self.items = [
+            (str(i), crypto_utils.TokenCrypto.encrypt_token(f'value {i}', 'old', iterations=1000))
+            for i in range(40)
+        ]
+
+    def test_rekey(self):
+        salt = os.urandom(16)
+        self.items.append(('bad', 'not encrypted'))
+        rekeyed, failures = crypto_utils.rekey_tokens(self.items, 'old', 'new', salt, 2000, workers=4)
+        self.assertEqual(set(failures), {'bad'})
+        self.assertEqual(len(rekeyed), 40)
+        for key, encrypted in rekeyed.items():
+            self.assertEqual(crypto_utils.TokenCrypto.parse_envelope(encrypted)[1:3], (salt, 2000))
+            self.assertEqual(crypto_utils.TokenCrypto.decrypt_token(encrypted, 'new'), f'value {key}')
+
+    def test_cancel(self):
+        cancel = threading.Event()
+        cancel.set()
+        with self.assertRaises(self.fs_utils.OperationCancelled):
+            crypto_utils.rekey_tokens(self.items, 'old', 'new', os.urandom(16), 1000, cancel=cancel)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+
+from _package import load_module
+
+extension_index = load_module('extension_index')
+fs_utils = load_module('fs_utils')
+
+
+class ExtensionIndexFilesTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = os.path.join(self._tmp.name, 'tree')
+        cache_dir = os.path.join(self._tmp.name, 'cache')
+        old_cache_dir = extension_index.CACHE_DIR
+        extension_index.CACHE_DIR = cache_dir
+        self.addCleanup(setattr, extension_index, 'CACHE_DIR', old_cache_dir)
+        for rel in ('a', 'a-b', os.path.join('a', 'c'), 'b'):
+            os.makedirs(os.path.join(self.root, rel))
+        for rel in ('x.png', 'y.TXT', 'z.png', 'noext',
+                    os.path.join('a', 'q.txt'), os.path.join('a', 'p.png'),
+                    os.path.join('a', 'c', 'm.png'), os.path.join('a-b', 'n.png'),
+                    os.path.join('b', 'o.txt')):
+            with open(os.path.join(self.root, rel), 'w') as f:
+                f.write('x')
+
+    def walk_files(self, extension=None):
+        """os.walk 的结果，目录按路径分量排序，目录内保持列表顺序"""
+        result = []
+        for dirpath, _, names in sorted(
+                os.walk(self.root), key=lambda item: os.path.relpath(item[0], self.root).split(os.sep)):
+            for name in names:
+                if extension is None or fs_utils.get_extension(name) == extension:
+                    result.append(os.path.join(dirpath, name))
+        return result
+
+    def test_files_match_walk_order(self):
+        index = extension_index.ExtensionIndex(self.root).refresh()
+        self.assertEqual(index.files(), self.walk_files())
+        self.assertEqual(index.files('png'), self.walk_files('png'))
+        self.assertEqual(index.files('txt'), self.walk_files('txt'))
+        self.assertEqual(index.summary(), (9, {'png': 5, 'txt': 3}))
+
+    def test_files_after_reload(self):
+        extension_index.ExtensionIndex(self.root).refresh()
+        index = extension_index.ExtensionIndex(self.root).refresh()
+        self.assertEqual(index.files('png'), self.walk_files('png'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import base64
+import json
+import unittest
+
+from _package import load_module
+
+fs_utils = load_module('fs_utils')
+
+
+def make_items():
+    items = [
+        {'name': f'dir{i}', 'type': 'directory', 'modified': 100 - i, 'size': 0, 'extension': ''}
+        for i in range(3)
+    ]
+    items += [
+        {'name': f'file{i:02d}.{"png" if i % 2 else "txt"}', 'type': 'file', 'modified': i * 1.5,
+         'size': (i * 37) % 11, 'extension': 'png' if i % 2 else 'txt'}
+        for i in range(12)
+    ]
+    return items
+
+
+def raw_cursor(value):
+    data = json.dumps(value).encode('utf-8')
+    return base64.urlsafe_b64encode(data).decode('ascii')
+
+
+class PaginateItemsTest(unittest.TestCase):
+    def collect_pages(self, items, sort, order, limit):
+        pages = []
+        cursor = None
+        while True:
+            page, cursor = fs_utils.paginate_items(items, sort, order, limit, cursor)
+            pages.append(page)
+            if cursor is None:
+                return pages
+
+    def test_pages_match_full_sort(self):
+        items = make_items()
+        for sort in fs_utils.SORT_FIELDS:
+            for order in ('asc', 'desc'):
+                full, cursor = fs_utils.paginate_items(items, sort, order)
+                self.assertIsNone(cursor)
+                pages = self.collect_pages(items, sort, order, 4)
+                self.assertEqual([item for page in pages for item in page], full, (sort, order))
+                self.assertTrue(all(len(page) <= 4 for page in pages))
+
+    def test_directories_first(self):
+        for order in ('asc', 'desc'):
+            page, _ = fs_utils.paginate_items(make_items(), 'size', order)
+            types = [item['type'] for item in page]
+            self.assertEqual(types, sorted(types, key=lambda value: value != 'directory'))
+
+    def test_last_page_has_no_cursor(self):
+        page, cursor = fs_utils.paginate_items(make_items(), 'name', 'asc', 15)
+        self.assertEqual(len(page), 15)
+        self.assertIsNone(cursor)
+
+    def test_invalid_sort_and_order(self):
+        with self.assertRaises(ValueError):
+            fs_utils.paginate_items(make_items(), 'owner')
+        with self.assertRaises(ValueError):
+            fs_utils.paginate_items(make_items(), 'name', 'up')
+
+
+class DecodeCursorTest(unittest.TestCase):
+    def test_round_trip(self):
+        _, cursor = fs_utils.paginate_items(make_items(), 'mtime', 'asc', 2)
+        group, value = fs_utils.decode_cursor(cursor, 'mtime')
+        self.assertIs(group, False)
+        self.assertEqual(len(value), 3)
+
+    def test_rejects_malformed(self):
+        for cursor in ['not base64!', raw_cursor({'a': 1}), raw_cursor([1, ['a', 'a']])]:
+            with self.assertRaises(ValueError):
+                fs_utils.decode_cursor(cursor)
+
+    def test_rejects_mismatched_key_shape(self):
+        cases = [
+            ('name', [True, [1, 'x']]),
+            ('name', [True, ['x', 'x', 'x']]),
+            ('mtime', [True, ['x', 'a', 'a']]),
+            ('size', [False, [True, 'a', 'a']]),
+            ('type', [False, [3, 'a', 'a']]),
+        ]
+        for sort, value in cases:
+            with self.assertRaises(ValueError, msg=(sort, value)):
+                fs_utils.decode_cursor(raw_cursor(value), sort)
+            with self.assertRaises(ValueError, msg=(sort, value)):
+                fs_utils.paginate_items(make_items(), sort, 'asc', 2, raw_cursor(value))
+
+    def test_cursor_from_other_sort_is_rejected(self):
+        _, cursor = fs_utils.paginate_items(make_items(), 'name', 'asc', 2)
+        with self.assertRaises(ValueError):
+            fs_utils.paginate_items(make_items(), 'size', 'asc', 2, cursor)
+
+
+if __name__ == '__main__':
+    unittest.main()
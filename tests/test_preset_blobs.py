@@ -0,0 +1,90 @@
+import os
+import tempfile
+import time
+import unittest
+
+from _package import load_module
+
+preset_blobs = load_module('preset_blobs')
+
+
+def big(tag):
+    """编码后超过 BLOB_MIN_SIZE 的子文档"""
+    return {'tag': tag, 'text': tag * preset_blobs.BLOB_MIN_SIZE}
+
+
+class BlobStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = preset_blobs.BlobStore(tmp.name)
+
+    def round_trip(self, preset_data):
+        manifest = preset_blobs.build_manifest(preset_data, self.store)
+        self.assertEqual(preset_blobs.expand_manifest(manifest, self.store), preset_data)
+        return manifest
+
+
+class BlobEscapingTest(BlobStoreTestCase):
+    def test_reserved_keys_round_trip(self):
+        content = {
+            'ref': {preset_blobs.BLOB_REF_KEY: 'not-a-digest'},
+            'literal': {preset_blobs.LITERAL_KEY: {preset_blobs.BLOB_REF_KEY: 'x'}},
+            'nested': [big('a'), {preset_blobs.BLOB_REF_KEY: '0' * 64}],
+            'two_keys': {preset_blobs.BLOB_REF_KEY: 'x', 'other': 1},
+        }
+        self.round_trip({'name': 'demo', 'content': content})
+
+    def test_reserved_top_level_content(self):
+        self.round_trip({'name': 'demo', 'content': {preset_blobs.BLOB_REF_KEY: 'x'}})
+        self.round_trip({'name': 'demo', 'content': {preset_blobs.LITERAL_KEY: big('b')}})
+
+    def test_invalid_digest_rejected(self):
+        for digest in ('../../etc/passwd', 'A' * 64, 1):
+            with self.assertRaises(ValueError):
+                self.store.load_tree({preset_blobs.BLOB_REF_KEY: digest})
+        with self.assertRaises(ValueError):
+            self.store.load_tree({preset_blobs.LITERAL_KEY: 'x'})
+
+    def test_identical_subdocuments_share_a_blob(self):
+        manifest = self.round_trip({'content': {'a': big('x'), 'b': big('x'), 'c': big('y')}})
+        # 只有两个不同的子文档；content 中的子文档替换为引用后足够小，直接内联
+        self.assertEqual(len(manifest['blobs']), 2)
+        self.assertNotIn(preset_blobs.BLOB_REF_KEY, manifest['content_ref'])
+
+
+class BlobGarbageCollectionTest(BlobStoreTestCase):
+    def age(self, digest, seconds):
+        for suffix in ('.zst', '.gz'):
+            path = self.store._path(digest, suffix)
+            if os.path.exists(path):
+                old = time.time() - seconds
+                os.utime(path, (old, old))
+
+    def test_collect_garbage(self):
+        kept = preset_blobs.build_manifest({'content': big('kept')}, self.store)['blobs']
+        stale = preset_blobs.build_manifest({'content': big('stale')}, self.store)['blobs']
+        recent = preset_blobs.build_manifest({'content': big('recent')}, self.store)['blobs']
+        for digest in kept + stale:
+            self.age(digest, preset_blobs.BLOB_GC_GRACE_SECONDS + 60)
+
+        self.assertEqual(self.store.collect_garbage(set(kept)), len(stale))
+        for digest in kept + recent:
+            self.assertTrue(self.store.get(digest))
+        for digest in stale:
+            with self.assertRaises(FileNotFoundError):
+                self.store.get(digest)
+
+    def test_put_refreshes_reused_blob(self):
+        digests = preset_blobs.build_manifest({'content': big('reused')}, self.store)['blobs']
+        for digest in digests:
+            self.age(digest, preset_blobs.BLOB_GC_GRACE_SECONDS + 60)
+        preset_blobs.build_manifest({'content': big('reused')}, self.store)
+        self.assertEqual(self.store.collect_garbage(set()), 0)
+
+    def test_missing_store(self):
+        self.assertEqual(self.store.collect_garbage(set()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
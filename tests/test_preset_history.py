@@ -0,0 +1,76 @@
+import copy
+import hashlib
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preset_history import PresetHistory, _encode, apply_patch, make_patch  # noqa: E402
+
+
+class MakePatchTypeTest(unittest.TestCase):
+    def assertRoundTrip(self, old, new):
+        ops = make_patch(old, new)
+        self.assertTrue(ops)
+        self.assertEqual(_encode(apply_patch(copy.deepcopy(old), ops)), _encode(new))
+
+    def test_nested_bool_int(self):
+        self.assertRoundTrip({'w': [{'v': 1}]}, {'w': [{'v': True}]})
+        self.assertRoundTrip({'w': [{'v': False}]}, {'w': [{'v': 0}]})
+
+    def test_nested_int_float(self):
+        self.assertRoundTrip({'cfg': 7}, {'cfg': 7.0})
+        self.assertRoundTrip({'nodes': [[1, 2.0], 3]}, {'nodes': [[1, 2], 3]})
+
+    def test_list_prefix_and_suffix(self):
+        self.assertRoundTrip([1, 2, 3], [True, 2, 3])
+        self.assertRoundTrip([1, 2, 3], [1, 2, 3.0])
+
+    def test_dict_insert_in_middle(self):
+        self.assertRoundTrip({'a': 1, 'c': 3}, {'a': 1, 'b': 2, 'c': 3})
+        self.assertRoundTrip({'w': [{'x': 1, 'z': 3}]}, {'w': [{'x': 1, 'y': 2, 'z': 3}]})
+
+    def test_dict_reorder(self):
+        self.assertRoundTrip({'a': 1, 'b': 2}, {'b': 2, 'a': 1})
+        self.assertRoundTrip({'n': {'a': [1], 'b': [2]}, 'm': 0}, {'n': {'b': [2], 'a': [1]}, 'm': 0})
+
+    def test_dict_append_stays_small(self):
+        ops = make_patch({'a': {'big': 'x' * 100}}, {'a': {'big': 'x' * 100}, 'b': 1})
+        self.assertEqual(ops, [{'op': 'add', 'path': '/b', 'value': 1}])
+
+    def test_equal_values(self):
+        self.assertEqual(make_patch({'a': [1, {'b': True}]}, {'a': [1, {'b': True}]}), [])
+
+
+class PresetHistoryTest(unittest.TestCase):
+    def test_delta_revision_matches_sha256(self):
+        with tempfile.TemporaryDirectory() as presets_dir:
+            history = PresetHistory(presets_dir, 'demo')
+            first = {'title': 'demo', 'content': {'w': [{'v': 1}], 'cfg': 7, 'pad': 'x' * 200}}
+            second = copy.deepcopy(first)
+            second['content']['w'][0]['v'] = True
+            second['content']['cfg'] = 7.0
+            history.record(first)
+            entry = history.record(second, previous=first)
+            self.assertEqual(entry['kind'], 'delta')
+            restored = _encode(history.get(entry['revision']))
+            self.assertEqual(hashlib.sha256(restored).hexdigest(), entry['sha256'])
+
+    def test_delta_revision_keeps_key_order(self):
+        with tempfile.TemporaryDirectory() as presets_dir:
+            history = PresetHistory(presets_dir, 'demo')
+            first = {'title': 'demo', 'content': {'a': 1, 'c': 3, 'pad': 'x' * 200}}
+            second = {'title': 'demo', 'content': {'a': 1, 'b': 2, 'c': 3, 'pad': 'x' * 200}}
+            third = {'title': 'demo', 'content': {'pad': 'x' * 200, 'c': 3, 'b': 2, 'a': 1}}
+            history.record(first)
+            entries = [history.record(second, previous=first), history.record(third, previous=second)]
+            for entry, expected in zip(entries, (second, third)):
+                restored = _encode(history.get(entry['revision']))
+                self.assertEqual(restored, _encode(expected))
+                self.assertEqual(hashlib.sha256(restored).hexdigest(), entry['sha256'])
+
+
+if __name__ == '__main__':
+    unittest.main()
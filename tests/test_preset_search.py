@@ -0,0 +1,59 @@
+import unittest
+
+from _package import load_module
+
+preset_search = load_module('preset_search')
+
+
+def record(name, mtime_ns):
+    return {'mtime_ns': mtime_ns, 'size': 100, 'summary': {'name': name}}
+
+
+class QueryTermsTest(unittest.TestCase):
+    def test_only_last_word_is_prefix(self):
+        self.assertEqual(preset_search._query_terms('port light'), [('port', False), ('light', True)])
+
+    def test_short_or_cjk_last_term_is_exact(self):
+        self.assertEqual(preset_search._query_terms('port l'), [('port', False), ('l', False)])
+        self.assertEqual(preset_search._query_terms('port 人像'), [('port', False), ('人像', False)])
+
+    def test_repeated_word_as_last_term(self):
+        self.assertEqual(preset_search._query_terms('ab cd ab'), [('ab', True), ('cd', False)])
+
+
+class PresetSearchTest(unittest.TestCase):
+    def setUp(self):
+        self.index = preset_search.PresetSearchIndex()
+        self.index.update('a.json', {'title': 'Portrait lighting'}, record('a', 1))
+        self.index.update('b.json', {'title': 'Port harbor'}, record('b', 2))
+        self.index.update('c.json', {'title': '人像光影'}, record('c', 3))
+
+    def names(self, query):
+        total, results = self.index.search(query)
+        self.assertEqual(total, len(results))
+        return [result['name'] for result in results]
+
+    def test_prefix_on_last_term(self):
+        # 完整命中的得分高于前缀命中
+        self.assertEqual(self.names('port'), ['b', 'a'])
+        self.assertEqual(self.names('portr'), ['a'])
+        self.assertEqual(self.names('lighting port'), ['a'])
+
+    def test_no_prefix_on_earlier_terms(self):
+        self.assertEqual(self.names('portr lighting'), [])
+        self.assertEqual(self.names('port lighting'), [])
+
+    def test_single_character_is_not_prefix(self):
+        self.assertEqual(self.names('p'), [])
+
+    def test_cjk(self):
+        self.assertEqual(self.names('人像'), ['c'])
+        self.assertEqual(self.names('光'), ['c'])
+        self.assertEqual(self.names('像光影'), ['c'])
+
+    def test_empty_query_orders_by_mtime(self):
+        self.assertEqual(self.names(''), ['c', 'b', 'a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
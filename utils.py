@@ -1,32 +1,569 @@
+import base64
 import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
 import folder_paths
 import json
 
+try:
+    import fcntl
+except ImportError:
+    # Windows 上没有 fcntl，只能保证进程内的写入互斥
+    fcntl = None
+
+from .config_backend import (
+    BACKEND_ENV, JsonConfigBackend, SqliteConfigBackend, migrate_json_to_sqlite, write_json_atomic,
+)
+
 def get_config_path():
     comfyui_root_path = folder_paths.base_path
     return os.path.join(comfyui_root_path, 'env_config.json')
 
+
+def get_config_db_path():
+    """SQLite 后端的数据库文件（与 env_config.json 位于同一目录）"""
+    return os.path.join(folder_paths.base_path, 'env_config.sqlite')
+
+
+_backend = None
+
+
+def get_config_backend():
+    """
+    获取配置存储后端（首次调用时根据环境变量 REI_CONFIG_BACKEND 创建）
+    使用 SQLite 后端时，首次启动会将已有的 env_config.json 迁移到数据库中
+    """
+    global _backend
+    if _backend is None:
+        # 在写锁内创建，迁移不会与其他进程的写入交错
+        with config_write_lock():
+            if _backend is None:
+                json_backend = JsonConfigBackend(get_config_path())
+                if os.environ.get(BACKEND_ENV, 'json').lower() == 'sqlite':
+                    backend = SqliteConfigBackend(get_config_db_path())
+                    migrate_json_to_sqlite(json_backend, backend)
+                else:
+                    backend = json_backend
+                _backend = backend
+    return _backend
+
+
+class FrozenDict(dict):
+    """只读字典，用于在多个调用方之间共享配置快照"""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("配置快照是只读的，请使用 load_config() 获取可修改的副本")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def _freeze_value(value):
+    return FrozenDict(value) if isinstance(value, dict) else value
+
+
+def _freeze(data):
+    return FrozenDict((key, _freeze_value(value)) for key, value in data.items())
+
+
+class ConfigStore:
+    """
+    进程内的配置缓存
+    将解析后的配置保存在内存中，只有存储后端的签名变化时才重新读取
+    （JSON 后端为文件的 (mtime_ns, size, inode)，SQLite 后端为写入计数）
+
+    每次内容变化时递增版本号，并记录每个键最后一次变化时的版本以及被删除键的版本，
+    用于 changes_since 增量同步。版本号以进程启动时的毫秒时间戳为起点，
+    重启后的版本号仍大于重启前的版本号。
+    """
+
+    # 最多保留的删除记录数量，更早的删除无法增量同步，会返回完整配置
+    MAX_TOMBSTONES = 1000
+
+    # 按类型/加密状态查询键时，两次检查存储后端签名的最小间隔（秒）
+    INDEX_RECHECK_SECONDS = 1.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._signature = None
+        self._snapshot = FrozenDict()
+        self._version = time.time_ns() // 1_000_000
+        # 早于该版本的增量无法计算
+        self._base_version = self._version
+        self._key_versions = {}
+        self._tombstones = OrderedDict()
+        self._listeners = []
+        # 二级索引：类型 -> {键: None}，加密状态 -> {键: None}（dict 作为有序集合），
+        # 以及每个键当前所在的 (类型, 加密状态)
+        self._type_index = {}
+        self._encrypted_index = {True: {}, False: {}}
+        self._index_entries = {}
+        # 上次检查后端签名的时间（time.monotonic），None 表示从未读取
+        self._checked_at = None
+
+    def _install(self, snapshot, signature, changed=None, deleted=None):
+        """
+        替换当前快照，内容有变化时递增版本号（调用方需持有锁）
+        changed/deleted 为已知的变化键，未提供时与旧快照逐键比较
+        """
+        old = self._snapshot
+        self._signature = signature
+        self._snapshot = snapshot
+        if changed is None:
+            changed = [key for key, value in snapshot.items() if key not in old or old[key] != value]
+            deleted = [key for key in old if key not in snapshot]
+        if not changed and not deleted:
+            return
+        self._update_indexes(snapshot, changed, deleted)
+        self._version += 1
+        for key in changed:
+            self._key_versions[key] = self._version
+            self._tombstones.pop(key, None)
+        for key in deleted:
+            self._key_versions.pop(key, None)
+            self._tombstones.pop(key, None)
+            self._tombstones[key] = self._version
+        while len(self._tombstones) > self.MAX_TOMBSTONES:
+            _, dropped_version = self._tombstones.popitem(last=False)
+            self._base_version = max(self._base_version, dropped_version)
+        for listener in self._listeners:
+            try:
+                listener(self._version - 1, self._version, {key: snapshot[key] for key in changed}, deleted)
+            except Exception as e:
+                print(f"[ConfigManager] 配置变更回调失败: {e}")
+
+    @staticmethod
+    def _index_key(config_obj):
+        """配置项在二级索引中的 (类型, 加密状态)，旧格式视为未加密的 string"""
+        if isinstance(config_obj, dict):
+            return config_obj.get('type', 'string'), bool(config_obj.get('encrypted', False))
+        return 'string', False
+
+    def _update_indexes(self, snapshot, changed, deleted):
+        """增量更新二级索引，只处理变化和删除的键（调用方需持有锁）"""
+        for key in deleted:
+            entry = self._index_entries.pop(key, None)
+            if entry is not None:
+                self._remove_from_indexes(key, entry)
+        for key in changed:
+            entry = self._index_key(snapshot[key])
+            old_entry = self._index_entries.get(key)
+            if old_entry == entry:
+                continue
+            if old_entry is not None:
+                self._remove_from_indexes(key, old_entry)
+            self._index_entries[key] = entry
+            self._type_index.setdefault(entry[0], {})[key] = None
+            self._encrypted_index[entry[1]][key] = None
+
+    def _remove_from_indexes(self, key, entry):
+        config_type, encrypted = entry
+        bucket = self._type_index.get(config_type)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._type_index[config_type]
+        self._encrypted_index[encrypted].pop(key, None)
+
+    def _refresh(self, backend):
+        """存储内容变化时重新读取（调用方需持有锁），返回是否读取成功"""
+        self._checked_at = time.monotonic()
+        signature = backend.signature()
+        if signature == self._signature:
+            return True
+        try:
+            config_data = backend.read_all()
+        except ValueError:
+            print(f"[ConfigManager] 警告: {backend.path} 文件格式错误，无法解析。")
+            # 不记录签名，下次读取时重试
+            return False
+        self._install(_freeze(config_data), signature)
+        return True
+
+    def snapshot(self, strict=False):
+        """
+        返回当前配置的只读快照（文件未变化时不会重新读取）
+        文件格式错误时返回空配置；strict 为 True 时抛出 ValueError
+        """
+        # 后端需要在持有内部锁之前获取：首次创建后端时会加写锁，锁的顺序必须是先写锁后内部锁
+        backend = get_config_backend()
+        with self._lock:
+            if not self._refresh(backend):
+                if strict:
+                    raise ValueError(f"{backend.path} 文件格式错误，无法解析")
+                return FrozenDict()
+            return self._snapshot
+
+    def changes_since(self, since=None):
+        """
+        返回自 since 版本以来的变化
+
+        Returns:
+            (version, full, changed, deleted)：full 为 True 时 changed 是完整配置
+            （since 为空、早于可增量同步的范围或来自未来时），否则只包含变化的键；
+            deleted 为被删除的键列表
+        """
+        backend = get_config_backend()
+        with self._lock:
+            self._refresh(backend)
+            version = self._version
+            if since is None or since < self._base_version or since > version:
+                return version, True, self._snapshot, []
+            changed = {
+                key: self._snapshot[key]
+                for key, key_version in self._key_versions.items()
+                if key_version > since
+            }
+            deleted = [key for key, key_version in self._tombstones.items() if key_version > since]
+            return version, False, changed, deleted
+
+    def keys(self, config_type=None, encrypted=None):
+        """
+        返回配置键列表，可按类型和加密状态过滤
+
+        结果来自增量维护的二级索引，耗时只与结果数量有关。节点的 INPUT_TYPES 在每次
+        /object_info 请求时都会调用，因此这里不会每次都访问存储：距上次检查不足
+        INDEX_RECHECK_SECONDS 时直接使用内存中的索引，之后才重新检查后端签名
+        （用于发现其他进程或手动编辑带来的变化）。
+        """
+        with self._lock:
+            checked_at = self._checked_at
+        if checked_at is None or time.monotonic() - checked_at >= self.INDEX_RECHECK_SECONDS:
+            backend = get_config_backend()
+            with self._lock:
+                self._refresh(backend)
+        with self._lock:
+            if config_type is None and encrypted is None:
+                return list(self._snapshot)
+            if config_type is None:
+                return list(self._encrypted_index[bool(encrypted)])
+            bucket = self._type_index.get(config_type, {})
+            if encrypted is None:
+                return list(bucket)
+            # 在两个索引中较小的一个上过滤
+            flagged = self._encrypted_index[bool(encrypted)]
+            small, large = (bucket, flagged) if len(bucket) <= len(flagged) else (flagged, bucket)
+            return [key for key in small if key in large]
+
+    def add_listener(self, listener):
+        """
+        注册配置变更回调 listener(since, version, changed, deleted)
+        changed 为变化键的 {键: 配置项}，deleted 为被删除的键列表。
+        回调在持有内部锁时调用，不能再访问 ConfigStore，且应尽快返回
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def get_entries(self, keys):
+        """
+        读取指定键的配置项（只读）
+        缓存有效时直接从内存返回；缓存已过期且后端支持按键读取（SQLite）时
+        只读取这些键对应的行，而不是重新加载整个配置
+        """
+        backend = get_config_backend()
+        with self._lock:
+            if backend.signature() == self._signature:
+                return {key: self._snapshot[key] for key in keys if key in self._snapshot}
+        if backend.point_reads:
+            return {key: _freeze_value(value) for key, value in backend.read_keys(keys).items()}
+        snapshot = self.snapshot()
+        return {key: snapshot[key] for key in keys if key in snapshot}
+
+    def apply_changes(self, changed, deleted):
+        """
+        写入后在当前快照上应用变化，避免下次读取时重新加载
+        只复制快照字典本身，不会重新冻结或比较未变化的配置项
+
+        Args:
+            changed: {键: 新的配置项}
+            deleted: 被删除的键列表
+        """
+        backend = get_config_backend()
+        with self._lock:
+            snapshot = FrozenDict(self._snapshot)
+            for key, value in changed.items():
+                dict.__setitem__(snapshot, key, _freeze_value(value))
+            for key in deleted:
+                dict.__delitem__(snapshot, key)
+            self._install(snapshot, backend.signature(), list(changed), list(deleted))
+
+
+_config_store = ConfigStore()
+
+
+def get_config_snapshot():
+    """获取配置的只读快照，适合只读取配置的调用方"""
+    return _config_store.snapshot()
+
+
+def get_config_entries(keys):
+    """按键读取配置项，返回 {键: 配置项}（只读，不存在的键不出现在结果中）"""
+    return _config_store.get_entries(keys)
+
+
+def get_config_keys(config_type=None, encrypted=None):
+    """
+    获取配置键列表，可按类型（如 "3KeyGroup"）和加密状态过滤，见 ConfigStore.keys
+    适合节点下拉列表等频繁调用、只需要键名的场景
+    """
+    return _config_store.keys(config_type, encrypted)
+
+
+def add_config_listener(listener):
+    """注册配置变更回调，见 ConfigStore.add_listener"""
+    _config_store.add_listener(listener)
+
+
+def get_config_changes(since=None):
+    """获取自 since 版本以来的配置变化，见 ConfigStore.changes_since"""
+    return _config_store.changes_since(since)
+
+
 def load_config():
-    """加载 JSON 配置文件"""
-    config_path = get_config_path()
-    config_data = {}
-    if not os.path.exists(config_path):
-        return config_data # 文件不存在，返回空字典
-    
-    try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
-    except json.JSONDecodeError:
-        print(f"[ConfigManager] 警告: {config_path} 文件格式错误，无法解析。")
-    return config_data
-
-def save_config(data):
-    """将数据写入 JSON 配置文件"""
-    config_path = get_config_path()
+    """加载配置（返回可修改的副本）"""
+    snapshot = _config_store.snapshot()
+    return {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in snapshot.items()
+    }
+
+
+class ConfigConflict(Exception):
+    """配置项的版本与客户端预期的不一致（已被其他请求或进程修改）"""
+
+    def __init__(self, key, expected_revision, current_revision):
+        super().__init__(
+            f"配置键 '{key}' 已被修改（预期版本 {expected_revision}，当前版本 {current_revision}）")
+        self.key = key
+        self.expected_revision = expected_revision
+        self.current_revision = current_revision
+
+
+def get_config_revision(config_obj):
+    """
+    返回配置项的修改版本号
+    不存在的键为 0，没有记录版本号的旧配置项视为 1
+    """
+    if config_obj is None:
+        return 0
+    if isinstance(config_obj, dict):
+        return config_obj.get("revision", 1)
+    return 1
+
+
+def build_config_entry(converted_value, value_type, is_encrypted, previous=None):
+    """
+    构建配置项对象（新的对象结构）
+    previous 为被覆盖的原配置项，用于保留创建时间并递增修改版本号
+    """
+    now = datetime.now().isoformat()
+    created_at = previous.get("created_at", now) if isinstance(previous, dict) else now
+    return {
+        "value": converted_value,
+        "type": value_type,
+        "encrypted": is_encrypted,
+        "revision": get_config_revision(previous) + 1,
+        "created_at": created_at,
+        "updated_at": now
+    }
+
+
+def check_config_revision(key, config_obj, expected_revision):
+    """expected_revision 不为 None 且与当前版本不一致时抛出 ConfigConflict"""
+    if expected_revision is None:
+        return
+    current_revision = get_config_revision(config_obj)
+    if current_revision != expected_revision:
+        raise ConfigConflict(key, expected_revision, current_revision)
+
+
+_write_lock = threading.RLock()
+_write_lock_depth = 0
+
+
+@contextmanager
+def config_write_lock():
+    """
+    配置文件的写锁（可重入）
+    进程内使用线程锁，进程间对 env_config.json.lock 加 fcntl.flock 排他锁。
+    锁加在单独的文件上，因为配置文件本身每次写入都会被替换。
+    读取方不需要加锁：写入通过原子替换完成，不会读到写了一半的文件。
+    """
+    global _write_lock_depth
+    with _write_lock:
+        if _write_lock_depth or fcntl is None:
+            _write_lock_depth += 1
+            try:
+                yield
+            finally:
+                _write_lock_depth -= 1
+            return
+        with open(get_config_path() + '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            _write_lock_depth += 1
+            try:
+                yield
+            finally:
+                _write_lock_depth -= 1
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _write_changes(data, changed, deleted):
+    """写入存储后端并更新缓存（调用方需持有写锁）"""
+    get_config_backend().write(data, changed, deleted)
+    _config_store.apply_changes({key: data[key] for key in changed}, deleted)
+
+
+class _ConfigDraft(dict):
+    """
+    modify_config 传给修改函数的配置副本
+    配置项在首次通过 [] 或 get() 读取时才复制为可修改的字典，并记录可能变化的键，
+    写回时只需比较这些键。通过 items()/values() 遍历得到的配置项是只读的。
+    """
+
+    def __init__(self, snapshot):
+        super().__init__(snapshot)
+        self.touched = set()
+
+    def _thaw(self, key):
+        value = dict.__getitem__(self, key)
+        if isinstance(value, FrozenDict):
+            value = dict(value)
+            dict.__setitem__(self, key, value)
+        self.touched.add(key)
+        return value
+
+    def __getitem__(self, key):
+        return self._thaw(key)
+
+    def get(self, key, default=None):
+        return self._thaw(key) if key in self else default
+
+    def __setitem__(self, key, value):
+        self.touched.add(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self.touched.add(key)
+        dict.__delitem__(self, key)
+
+    def pop(self, key, *default):
+        self.touched.add(key)
+        return dict.pop(self, key, *default)
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self._thaw(key)
+        self[key] = default
+        return default
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        self.touched.update(self)
+        dict.clear(self)
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        self.touched.add(key)
+        return key, value
+
+
+def modify_config(mutate):
+    """
+    在写锁内读取最新的配置，调用 mutate(configs) 修改后写回
+
+    读取发生在加锁之后，其他进程在此之前写入的内容不会被覆盖。
+    只比较和写入被修改的键，配置内容没有变化时不写入。
+
+    Args:
+        mutate: 修改函数，接收可修改的配置字典，返回值原样返回；
+            抛出异常时不写入任何修改
+
+    Raises:
+        ValueError: 配置文件格式错误时抛出（避免用空配置覆盖原文件）
+        IOError: 配置写入失败时抛出
+    """
+    with config_write_lock():
+        original = _config_store.snapshot(strict=True)
+        configs = _ConfigDraft(original)
+        result = mutate(configs)
+        changed = [
+            key for key in configs.touched
+            if key in configs and (key not in original or original[key] != dict.__getitem__(configs, key))
+        ]
+        deleted = [key for key in configs.touched if key not in configs and key in original]
+        if changed or deleted:
+            try:
+                _write_changes(configs, changed, deleted)
+            except (IOError, sqlite3.Error) as e:
+                print(f"[ConfigManager] 错误: 无法写入配置 {get_config_backend().path}。错误信息: {e}")
+                raise IOError("无法写入配置文件") from e
+        return result
+
+
+# 新建保险库时 KDF 的目标耗时（秒）
+VAULT_KDF_TARGET_SECONDS = 0.25
+
+def get_vault_path():
+    """保险库参数文件（与 env_config.json 位于同一目录）"""
+    return os.path.join(folder_paths.base_path, 'env_config.vault.json')
+
+
+def _read_vault_params(vault_path):
+    """读取保险库参数文件，不存在或内容无效时返回 None"""
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            # indent=4 让 JSON 文件格式化，易于阅读
-            # ensure_ascii=False 确保中文字符能正确写入
-            json.dump(data, f, indent=4, ensure_ascii=False)
-    except IOError as e:
-        print(f"[ConfigManager] 错误: 无法写入配置文件 {config_path}。错误信息: {e}")
\ No newline at end of file
+        with open(vault_path, 'r', encoding='utf-8') as f:
+            params = json.load(f)
+        if params.get('version') == 2 and params.get('salt') and params.get('iterations'):
+            return params
+        print(f"[ConfigManager] 警告: {vault_path} 内容无效，将重新生成。")
+    except FileNotFoundError:
+        pass
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"[ConfigManager] 警告: 无法读取 {vault_path}: {e}")
+    return None
+
+
+def get_vault_params():
+    """
+    获取保险库级别的加密参数，不存在时生成并保存
+
+    同一保险库中的加密值共用一个盐，一次密钥派生即可解密所有值。
+    迭代次数在首次生成时根据本机速度校准。
+
+    Returns:
+        {"version": 2, "kdf": "PBKDF2-SHA256", "salt": base64 字符串, "iterations": int}
+    """
+    vault_path = get_vault_path()
+    params = _read_vault_params(vault_path)
+    if params is not None:
+        return params
+
+    # 生成时与配置写入共用跨进程写锁，避免多个进程各自生成不同的盐
+    with config_write_lock():
+        params = _read_vault_params(vault_path)
+        if params is not None:
+            return params
+
+        from .crypto_utils import calibrate_iterations
+        params = {
+            "version": 2,
+            "kdf": "PBKDF2-SHA256",
+            "salt": base64.b64encode(os.urandom(16)).decode('ascii'),
+            "iterations": calibrate_iterations(VAULT_KDF_TARGET_SECONDS),
+        }
+        write_json_atomic(vault_path, params, indent=4)
+        return params